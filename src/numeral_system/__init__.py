@@ -1,10 +1,15 @@
 """
 Package which contains function for converting between different number system
 """
-from . import exceptions, positional, roman
+from . import backends, exceptions, instrumentation, positional, roman
+from ._stream import ErrorMarker, Failure
 
 __all__ = [
+    "ErrorMarker",
+    "Failure",
+    "backends",
     "exceptions",
+    "instrumentation",
     "positional",
     "roman",
 ]
@@ -0,0 +1,377 @@
+"""
+Helpers for lazy conversion of streams of numbers
+"""
+import os
+from array import array
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from .exceptions import ERROR_CLASSES, NumericSystemException, WrongArgumentValueError
+
+# Amount of characters which are read from file at once
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+# Amount of items which are sent to worker process at once
+DEFAULT_BATCH_SIZE = 10000
+
+# Allowed policies of handling invalid items
+ERROR_POLICIES = ("raise", "skip", "marker")
+
+# Allowed forms of result of batch validation
+VALIDATION_RESULTS = ("offsets", "mask")
+
+
+class ErrorMarker(namedtuple("ErrorMarker", ("index", "value", "error"))):
+    """
+    Yielded instead of result for invalid item when error policy is "marker"
+
+    :ivar index: position of item in input stream
+    :ivar value: item which can't be converted
+    :ivar error: exception which was raised during conversion
+    """
+
+    __slots__ = ()
+
+
+class Failure(namedtuple("Failure", ("code", "value", "convert"))):
+    """
+    Returned by non-raising conversion instead of result for invalid item
+
+    Exception and its message are created only when they are requested.
+
+    :ivar code: code of error, see numeral_system.exceptions.ERROR_CLASSES
+    :ivar value: item which can't be converted
+    :ivar convert: raising conversion of item
+    """
+
+    __slots__ = ()
+
+    @property
+    def error_class(self):
+        """
+        :return: class of exception which conversion raises
+        :rtype: type
+        """
+        return ERROR_CLASSES[self.code]
+
+    def exception(self):
+        """
+        Get exception which conversion raises
+
+        :return: exception with formatted message
+        :rtype: numeral_system.exceptions.NumericSystemException
+        """
+        try:
+            self.convert(self.value)
+        except NumericSystemException as e:
+            return e
+
+        return self.error_class()
+
+    def message(self):
+        """
+        Get message of exception which conversion raises
+
+        :return: message
+        :rtype: str
+        """
+        return str(self.exception())
+
+
+def check_error_policy(errors):
+    """
+    Check that error policy is supported
+
+    :param errors: "raise", "skip" or "marker"
+    :type errors: str
+    """
+    if errors not in ERROR_POLICIES:
+        raise WrongArgumentValueError(
+            "Error policy should be one of {}, not {}".format(ERROR_POLICIES, errors)
+        )
+
+
+def check_validation_result(result):
+    """
+    Check that form of validation result is supported
+
+    :param result: "offsets" or "mask"
+    :type result: str
+    """
+    if result not in VALIDATION_RESULTS:
+        raise WrongArgumentValueError(
+            "Validation result should be one of {}, not {}".format(
+                VALIDATION_RESULTS, result
+            )
+        )
+
+
+def validate_items(first_invalid, items, result):
+    """
+    Validate items and pack results
+
+    :param first_invalid: function which returns offset of the first invalid
+        character of item or -1 if item is valid
+    :type first_invalid: callable
+
+    :param items: items to validate
+    :type items: collections.Iterable
+
+    :param result: "offsets" to get array of offsets, "mask" to get integer
+        where bit i is set if i-th item is valid
+    :type result: str
+
+    :return: offsets or bit mask
+    :rtype: array.array | int
+    """
+    offsets = array("q", map(first_invalid, items))
+    if result == "offsets":
+        return offsets
+
+    # builtin conversion from binary string is linear
+    bits = "".join("1" if offset < 0 else "0" for offset in reversed(offsets))
+    return int(bits or "0", 2)
+
+
+def try_item(error_code, convert, item):
+    """
+    Convert item if it is valid
+
+    :param error_code: function which returns code of error which conversion of
+        item raises or 0 if it doesn't raise
+    :type error_code: callable
+
+    :param convert: raising conversion of item
+    :type convert: callable
+
+    :param item: item to convert
+    :type item: object
+
+    :return: result of conversion or Failure
+    :rtype: object | Failure
+    """
+    code = error_code(item)
+    if code:
+        return Failure(code, item, convert)
+
+    return convert(item)
+
+
+def try_items(error_code, convert, items):
+    """
+    Convert valid items and collect codes of errors of the rest
+
+    :param error_code: function which returns code of error which conversion of
+        item raises or 0 if it doesn't raise
+    :type error_code: callable
+
+    :param convert: raising conversion of item
+    :type convert: callable
+
+    :param items: items to convert
+    :type items: collections.Iterable
+
+    :return: results with None for invalid items, and codes of errors where 0
+        means success
+    :rtype: (list, array.array)
+    """
+    items = list(items)
+    codes = array("b", map(error_code, items))
+    results = [None if code else convert(item) for code, item in zip(codes, items)]
+    return results, codes
+
+
+def is_text_file(source):
+    """
+    Check if source should be read as text file
+
+    :param source: iterable or file object
+    :type source: object
+
+    :return: True for file objects
+    :rtype: bool
+    """
+    return hasattr(source, "read")
+
+
+def iter_lines(stream, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Read non-empty stripped lines from text file by chunks
+
+    :param stream: text file object
+    :type stream: io.TextIOBase
+
+    :param chunk_size: amount of characters which are read at once
+    :type chunk_size: int
+
+    :return: generator of lines
+    :rtype: collections.Iterator[str]
+    """
+    rest = ""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+
+        lines = (rest + chunk).split("\n")
+        rest = lines.pop()
+        for line in lines:
+            line = line.strip()
+            if line:
+                yield line
+
+    rest = rest.strip()
+    if rest:
+        yield rest
+
+
+def iter_convert(function, items, errors="raise"):
+    """
+    Lazily apply conversion function to every item according to error policy
+
+    :param function: conversion function
+    :type function: callable
+
+    :param items: items to convert
+    :type items: collections.Iterable
+
+    :param errors: "raise" to propagate exception, "skip" to drop invalid item,
+        "marker" to yield ErrorMarker instead of result
+    :type errors: str
+
+    :return: generator of converted items
+    :rtype: collections.Iterator
+    """
+    for index, item in enumerate(items):
+        try:
+            result = function(item)
+        except NumericSystemException as e:
+            if errors == "raise":
+                raise
+            if errors == "marker":
+                yield ErrorMarker(index, item, e)
+            continue
+
+        yield result
+
+
+def iter_chunks(items, chunk_size):
+    """
+    Split iterable into lists of given size
+
+    :param items: items to split
+    :type items: collections.Iterable
+
+    :param chunk_size: amount of items in chunk
+    :type chunk_size: int
+
+    :return: generator of chunks
+    :rtype: collections.Iterator[list]
+    """
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def check_batch_arguments(workers, executor, chunk_size):
+    """
+    Check arguments of batch conversion
+
+    :param workers: amount of worker processes
+    :type workers: int | None
+
+    :param executor: executor to use instead of own process pool
+    :type executor: concurrent.futures.Executor | None
+
+    :param chunk_size: amount of items which are sent to worker at once
+    :type chunk_size: int
+    """
+    if workers is not None and executor is not None:
+        raise WrongArgumentValueError("Only one of workers and executor can be given")
+
+    if workers is not None and workers < 1:
+        raise WrongArgumentValueError(
+            "Amount of workers should be positive, not {}".format(workers)
+        )
+
+    if chunk_size < 1:
+        raise WrongArgumentValueError(
+            "Chunk size should be positive, not {}".format(chunk_size)
+        )
+
+
+def map_chunks(
+    function,
+    items,
+    chunk_size=DEFAULT_BATCH_SIZE,
+    workers=None,
+    executor=None,
+    initializer=None,
+    initargs=(),
+):
+    """
+    Apply function to chunks of items in worker processes and yield results in order
+
+    Only limited amount of chunks is submitted ahead of consumer, so memory stays
+    bounded for infinite input. Without workers and executor chunks are converted
+    in current process.
+
+    :param function: picklable function which converts list of items to list
+    :type function: callable
+
+    :param items: items to convert
+    :type items: collections.Iterable
+
+    :param chunk_size: amount of items which are sent to worker at once
+    :type chunk_size: int
+
+    :param workers: amount of worker processes of own process pool
+    :type workers: int | None
+
+    :param executor: executor to use instead of own process pool
+    :type executor: concurrent.futures.Executor | None
+
+    :param initializer: function which prepares each worker of own process pool
+    :type initializer: callable | None
+
+    :param initargs: arguments of initializer
+    :type initargs: tuple
+
+    :return: generator of converted items
+    :rtype: collections.Iterator
+    """
+    chunks = iter_chunks(items, chunk_size)
+    if workers is None and executor is None:
+        for chunk in chunks:
+            for result in function(chunk):
+                yield result
+        return
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(
+            workers, initializer=initializer, initargs=initargs
+        )
+
+    max_pending = 2 * (workers or os.cpu_count() or 1)
+    pending = deque()
+    try:
+        for chunk in chunks:
+            pending.append(executor.submit(function, chunk))
+            if len(pending) >= max_pending:
+                for result in pending.popleft().result():
+                    yield result
+
+        while pending:
+            for result in pending.popleft().result():
+                yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        if own_executor:
+            executor.shutdown()
@@ -0,0 +1,233 @@
+"""
+Arithmetic backends of conversion of big numbers
+
+Positional conversion of big numbers is done by pure Python engine on top of
+builtin ``int``. When an accelerated backend is selected, numbers longer than
+split thresholds are converted by it instead, if it supports base and alphabet of
+codec. Alphabet is supported when it consists of single characters, which are
+translated to and from canonical digits of backend.
+
+The ``gmpy2`` backend is selected automatically when gmpy2 is installed:
+
+.. code:: python
+
+    >>> from numeral_system import backends
+    >>> backends.available()
+    ['python', 'gmpy2']
+    >>> backends.select("python")
+    >>> backends.current()
+    'python'
+
+Set NUMERAL_SYSTEM_BACKEND environment variable to the name of backend to force
+it at import time, ``auto`` is the default.
+"""
+import os
+import warnings
+from abc import ABC, abstractmethod
+
+from .exceptions import WrongArgumentValueError
+
+AUTO = "auto"
+PYTHON = "python"
+GMPY2 = "gmpy2"
+
+# Selected accelerated backend, None means pure Python engine.
+# Read only, use select function to change it
+active = None
+
+# name -> function without arguments returning backend or raising ImportError
+_LOADERS = {}
+# name -> loaded backend
+_LOADED = {}
+
+_LOWER_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+_MIXED_DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+
+
+class Backend(ABC):
+    """
+    Converter of non-negative numbers to and from canonical digits
+
+    Subclasses implement encode, decode and digits, and set name and max_base.
+    """
+
+    name = None
+    max_base = 0
+
+    @abstractmethod
+    def digits(self, base):
+        """
+        Get canonical digits of base
+
+        :param base: base of numeral system, not greater than max_base
+        :type base: int
+
+        :return: digits from zero to base - 1
+        :rtype: str
+        """
+
+    @abstractmethod
+    def encode(self, number, base):
+        """
+        Convert non-negative number to canonical digits
+
+        :param number: non-negative number
+        :type number: int
+
+        :param base: base of numeral system
+        :type base: int
+
+        :return: converted number without leading zeros
+        :rtype: str
+        """
+
+    @abstractmethod
+    def decode(self, digits, base):
+        """
+        Convert valid canonical digits to number
+
+        :param digits: digits from the most significant to the least one
+        :type digits: str
+
+        :param base: base of numeral system
+        :type base: int
+
+        :return: converted number
+        :rtype: int
+        """
+
+
+class Gmpy2Backend(Backend):
+    """
+    Conversion by GMP through gmpy2 module
+    """
+
+    name = GMPY2
+    max_base = 62
+
+    def __init__(self, gmpy2):
+        """
+        :param gmpy2: gmpy2 module
+        :type gmpy2: module
+        """
+        self._mpz = gmpy2.mpz
+
+    def digits(self, base):
+        # mpz.digits() writes lower case digits up to base 36
+        return (_LOWER_DIGITS if base <= 36 else _MIXED_DIGITS)[0:base]
+
+    def encode(self, number, base):
+        return self._mpz(number).digits(base)
+
+    def decode(self, digits, base):
+        return int(self._mpz(digits, base))
+
+
+def _load_gmpy2():
+    """
+    Import optional gmpy2 dependency
+
+    :return: gmpy2 backend
+    :rtype: Gmpy2Backend
+    """
+    import gmpy2  # pylint: disable=import-outside-toplevel
+
+    return Gmpy2Backend(gmpy2)
+
+
+def register(name, loader):
+    """
+    Register accelerated backend
+
+    :param name: name of backend
+    :type name: str
+
+    :param loader: function without arguments which returns Backend or raises
+        ImportError if backend is not installed
+    :type loader: callable
+    """
+    if name in (AUTO, PYTHON):
+        raise WrongArgumentValueError("Name {!r} is reserved".format(name))
+
+    _LOADERS[name] = loader
+    _LOADED.pop(name, None)
+
+
+def _load(name):
+    """
+    Load registered backend
+
+    :param name: name of backend
+    :type name: str
+
+    :return: backend or None if it is not installed
+    :rtype: Backend | None
+    """
+    if name not in _LOADED:
+        try:
+            _LOADED[name] = _LOADERS[name]()
+        except ImportError:
+            _LOADED[name] = None
+
+    return _LOADED[name]
+
+
+def available():
+    """
+    Get names of backends which can be selected
+
+    :return: names of backends, pure Python engine is the first one
+    :rtype: list[str]
+    """
+    return [PYTHON] + [name for name in _LOADERS if _load(name) is not None]
+
+
+def current():
+    """
+    Get name of selected backend
+
+    :return: name of backend
+    :rtype: str
+    """
+    return PYTHON if active is None else active.name
+
+
+def select(name=AUTO):
+    """
+    Select backend of conversion of big numbers
+
+    :param name: name of backend, "python" for pure Python engine or "auto" for
+        the first installed accelerated backend
+    :type name: str
+    """
+    global active  # pylint: disable=global-statement
+
+    if name == PYTHON:
+        active = None
+        return
+
+    if name == AUTO:
+        active = next(
+            (_load(other) for other in _LOADERS if _load(other) is not None), None
+        )
+        return
+
+    if name not in _LOADERS:
+        raise WrongArgumentValueError(
+            "Unknown backend {!r}, expected one of: {}".format(
+                name, ", ".join([AUTO, PYTHON] + list(_LOADERS))
+            )
+        )
+
+    backend = _load(name)
+    if backend is None:
+        raise WrongArgumentValueError("Backend {!r} is not installed".format(name))
+    active = backend
+
+
+register(GMPY2, _load_gmpy2)
+
+try:
+    select(os.environ.get("NUMERAL_SYSTEM_BACKEND", AUTO))
+except WrongArgumentValueError as e:
+    warnings.warn("{}, pure Python engine is used".format(e), RuntimeWarning)
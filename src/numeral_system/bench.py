@@ -0,0 +1,676 @@
+"""
+Benchmarks of numeral system conversions
+
+Run ``python -m numeral_system.bench --help`` to see available options.
+Results are written as JSON, which can be compared with results of another
+release by ``--compare`` option to catch performance regressions.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import timeit
+from contextlib import contextmanager
+
+from . import backends, positional, roman
+
+# Alphabet of base 62 identifiers which is not handled by builtin conversion
+_BASE62_ALPHABET = tuple(
+    "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+)
+
+# Fields of measurement which are not part of its identity
+_MEASURED_FIELDS = ("seconds", "ops_per_second", "speedup")
+
+
+def _best_time(function, repeat, number=1):
+    """
+    Measure the best time of several runs
+
+    :param function: function without arguments to measure
+    :type function: callable
+
+    :param repeat: amount of runs
+    :type repeat: int
+
+    :param number: amount of calls in one run
+    :type number: int
+
+    :return: seconds of one run
+    :rtype: float
+    """
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def _measure(benchmark, function, repeat, operations=1, **case):
+    """
+    Measure function and describe result
+
+    :param benchmark: name of benchmark
+    :type benchmark: str
+
+    :param function: function without arguments to measure
+    :type function: callable
+
+    :param repeat: amount of runs, the best time is taken
+    :type repeat: int
+
+    :param operations: amount of conversions done by one call of function
+    :type operations: int
+
+    :param case: fields which identify measurement
+    :type case: dict
+
+    :return: measurement
+    :rtype: dict
+    """
+    seconds = _best_time(function, repeat)
+    result = {"benchmark": benchmark}
+    result.update(case)
+    result["seconds"] = seconds
+    result["ops_per_second"] = operations / seconds if seconds else None
+    return result
+
+
+@contextmanager
+def _unlimited_str_digits():
+    """
+    Allow builtin conversion of huge numbers for baseline measurements
+    """
+    get_limit = getattr(sys, "get_int_max_str_digits", None)
+    if get_limit is None:
+        yield
+        return
+
+    limit = get_limit()
+    sys.set_int_max_str_digits(0)
+    try:
+        yield
+    finally:
+        sys.set_int_max_str_digits(limit)
+
+
+def bench_small_ids(quick=False, repeat=3, seed=0):
+    """
+    Measure throughput of conversion of 64 bit identifiers
+
+    :param quick: use less identifiers
+    :type quick: bool
+
+    :param repeat: amount of runs of every case, the best time is taken
+    :type repeat: int
+
+    :param seed: seed of random numbers
+    :type seed: int
+
+    :return: measurements
+    :rtype: list[dict]
+    """
+    generator = random.Random(seed)
+    numbers = [generator.getrandbits(64) for _ in range(1000 if quick else 20000)]
+    count = len(numbers)
+
+    results = []
+    for base, alphabet in (
+        (10, positional.DEFAULT_ALPHABET),
+        (16, positional.DEFAULT_ALPHABET),
+        (36, positional.DEFAULT_ALPHABET),
+        (62, _BASE62_ALPHABET),
+    ):
+        codec = positional.Codec(base, alphabet)
+        encoded = [codec.encode(number) for number in numbers]
+        cases = (
+            (
+                "encode",
+                lambda b=base, a=alphabet: [
+                    positional.encode(n, b, a) for n in numbers
+                ],
+            ),
+            (
+                "decode",
+                lambda b=base, a=alphabet, e=encoded: [
+                    positional.decode(s, b, a) for s in e
+                ],
+            ),
+            ("codec_encode", lambda c=codec: [c.encode(n) for n in numbers]),
+            ("codec_decode", lambda c=codec, e=encoded: [c.decode(s) for s in e]),
+        )
+        for operation, function in cases:
+            results.append(
+                _measure(
+                    "small_ids",
+                    function,
+                    repeat,
+                    count,
+                    operation=operation,
+                    base=base,
+                    implementation="numeral_system",
+                )
+            )
+
+        if base in (10, 16):
+            spec = "d" if base == 10 else "X"
+            builtin_cases = (
+                ("encode", lambda f=spec: [format(n, f) for n in numbers]),
+                ("decode", lambda b=base, e=encoded: [int(s, b) for s in e]),
+            )
+            for operation, function in builtin_cases:
+                results.append(
+                    _measure(
+                        "small_ids",
+                        function,
+                        repeat,
+                        count,
+                        operation=operation,
+                        base=base,
+                        implementation="builtin",
+                    )
+                )
+
+    return results
+
+
+def bench_huge(quick=False, repeat=1, seed=0):
+    """
+    Measure how conversion time grows with length of number
+
+    :param quick: use shorter numbers
+    :type quick: bool
+
+    :param repeat: amount of runs of every case, the best time is taken
+    :type repeat: int
+
+    :param seed: seed of random numbers
+    :type seed: int
+
+    :return: measurements
+    :rtype: list[dict]
+    """
+    generator = random.Random(seed)
+    sizes = (
+        (1 << 10, 1 << 13, 1 << 16) if quick else (1 << 10, 1 << 14, 1 << 18, 1 << 20)
+    )
+
+    results = []
+    for bits in sizes:
+        number = generator.getrandbits(bits) | 1 << bits
+        for base in (10, 16, 36, 62):
+            alphabet = _BASE62_ALPHABET if base == 62 else positional.DEFAULT_ALPHABET
+            encoded = positional.encode(number, base, alphabet)
+            cases = (
+                (
+                    "encode",
+                    lambda n=number, b=base, a=alphabet: positional.encode(n, b, a),
+                ),
+                (
+                    "decode",
+                    lambda e=encoded, b=base, a=alphabet: positional.decode(e, b, a),
+                ),
+            )
+            for operation, function in cases:
+                results.append(
+                    _measure(
+                        "huge",
+                        function,
+                        repeat,
+                        operation=operation,
+                        base=base,
+                        bits=bits,
+                        implementation="numeral_system",
+                    )
+                )
+
+        with _unlimited_str_digits():
+            encoded = str(number)
+            cases = (
+                ("encode", 10, lambda n=number: str(n)),
+                ("decode", 10, lambda e=encoded: int(e)),
+                ("encode", 16, lambda n=number: format(n, "X")),
+            )
+            for operation, base, function in cases:
+                results.append(
+                    _measure(
+                        "huge",
+                        function,
+                        repeat,
+                        operation=operation,
+                        base=base,
+                        bits=bits,
+                        implementation="builtin",
+                    )
+                )
+
+    return results
+
+
+def bench_roman(quick=False, repeat=3):
+    """
+    Measure conversion of the whole roman domain
+
+    :param quick: run less times
+    :type quick: bool
+
+    :param repeat: amount of runs of every case, the best time is taken
+    :type repeat: int
+
+    :return: measurements
+    :rtype: list[dict]
+    """
+    numbers = range(1, 4000)
+    encoded = [roman.encode(number) for number in numbers]
+    repeat = 1 if quick else repeat
+
+    # tables are built from scratch, already built ones are put back afterwards
+    tables = roman._TABLES  # pylint: disable=protected-access
+    roman._TABLES = None  # pylint: disable=protected-access
+    try:
+        started = time.perf_counter()
+        roman.build_tables()
+        seconds = time.perf_counter() - started
+    finally:
+        if tables is not None:
+            roman._TABLES = tables  # pylint: disable=protected-access
+
+    results = [
+        {
+            "benchmark": "roman",
+            "operation": "build_tables",
+            "seconds": seconds,
+            "ops_per_second": None,
+        }
+    ]
+    cases = (
+        ("encode", lambda: [roman.encode(number) for number in numbers]),
+        ("decode", lambda: [roman.decode(number) for number in encoded]),
+        ("is_valid", lambda: [roman.is_valid(number) for number in encoded]),
+    )
+    for operation, function in cases:
+        results.append(
+            _measure("roman", function, repeat, len(encoded), operation=operation)
+        )
+
+    return results
+
+
+def bench_batch(quick=False, repeat=1, seed=0):
+    """
+    Measure batch conversion interfaces
+
+    :param quick: use less numbers
+    :type quick: bool
+
+    :param repeat: amount of runs of every case, the best time is taken
+    :type repeat: int
+
+    :param seed: seed of random numbers
+    :type seed: int
+
+    :return: measurements
+    :rtype: list[dict]
+    """
+    generator = random.Random(seed)
+    count = 10000 if quick else 200000
+    numbers = [generator.getrandbits(63) for _ in range(count)]
+    encoded = [positional.encode(number, 36) for number in numbers]
+
+    cases = [
+        ("loop_encode", lambda: [positional.encode(n, 36) for n in numbers]),
+        ("iter_encode", lambda: list(positional.iter_encode(numbers, 36))),
+        ("encode_many", lambda: list(positional.encode_many(numbers, 36))),
+        (
+            "encode_many_workers",
+            lambda: list(positional.encode_many(numbers, 36, workers=2)),
+        ),
+        ("decode_many", lambda: list(positional.decode_many(encoded, 36))),
+        (
+            "decode_many_workers",
+            lambda: list(positional.decode_many(encoded, 36, workers=2)),
+        ),
+    ]
+
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        numpy = None
+
+    if numpy is not None:
+        array = numpy.array(numbers, dtype="int64")
+        strings = numpy.array(encoded)
+        cases.extend(
+            [
+                ("encode_array", lambda: positional.encode_array(array, 36)),
+                ("decode_array", lambda: positional.decode_array(strings, 36)),
+            ]
+        )
+
+    return [
+        _measure("batch", function, repeat, count, operation=operation, base=36)
+        for operation, function in cases
+    ]
+
+
+def bench_parallel(quick=False, repeat=1, seed=0, bits=None, base=10, workers=None):
+    """
+    Measure how parallel conversion of a single huge number scales with cores
+
+    :param quick: use shorter number
+    :type quick: bool
+
+    :param repeat: amount of runs of every case, the best time is taken
+    :type repeat: int
+
+    :param seed: seed of random number
+    :type seed: int
+
+    :param bits: length of number in bits, 2 ** 21 by default
+    :type bits: int | None
+
+    :param base: base of numeral system
+    :type base: int
+
+    :param workers: amounts of worker processes to check, 1, 2, 4 ... up to amount
+        of cores by default
+    :type workers: list[int] | None
+
+    :return: measurements, serial conversion has 0 workers
+    :rtype: list[dict]
+    """
+    if bits is None:
+        bits = 1 << 20 if quick else 1 << 21
+
+    if workers is None:
+        cores = os.cpu_count() or 1
+        workers = [1 << power for power in range(cores.bit_length())]
+        if workers[-1] != cores:
+            workers.append(cores)
+
+    number = random.Random(seed).getrandbits(bits) | 1 << bits
+    digits = positional.encode(number, base)
+
+    results = []
+    serial = {}
+    for amount in [0] + list(workers):
+        parallel = amount or None
+        cases = (
+            ("encode", lambda p=parallel: positional.encode(number, base, parallel=p)),
+            ("decode", lambda p=parallel: positional.decode(digits, base, parallel=p)),
+        )
+        for operation, function in cases:
+            result = _measure(
+                "parallel",
+                function,
+                repeat,
+                operation=operation,
+                base=base,
+                bits=bits,
+                workers=amount,
+            )
+            serial.setdefault(operation, result["seconds"])
+            result["speedup"] = serial[operation] / result["seconds"]
+            results.append(result)
+
+    return results
+
+
+def bench_chunk_tables(quick=False, repeat=3, seed=0):
+    """
+    Measure encoding of 8-13 digit identifiers with and without chunk tables
+
+    :param quick: use less identifiers
+    :type quick: bool
+
+    :param repeat: amount of runs of every case, the best time is taken
+    :type repeat: int
+
+    :param seed: seed of random numbers
+    :type seed: int
+
+    :return: measurements
+    :rtype: list[dict]
+    """
+    generator = random.Random(seed)
+    count = 500 if quick else 10000
+
+    results = []
+    for base, alphabet in (
+        (7, positional.DEFAULT_ALPHABET),
+        (36, positional.DEFAULT_ALPHABET),
+        (62, _BASE62_ALPHABET),
+    ):
+        tabled = positional.Codec(base, alphabet)
+        tabled._build_chunk_tables()  # pylint: disable=protected-access
+        plain = positional.Codec(base, alphabet)
+        plain._build_chunk_tables(limit=0)  # pylint: disable=protected-access
+
+        for length in (8, 11, 13):
+            numbers = [
+                generator.randrange(base ** (length - 1), base ** length)
+                for _ in range(count)
+            ]
+            seconds = {}
+            for tables, codec in (("off", plain), ("on", tabled)):
+                result = _measure(
+                    "chunk_tables",
+                    lambda e=codec.encode, n=numbers: [e(number) for number in n],
+                    repeat,
+                    count,
+                    operation="encode",
+                    base=base,
+                    digits=length,
+                    tables=tables,
+                )
+                seconds[tables] = result["seconds"]
+                result["speedup"] = seconds["off"] / result["seconds"]
+                results.append(result)
+
+    return results
+
+
+def bench_backends(quick=False, repeat=1, seed=0):
+    """
+    Measure conversion of big numbers by every available backend
+
+    :param quick: use shorter numbers
+    :type quick: bool
+
+    :param repeat: amount of runs of every case, the best time is taken
+    :type repeat: int
+
+    :param seed: seed of random numbers
+    :type seed: int
+
+    :return: measurements
+    :rtype: list[dict]
+    """
+    generator = random.Random(seed)
+    sizes = (1 << 12, 1 << 16) if quick else (1 << 12, 1 << 16, 1 << 20)
+    selected = backends.current()
+
+    results = []
+    try:
+        for bits in sizes:
+            number = generator.getrandbits(bits) | 1 << bits
+            for base in (10, 36, 62):
+                alphabet = (
+                    _BASE62_ALPHABET if base == 62 else positional.DEFAULT_ALPHABET
+                )
+                codec = positional.Codec(base, alphabet)
+                encoded = codec.encode(number)
+                seconds = {}
+                for name in backends.available():
+                    backends.select(name)
+                    cases = (
+                        ("encode", lambda c=codec, n=number: c.encode(n)),
+                        ("decode", lambda c=codec, e=encoded: c.decode(e)),
+                    )
+                    for operation, function in cases:
+                        result = _measure(
+                            "backends",
+                            function,
+                            repeat,
+                            operation=operation,
+                            base=base,
+                            bits=bits,
+                            backend=name,
+                        )
+                        seconds.setdefault(operation, result["seconds"])
+                        result["speedup"] = seconds[operation] / result["seconds"]
+                        results.append(result)
+    finally:
+        backends.select(selected)
+
+    return results
+
+
+# name -> function(quick) returning list of measurements
+BENCHMARKS = {
+    "small_ids": bench_small_ids,
+    "huge": bench_huge,
+    "roman": bench_roman,
+    "batch": bench_batch,
+    "parallel": bench_parallel,
+    "chunk_tables": bench_chunk_tables,
+    "backends": bench_backends,
+}
+
+
+def run(names=None, quick=False):
+    """
+    Run benchmarks
+
+    :param names: names of benchmarks from BENCHMARKS, all by default
+    :type names: list[str] | None
+
+    :param quick: use smaller inputs
+    :type quick: bool
+
+    :return: report with environment description and measurements
+    :rtype: dict
+    """
+    results = []
+    for name in names or list(BENCHMARKS):
+        results.extend(BENCHMARKS[name](quick=quick))
+
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "backend": backends.current(),
+            "quick": quick,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def _identity(result):
+    """
+    Get identity of measurement to match it between reports
+
+    :param result: measurement
+    :type result: dict
+
+    :return: sorted fields which are not measured values
+    :rtype: tuple
+    """
+    return tuple(
+        sorted(
+            (key, value) for key, value in result.items() if key not in _MEASURED_FIELDS
+        )
+    )
+
+
+def compare(baseline, report, tolerance=0.2):
+    """
+    Find measurements which became slower than in baseline report
+
+    :param baseline: report of previous run
+    :type baseline: dict
+
+    :param report: report of current run
+    :type report: dict
+
+    :param tolerance: allowed relative slowdown
+    :type tolerance: float
+
+    :return: regressions with baseline and current seconds and ratio between them
+    :rtype: list[dict]
+    """
+    previous = {_identity(result): result for result in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        old = previous.get(_identity(result))
+        if old is None or not old["seconds"]:
+            continue
+
+        ratio = result["seconds"] / old["seconds"]
+        if ratio > 1 + tolerance:
+            regression = dict(_identity(result))
+            regression.update(
+                baseline_seconds=old["seconds"], seconds=result["seconds"], ratio=ratio,
+            )
+            regressions.append(regression)
+
+    return regressions
+
+
+def main(argv=None):
+    """
+    Run benchmarks from command line
+
+    :param argv: command line arguments
+    :type argv: list[str] | None
+
+    :return: exit code, 1 if regressions are found
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m numeral_system.bench", description=__doc__
+    )
+    parser.add_argument(
+        "benchmarks",
+        nargs="*",
+        metavar="BENCHMARK",
+        help="benchmarks to run: {}, all by default".format(", ".join(BENCHMARKS)),
+    )
+    parser.add_argument("--quick", action="store_true", help="use smaller inputs")
+    parser.add_argument("--output", help="file to write JSON to instead of stdout")
+    parser.add_argument("--compare", help="JSON report of previous run to compare with")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="allowed relative slowdown in comparison, 0.2 by default",
+    )
+    args = parser.parse_args(argv)
+    unknown = sorted(set(args.benchmarks) - set(BENCHMARKS))
+    if unknown:
+        parser.error("unknown benchmarks: {}".format(", ".join(unknown)))
+
+    report = run(args.benchmarks, args.quick)
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+    if not args.compare:
+        return 0
+
+    with open(args.compare) as baseline:
+        regressions = compare(json.load(baseline), report, args.tolerance)
+
+    for regression in regressions:
+        sys.stderr.write("Regression: {}\n".format(json.dumps(regression)))
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+"""
+Command line converter of numbers
+
+Reads numbers line by line from files or standard input and writes converted
+numbers to standard output or file in the same order, for example::
+
+    numeral-system --from 10 --to 16 numbers.txt
+    numeral-system --from roman --to 10 --workers 4 < roman.txt > numbers.txt
+"""
+import argparse
+import io
+import sys
+from functools import partial
+
+from . import _stream, exceptions, positional, roman
+
+ROMAN = "roman"
+
+# Amount of bytes of file buffers
+_BUFFER_SIZE = 1 << 20
+
+
+def _base(value):
+    """
+    Parse base argument
+
+    :param value: base or "roman"
+    :type value: str
+
+    :return: base or "roman"
+    :rtype: int | str
+    """
+    if value.lower() == ROMAN:
+        return ROMAN
+
+    try:
+        return int(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(
+            "base should be integer or {}, not {!r}".format(ROMAN, value)
+        ) from e
+
+
+def _converter(from_base, to_base, from_alphabet, to_alphabet, sign_literal):
+    """
+    Get function which converts one number, bases and alphabets are validated
+
+    :return: conversion function
+    :rtype: callable
+    """
+    if from_base == ROMAN:
+        decode = roman.decode
+    else:
+        decode = positional.get_codec(from_base, from_alphabet, sign_literal).decode
+
+    if to_base == ROMAN:
+        return lambda number: roman.encode(decode(number))
+
+    codec = positional.get_codec(to_base, to_alphabet, sign_literal)
+    if from_base == ROMAN:
+        return lambda number: codec.encode(decode(number))
+
+    return partial(
+        positional.convert,
+        from_base=from_base,
+        to_base=to_base,
+        from_alphabet=from_alphabet,
+        to_alphabet=to_alphabet,
+        sign_literal=sign_literal,
+    )
+
+
+def _convert_chunk(options, lines):
+    """
+    Convert chunk of lines to block of output text
+
+    :param options: from base, to base, from alphabet, to alphabet, sign literal
+        and error policy
+    :type options: tuple
+
+    :param lines: numbers to convert
+    :type lines: list[str]
+
+    :return: list with the only block of converted lines
+    :rtype: list[str]
+    """
+    errors = options[-1]
+    convert = _converter(*options[:-1])
+    results = []
+    for line in lines:
+        try:
+            results.append(convert(line))
+        except exceptions.NumericSystemException as e:
+            if errors == "raise":
+                raise type(e)("{!r}: {}".format(line, e)) from e
+            if errors == "marker":
+                results.append("")
+
+    return ["".join(result + "\n" for result in results)]
+
+
+def _parser():
+    """
+    Create parser of command line arguments
+
+    :return: parser
+    :rtype: argparse.ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        prog="numeral-system",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        metavar="FILE",
+        help="files with one number per line, standard input by default",
+    )
+    parser.add_argument(
+        "-o", "--output", help="file to write to, standard output by default"
+    )
+    parser.add_argument(
+        "--from",
+        dest="from_base",
+        type=_base,
+        default=10,
+        help="base of given numbers or roman, 10 by default",
+    )
+    parser.add_argument(
+        "--to",
+        dest="to_base",
+        type=_base,
+        default=10,
+        help="base of converted numbers or roman, 10 by default",
+    )
+    parser.add_argument(
+        "--from-alphabet", help="digits of given numbers, one character per digit"
+    )
+    parser.add_argument(
+        "--to-alphabet", help="digits of converted numbers, one character per digit"
+    )
+    parser.add_argument(
+        "--sign", default=positional.DEFAULT_SIGN, help="literal of negative sign"
+    )
+    parser.add_argument(
+        "--errors",
+        choices=_stream.ERROR_POLICIES,
+        default="raise",
+        help="stop on invalid number, skip it or write empty line instead of it",
+    )
+    parser.add_argument(
+        "--block-size",
+        type=int,
+        default=_stream.DEFAULT_CHUNK_SIZE,
+        help="characters which are read at once",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=_stream.DEFAULT_BATCH_SIZE,
+        help="lines which are converted at once",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="convert chunks in worker processes, output keeps the order of input",
+    )
+    return parser
+
+
+def _iter_inputs(paths, block_size):
+    """
+    Read lines of files or standard input
+
+    :param paths: paths of files, "-" means standard input
+    :type paths: list[str]
+
+    :param block_size: characters which are read at once
+    :type block_size: int
+
+    :return: generator of lines
+    :rtype: collections.Iterator[str]
+    """
+    for path in paths or ["-"]:
+        if path == "-":
+            for line in _stream.iter_lines(sys.stdin, block_size):
+                yield line
+            continue
+
+        with io.open(path, encoding="utf-8", buffering=_BUFFER_SIZE) as stream:
+            for line in _stream.iter_lines(stream, block_size):
+                yield line
+
+
+def main(argv=None):
+    """
+    Convert numbers from command line
+
+    :param argv: command line arguments
+    :type argv: list[str] | None
+
+    :return: exit code
+    :rtype: int
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.block_size < 1:
+        parser.error("block size should be positive")
+
+    options = (
+        args.from_base,
+        args.to_base,
+        tuple(args.from_alphabet)
+        if args.from_alphabet
+        else positional.DEFAULT_ALPHABET,
+        tuple(args.to_alphabet) if args.to_alphabet else positional.DEFAULT_ALPHABET,
+        args.sign,
+        args.errors,
+    )
+    output = sys.stdout
+    try:
+        _stream.check_batch_arguments(args.workers, None, args.chunk_size)
+        # fails fast on wrong base or alphabet
+        _convert_chunk(options[:-1] + ("skip",), [])
+        if args.output:
+            output = io.open(args.output, "w", encoding="utf-8", buffering=_BUFFER_SIZE)
+
+        blocks = _stream.map_chunks(
+            partial(_convert_chunk, options),
+            _iter_inputs(args.inputs, args.block_size),
+            args.chunk_size,
+            args.workers,
+        )
+        for block in blocks:
+            output.write(block)
+    except exceptions.NumericSystemException as e:
+        sys.stderr.write("{}: error: {}\n".format(parser.prog, e))
+        return 1
+    except (IOError, OSError) as e:
+        sys.stderr.write("{}: error: {}\n".format(parser.prog, e))
+        return 2
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        else:
+            output.flush()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,26 +8,48 @@ class NumericSystemException(BaseException):
     Base for all exceptions from this module.
     """
 
+    # code of error reported by non-raising conversions, see ERROR_CLASSES
+    code = None
+
 
 class WrongArgumentTypeError(NumericSystemException):
     """
     Occurs when argument type is wrong
     """
 
+    code = 1
+
 
 class WrongArgumentValueError(NumericSystemException):
     """
     Occurs when argument value is wrong
     """
 
+    code = 2
+
 
 class NumberOutOfRangeError(NumericSystemException):
     """
     Occurs when number can't be converted to necessary numeric system
     """
 
+    code = 3
+
 
 class IncorrectNumberRepresentationError(NumericSystemException):
     """
     Occurs when representation of number is incorrect according to numeric system
     """
+
+    code = 4
+
+
+# Exception classes by codes of errors which are reported by non-raising
+# conversions instead of raising, 0 means success
+ERROR_CLASSES = (
+    None,
+    WrongArgumentTypeError,
+    WrongArgumentValueError,
+    NumberOutOfRangeError,
+    IncorrectNumberRepresentationError,
+)
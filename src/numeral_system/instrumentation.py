@@ -0,0 +1,245 @@
+"""
+Opt-in instrumentation of conversions
+
+When instrumentation is enabled, conversion functions record amount of calls and
+errors, amount of processed digits, latency histogram, chosen engine and codec
+cache statistics. When it is disabled, every conversion pays only for a check of
+``enabled`` flag.
+
+Conversions done in worker processes (batch and parallel interfaces) are not
+recorded.
+
+.. code:: python
+
+    >>> from numeral_system import instrumentation, positional
+    >>> with instrumentation.recording() as stats:
+    ...     positional.encode(255, 16)
+    'FF'
+    >>> stats["functions"]["positional.encode"]["calls"]
+    1
+
+Set NUMERAL_SYSTEM_INSTRUMENTATION environment variable to 1 to enable it at
+import time.
+"""
+import mmap
+import os
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from timeit import default_timer
+
+# Read only, use enable and disable functions to change it
+enabled = False
+
+_LOCK = threading.Lock()
+
+# function name -> [calls, errors, digits, seconds, histogram]
+_FUNCTIONS = {}
+# function name -> engine -> amount of calls
+_ENGINES = defaultdict(lambda: defaultdict(int))
+# hits and misses of codecs with default alphabet
+_DEFAULT_CACHE = [0, 0]
+# statistics of cache of codecs with custom alphabet at the moment of reset
+_CACHE_BASELINE = [0, 0, 0]
+
+_CALLS, _ERRORS, _DIGITS, _SECONDS, _HISTOGRAM = range(5)
+
+# numbers of these types are counted by their length
+_SIZED_TYPES = (str, bytes, bytearray, memoryview, mmap.mmap)
+
+
+def enable():
+    """
+    Start recording of conversions
+    """
+    global enabled  # pylint: disable=global-statement
+
+    enabled = True
+
+
+def disable():
+    """
+    Stop recording of conversions, recorded values are kept
+    """
+    global enabled  # pylint: disable=global-statement
+
+    enabled = False
+
+
+def reset():
+    """
+    Forget recorded values
+    """
+    from .positional import _cached_codec  # pylint: disable=import-outside-toplevel
+
+    info = _cached_codec.cache_info()
+    with _LOCK:
+        _FUNCTIONS.clear()
+        _ENGINES.clear()
+        _DEFAULT_CACHE[:] = [0, 0]
+        _CACHE_BASELINE[:] = [info.hits, info.misses, info.currsize]
+
+
+def call(name, function, *args):
+    """
+    Call conversion function and record its latency and processed digits
+
+    Amount of digits is length of the result or the first argument, whichever is
+    string or bytes-like, and 0 for other arguments.
+
+    :param name: name of conversion
+    :type name: str
+
+    :param function: conversion function
+    :type function: callable
+
+    :param args: arguments of function, the first one is converted number
+    :type args: tuple
+
+    :return: result of function
+    """
+    started = default_timer()
+    try:
+        result = function(*args)
+    except BaseException:
+        _record(name, default_timer() - started, 0, True)
+        raise
+
+    if isinstance(result, str):
+        digits = len(result)
+    elif isinstance(args[0], _SIZED_TYPES):
+        digits = len(args[0])
+    else:
+        digits = 0
+    _record(name, default_timer() - started, digits, False)
+    return result
+
+
+def _record(name, seconds, digits, error):
+    """
+    Record conversion
+
+    :param name: name of conversion
+    :type name: str
+
+    :param seconds: latency
+    :type seconds: float
+
+    :param digits: amount of processed digits
+    :type digits: int
+
+    :param error: True if conversion raised exception
+    :type error: bool
+    """
+    # bucket N counts calls faster than 2 ** N microseconds
+    bucket = int(seconds * 1000000).bit_length()
+    with _LOCK:
+        stats = _FUNCTIONS.get(name)
+        if stats is None:
+            stats = _FUNCTIONS[name] = [0, 0, 0, 0.0, defaultdict(int)]
+        stats[_CALLS] += 1
+        stats[_ERRORS] += error
+        stats[_DIGITS] += digits
+        stats[_SECONDS] += seconds
+        stats[_HISTOGRAM][bucket] += 1
+
+
+def engine(name, path):
+    """
+    Record engine chosen by conversion
+
+    :param name: name of conversion
+    :type name: str
+
+    :param path: name of engine
+    :type path: str
+    """
+    with _LOCK:
+        _ENGINES[name][path] += 1
+
+
+def codec_cache(hit):
+    """
+    Record lookup of codec with default alphabet
+
+    :param hit: True if codec was created before
+    :type hit: bool
+    """
+    with _LOCK:
+        _DEFAULT_CACHE[0 if hit else 1] += 1
+
+
+def snapshot():
+    """
+    Get recorded values
+
+    Histogram is a list of pairs of upper bound of latency in microseconds and
+    amount of calls which are faster than it, but slower than previous bound.
+
+    :return: dict with "enabled", "functions", "engines" and "codec_cache" keys
+    :rtype: dict
+    """
+    from .positional import _cached_codec  # pylint: disable=import-outside-toplevel
+
+    info = _cached_codec.cache_info()
+    with _LOCK:
+        functions = {
+            name: {
+                "calls": stats[_CALLS],
+                "errors": stats[_ERRORS],
+                "digits": stats[_DIGITS],
+                "seconds": stats[_SECONDS],
+                "histogram": [
+                    [1 << bucket, count]
+                    for bucket, count in sorted(stats[_HISTOGRAM].items())
+                ],
+            }
+            for name, stats in _FUNCTIONS.items()
+        }
+        engines = {name: dict(paths) for name, paths in _ENGINES.items()}
+        hits = info.hits - _CACHE_BASELINE[0] + _DEFAULT_CACHE[0]
+        misses = info.misses - _CACHE_BASELINE[1]
+        # every miss adds codec to cache, so cache which did not grow evicted some
+        evictions = misses - (info.currsize - _CACHE_BASELINE[2])
+        misses += _DEFAULT_CACHE[1]
+
+    return {
+        "enabled": enabled,
+        "functions": functions,
+        "engines": engines,
+        "codec_cache": {
+            "hits": hits,
+            "misses": misses,
+            "evictions": evictions,
+            "size": info.currsize,
+            "maxsize": info.maxsize,
+        },
+    }
+
+
+@contextmanager
+def recording(clear=True):
+    """
+    Record conversions inside of context
+
+    The yielded dict is filled by snapshot on exit from context.
+
+    :param clear: forget values recorded before
+    :type clear: bool
+    """
+    was_enabled = enabled
+    if clear:
+        reset()
+
+    stats = {}
+    enable()
+    try:
+        yield stats
+    finally:
+        if not was_enabled:
+            disable()
+        stats.update(snapshot())
+
+
+if os.environ.get("NUMERAL_SYSTEM_INSTRUMENTATION") == "1":
+    enable()
@@ -2,19 +2,67 @@
 Allows convert numbers in different positional numeral system.
 The most used are binary, octal, decimal and hexadecimal
 """
-import numbers
-from itertools import groupby
-
-from .exceptions import WrongArgumentTypeError, WrongArgumentValueError
-
-try:
-    from functools import lru_cache
-except ImportError:
-    from backports.functools_lru_cache import lru_cache
-
-
-_DEFAULT_ALPHABET = tuple("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ")
-_DEFAULT_SIGN = "-"
+import base64
+import binascii
+import io
+import mmap
+import os
+import re
+import sys
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
+from itertools import groupby, islice, product, repeat
+from numbers import Integral
+
+from . import _stream, backends, instrumentation
+from .exceptions import (
+    IncorrectNumberRepresentationError,
+    NumberOutOfRangeError,
+    WrongArgumentTypeError,
+    WrongArgumentValueError,
+)
+
+DEFAULT_ALPHABET = tuple("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+DEFAULT_SIGN = "-"
+
+_DEFAULT_ALPHABET = DEFAULT_ALPHABET
+_DEFAULT_SIGN = DEFAULT_SIGN
+_LOWER_ALPHABET = tuple("0123456789abcdefghijklmnopqrstuvwxyz")
+
+# Types of bytes-like numbers which are decoded without conversion to str
+_BUFFER_TYPES = (bytes, bytearray, memoryview, mmap.mmap)
+
+# Format specs of builtin conversion for default alphabet
+_BUILTIN_FORMATS = {2: "b", 8: "o", 10: "d", 16: "X"}
+
+# Power of two bases which are converted by bit groups in addition to formats
+_BIT_BASES = (4, 32, 64)
+_BASE32_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ234567"
+_BASE64_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+
+# Numbers longer than this (in bits) are encoded by divide and conquer
+_ENCODE_SPLIT_THRESHOLD = 1000
+# Amount of digits which are encoded by simple loop on the lowest level of splitting
+_ENCODE_LEAF_DIGITS = 64
+# Numbers longer than this (in digits) are decoded by divide and conquer
+_DECODE_SPLIT_THRESHOLD = 400
+# Amount of digits which are decoded by Horner's method on the lowest level
+_DECODE_LEAF_DIGITS = 64
+# Amount of fed digits which are decoded at once by incremental decoder
+_INCREMENTAL_BLOCK_DIGITS = 1 << 12
+# Numbers shorter than this (in bits) are converted serially even in parallel mode
+_PARALLEL_THRESHOLD = 1 << 20
+# amount of workers -> process pool which is reused by parallel conversions
+_PARALLEL_POOLS = {}
+# Maximal amount of entries in tables of digit chunks of every codec
+_CHUNK_TABLE_LIMIT = 4096
+# Maximal amount of digits in chunk
+_CHUNK_MAX_DIGITS = 4
+
+# Decimal number which can be decoded without builtin int()
+_DECIMAL_NUMBER = re.compile("-?[0-9]+")
 
 
 def max_base(alphabet=_DEFAULT_ALPHABET):
@@ -49,7 +97,6 @@ def _sign(number):
     return 0
 
 
-@lru_cache(maxsize=32)
 def _map_digit_to_int(alphabet):
     """
     Return mapped literal representation to digit
@@ -75,6 +122,29 @@ def _map_digit_to_int(alphabet):
     return mapping
 
 
+def _fits_builtin(base, digits_count):
+    """
+    Check if builtin int() and str() can convert number of given length
+
+    Conversion to bases which are not power of two is limited by
+    sys.int_max_str_digits since python 3.11.
+
+    :param base: base of numeric system
+    :type base: int
+
+    :param digits_count: amount of digits in number
+    :type digits_count: int
+
+    :return: True if builtin conversion is allowed
+    :rtype: bool
+    """
+    if base & (base - 1) == 0:
+        return True
+
+    limit = getattr(sys, "get_int_max_str_digits", lambda: 0)()
+    return not limit or digits_count < limit
+
+
 def _raise_if_alphabet_is_invalid(base, alphabet):
     """
     Check given alphabet and base
@@ -100,222 +170,3534 @@ def _split_digits(number, sign_literal):
     :param number:
     :type number: int | str
 
-    :param base:
-    :type base: int
-
     :param sign_literal:
     :type sign_literal: str
 
     :return: sign, digits
-    :rtype: int, list
+    :rtype: int, str
     """
-    digits = list(str(number))
-    sign = 1
-    if digits[0] == sign_literal:
-        sign = -1
-        digits = digits[1:]
+    if isinstance(number, Integral):
+        number = int(number)
+        sign = _sign(number) or 1
+        number *= sign
+        # log10(2) ~ 1233 / 4096 gives upper estimation of decimal digits count
+        if _fits_builtin(10, (number.bit_length() * 1233 >> 12) + 1):
+            return sign, str(number)
+        return sign, _encode_digits(number, 10, _DEFAULT_ALPHABET)
+
+    if number[:1] == sign_literal:
+        return -1, number[1:]
 
-    return sign, digits
+    return 1, number
 
 
-def is_valid(number, base, alphabet=_DEFAULT_ALPHABET, sign_literal=_DEFAULT_SIGN):
+def _int_from_decimal(number, parallel=None):
     """
-    Check if given number is valid in given base and alphabet
+    Convert decimal string to integer like builtin int()
 
-    :param number: given number to check
-    :type number: int | str
+    Whitespace around number, plus sign and underscores between digits are allowed
+    as int() allows them. Long numbers of plain digits are decoded by divide and
+    conquer, which doesn't depend on sys.int_max_str_digits.
 
-    :param base: base of given number
-    :type base: int | str for less base
+    :param number: decimal number
+    :type number: str
 
-    :param alphabet: alphabet of numeric system
-    :type alphabet: tuple
+    :param parallel: parallel mode argument of decoding of long numbers
+    :type parallel: bool | int | concurrent.futures.Executor | None
 
-    :param sign_literal:
-    :type sign_literal: str
+    :return: converted number
+    :rtype: int
+    """
+    if len(number) > _DECODE_SPLIT_THRESHOLD and _DECIMAL_NUMBER.fullmatch(number):
+        return _get_codec(10).decode(number, parallel=parallel)
 
-    :return: True if given number is valid in positional numeral system with base
-    :rtype: bool
+    try:
+        return int(number)
+    except ValueError as e:
+        raise IncorrectNumberRepresentationError(
+            "String number to encode should be decimal integer"
+        ) from e
+
+
+def _buffer_view(number):
     """
-    _raise_if_alphabet_is_invalid(base, alphabet)
+    Get flat byte view of bytes-like number
 
-    if not number:
-        return False
+    :param number: bytes-like number
+    :type number: bytes | bytearray | memoryview | mmap.mmap
 
-    _, digits = _split_digits(number, sign_literal)
-    for digit in digits:
-        if digit not in alphabet[0:base]:
-            return False
+    :return: view of number
+    :rtype: memoryview
+    """
+    view = memoryview(number)
+    if view.ndim != 1 or view.itemsize != 1:
+        raise WrongArgumentTypeError(
+            "Bytes-like number should be one dimensional buffer of bytes"
+        )
 
-    return True
+    return view
 
 
-def encode(number, base, alphabet=_DEFAULT_ALPHABET, sign_literal=_DEFAULT_SIGN):
+def _slice_number(number, start, end):
     """
-    Convert integer number to number with given base and alphabet
+    Get part of string number between given offsets
 
-    :param number: given number to convert
+    :param number:
     :type number: int | str
 
-    :param base: base of given number
-    :param base: int | str for less base
-
-    :param alphabet: alphabet of numeric system
-    :type alphabet: tuple
+    :param start: index of the first character
+    :type start: int
 
-    :param sign_literal:
-    :type sign_literal: str
+    :param end: index after the last character
+    :type end: int | None
 
-    :return: converted number
-    :rtype: str
+    :return: part of number
+    :rtype: int | str
     """
-    _raise_if_alphabet_is_invalid(base, alphabet)
-
-    if base <= 10 and isinstance(number, str):
-        number = int(number)
+    if not start and end is None:
+        return number
 
-    if not isinstance(number, numbers.Integral):
+    if not isinstance(number, str):
         raise WrongArgumentTypeError(
-            "Number to encode should be integer, not {}".format(type(number))
+            "Offsets are supported only for string and bytes-like numbers"
         )
 
-    number = int(number)
-    number_sign = _sign(number)
-    number = number_sign * number
+    return number[start:end]
+
+
+def _encode_small(number, base, alphabet, width=0):
+    """
+    Convert non-negative number to digits one by one
+
+    :param number: non-negative number
+    :type number: int
+
+    :param base: base of numeric system
+    :type base: int
+
+    :param alphabet: alphabet of numeric system
+    :type alphabet: tuple
+
+    :param width: left pad result with zero digit up to this length
+    :type width: int
 
+    :return: digits from the most significant to the least one
+    :rtype: list
+    """
     pos = []
     while number >= base:
-        mod = number % base
+        number, mod = divmod(number, base)
         pos.append(alphabet[mod])
-        number = number // base
 
     pos.append(alphabet[number])
 
-    result = ""
-    if number_sign == -1:
-        result = sign_literal
+    if len(pos) < width:
+        pos.extend([alphabet[0]] * (width - len(pos)))
 
-    return result + "".join(reversed(pos))
+    pos.reverse()
+    return pos
 
 
-def decode(number, base, alphabet=_DEFAULT_ALPHABET, sign_literal=_DEFAULT_SIGN):
+def _encode_split(number, base, alphabet, powers, level, width, result):
     """
-    Convert number from given base and alphabet to integer
+    Convert non-negative number to digits by splitting on powers of base
 
-    :param number: given number to convert
-    :type number: int | str
+    On each level number is less than powers[level] ** 2, so it is divided into
+    two halves which are converted independently. Lower half is always padded with
+    zero digits because its leading zeros are significant.
 
-    :param base: base of given number
-    :type base: int | str for less base
+    :param number: non-negative number
+    :type number: int
+
+    :param base: base of numeric system
+    :type base: int
 
     :param alphabet: alphabet of numeric system
     :type alphabet: tuple
 
-    :param sign_literal:
-    :type sign_literal: str
+    :param powers: [base ** leaf, base ** (leaf * 2), base ** (leaf * 4), ...]
+    :type powers: list
 
-    :return: converted number
-    :rtype: str
-    """
-    _raise_if_alphabet_is_invalid(base, alphabet)
+    :param level: index of power to split on, -1 means no splitting
+    :type level: int
 
-    if base > 10 and not isinstance(number, str):
-        raise WrongArgumentTypeError(
-            "Number to encode with base greater 10 should be string"
-        )
+    :param width: left pad result with zero digit up to this length
+    :type width: int
 
-    if base <= 10 and not isinstance(number, (int, str)):
-        raise WrongArgumentTypeError(
-            "Number to encode with base less or equal 10 should be string or integer"
+    :param result: list where digits are collected
+    :type result: list
+    """
+    if level < 0:
+        result.extend(_encode_small(number, base, alphabet, width))
+        return
+
+    low_width = _ENCODE_LEAF_DIGITS << level
+    high, low = divmod(number, powers[level])
+    if high or width:
+        _encode_split(
+            high, base, alphabet, powers, level - 1, max(width - low_width, 0), result
         )
+        _encode_split(low, base, alphabet, powers, level - 1, low_width, result)
+    else:
+        _encode_split(low, base, alphabet, powers, level - 1, 0, result)
 
-    sign, digits = _split_digits(number, sign_literal)
-    mapping = _map_digit_to_int(alphabet)
-    as_literals = reversed(digits)
-    return sign * sum(
-        (mapping[digit] * pow(base, index) for index, digit in enumerate(as_literals))
-    )
 
+def _encode_powers(base, bit_length):
+    """
+    Get powers of base to split number of given length for encoding
 
-########
-# Binary
-def to_binary(number):
+    :param base: base of numeric system
+    :type base: int
+
+    :param bit_length: length of number in bits
+    :type bit_length: int
+
+    :return: [base ** leaf, base ** (leaf * 2), ...] where square of the last
+        power is greater than number
+    :rtype: list
     """
-    To binary number representation from integer
+    powers = [base ** _ENCODE_LEAF_DIGITS]
+    while 2 * powers[-1].bit_length() - 2 < bit_length:
+        powers.append(powers[-1] * powers[-1])
 
-    :param number:
-    :type number: int | str
+    return powers
 
-    :return:
+
+def _encode_digits(number, base, alphabet):
+    """
+    Convert non-negative number to string in given base and alphabet
+
+    Small numbers are converted digit by digit. Huge numbers are split by divide and
+    conquer on precomputed powers base ** (leaf * 2 ** k), which is much faster than
+    quadratic digit by digit conversion and doesn't depend on sys.int_max_str_digits.
+
+    :param number: non-negative number
+    :type number: int
+
+    :param base: base of numeric system
+    :type base: int
+
+    :param alphabet: alphabet of numeric system
+    :type alphabet: tuple
+
+    :return: converted number
     :rtype: str
     """
-    return encode(number, 2)
+    bit_length = number.bit_length()
+    if bit_length <= _ENCODE_SPLIT_THRESHOLD:
+        return "".join(_encode_small(number, base, alphabet))
 
+    powers = _encode_powers(base, bit_length)
+    result = []
+    _encode_split(number, base, alphabet, powers, len(powers) - 1, 0, result)
+    return "".join(result)
 
-def from_binary(number):
+
+def _decode_small(values, base, start, end):
     """
-    To hexadecimal number representation from integer
+    Convert digit values to number by Horner's method
 
-    :param number:
-    :type number: int | str
+    :param values: digit values from the most significant to the least one or
+        digits in lower case default alphabet which are converted by builtin int()
+    :type values: list | str
 
-    :return:
-    :rtype: str
+    :param base: base of numeric system
+    :type base: int
+
+    :param start: index of the first digit
+    :type start: int
+
+    :param end: index after the last digit
+    :type end: int
+
+    :return: converted number
+    :rtype: int
     """
-    return decode(number, 2)
+    if isinstance(values, str):
+        return int(values[start:end], base)
 
+    result = 0
+    for index in range(start, end):
+        result = result * base + values[index]
 
-########
-# Octal
-def to_octal(number):
+    return result
+
+
+def _decode_split(values, base, powers, start, end):
     """
-    To hexadecimal number representation from integer
+    Convert digit values to number by splitting them on powers of base
 
-    :param number:
-    :type number: int | str
+    Lower part always has length of _DECODE_LEAF_DIGITS * 2 ** k digits, so the same
+    power table is shared between all branches.
 
-    :return:
-    :rtype: str
+    :param values: digit values or digits in lower case default alphabet
+    :type values: list | str
+
+    :param base: base of numeric system
+    :type base: int
+
+    :param powers: [base ** leaf, base ** (leaf * 2), base ** (leaf * 4), ...]
+    :type powers: list
+
+    :param start: index of the first digit
+    :type start: int
+
+    :param end: index after the last digit
+    :type end: int
+
+    :return: converted number
+    :rtype: int
     """
-    return encode(number, 8)
+    length = end - start
+    if length <= _DECODE_LEAF_DIGITS:
+        return _decode_small(values, base, start, end)
 
+    level = ((length - 1) // _DECODE_LEAF_DIGITS).bit_length() - 1
+    middle = end - (_DECODE_LEAF_DIGITS << level)
+    high = _decode_split(values, base, powers, start, middle)
+    low = _decode_split(values, base, powers, middle, end)
+    return high * powers[level] + low
 
-def from_octal(number):
+
+def _decode_powers(base, length):
     """
-    From hexadecimal number representation to integer
+    Get powers of base to combine parts of number of given length for decoding
 
-    :param number:
-    :type number: int | str
+    :param base: base of numeric system
+    :type base: int
 
-    :return:
-    :rtype: str
+    :param length: amount of digits
+    :type length: int
+
+    :return: [base ** leaf, base ** (leaf * 2), ...]
+    :rtype: list
     """
-    return decode(number, 8)
+    powers = [base ** _DECODE_LEAF_DIGITS]
+    while _DECODE_LEAF_DIGITS << len(powers) < length:
+        powers.append(powers[-1] * powers[-1])
 
+    return powers
 
-########
-# Hexadecimal
-def to_hex(number):
+
+def _decode_values(values, base):
     """
-    To hexadecimal number representation from integer
+    Convert digit values to non-negative number
 
-    :param number:
-    :type number: str
+    Short numbers are converted by Horner's method. Long numbers are split by divide
+    and conquer, so multiplications are done on numbers of similar size.
 
-    :return:
-    :rtype: str
+    :param values: digit values or digits in lower case default alphabet
+    :type values: list | str
+
+    :param base: base of numeric system
+    :type base: int
+
+    :return: converted number
+    :rtype: int
     """
-    return encode(number, 16)
+    length = len(values)
+    if length <= _DECODE_SPLIT_THRESHOLD:
+        return _decode_small(values, base, 0, length)
 
+    return _decode_split(values, base, _decode_powers(base, length), 0, length)
 
-def from_hex(number):
+
+def _decode_base64(digits):
     """
-    From hexadecimal number representation to integer
+    Convert digits of standard base64 alphabet to non-negative number
 
-    :param number:
-    :type number: str
+    :param digits: valid digits from the most significant to the least one
+    :type digits: str
 
-    :return:
-    :rtype: str
+    :return: converted number
+    :rtype: int
     """
-    return decode(number, 16)
+    digits = _BASE64_ALPHABET[0] * (-len(digits) % 4) + digits
+    return int.from_bytes(binascii.a2b_base64(digits), "big")
+
+
+class Codec:
+    """
+    Converter between integers and given positional numeral system
+
+    Alphabet is validated and all lookup tables are built once on creation, so
+    codec is the cheapest way to convert a lot of numbers in the same system.
+    Module level functions use cached codecs under the hood.
+
+    Alphabets which can be mapped one to one to default alphabet are converted by
+    builtin int() and format() with str.translate() in between.
+    """
+
+    def __init__(self, base, alphabet=_DEFAULT_ALPHABET, sign_literal=_DEFAULT_SIGN):
+        """
+        :param base: base of numeral system
+        :type base: int
+
+        :param alphabet: alphabet of numeric system
+        :type alphabet: tuple
+
+        :param sign_literal:
+        :type sign_literal: str
+        """
+        alphabet = tuple(alphabet)
+        _raise_if_alphabet_is_invalid(base, alphabet)
+
+        self.base = base
+        self.alphabet = alphabet
+        self.sign_literal = sign_literal
+
+        self._mapping = _map_digit_to_int(alphabet)
+        self._valid_digits = frozenset(alphabet[0:base])
+
+        # lower case default alphabet is understood by int() for any base up to 36
+        self._builtin = False
+        self._format_spec = None
+        self._to_alphabet = None
+        self._from_alphabet = None
+
+        # built on the first batch validation
+        self._str_pattern = None
+
+        # tables for bytes-like numbers, alphabet should be single byte
+        self._byte_pattern = None
+        self._byte_values = None
+        self._byte_from_alphabet = None
+
+        # power of two bases which are not handled by format() and int()
+        self._bit_to_alphabet = None
+        self._bit_from_alphabet = None
+        self._bit_byte_from_alphabet = None
+
+        # table of several digits at once for encoding, built on the first one
+        self._chunk_digits = None
+        self._chunk_power = None
+        self._chunk_to_digits = None
+
+        # backend -> tables to and from its canonical digits, None if unsupported
+        self._backend_translations = {}
+
+        # tables of ranks and inverted ranks of digits, built on the first comparison
+        self._rank_tables = None
+
+        digits = alphabet[0:base]
+        self._single_char = all(len(digit) == 1 for digit in digits)
+        if self._single_char:
+            self._build_byte_tables("".join(digits))
+            if base <= len(_LOWER_ALPHABET):
+                self._build_builtin_tables("".join(digits))
+            if base in _BIT_BASES:
+                self._build_bit_tables("".join(digits))
+
+    def _build_byte_tables(self, digits):
+        """
+        Build tables for validation and conversion of bytes-like numbers
+
+        :param digits: allowed digits
+        :type digits: str
+        """
+        try:
+            digits = digits.encode("latin-1")
+            sign = self.sign_literal.encode("latin-1")
+        except UnicodeEncodeError:
+            return
+
+        self._byte_pattern = re.compile(
+            b"(" + re.escape(sign) + b")?([" + re.escape(digits) + b"]*)"
+        )
+        self._byte_values = bytes.maketrans(digits, bytes(bytearray(range(self.base))))
+
+    def _build_builtin_tables(self, digits):
+        """
+        Build tables for conversion by builtin int() and format()
+
+        :param digits: allowed digits
+        :type digits: str
+        """
+        self._builtin = True
+        canonical = "".join(_LOWER_ALPHABET[0 : self.base])
+        if digits == "".join(_DEFAULT_ALPHABET[0 : self.base]):
+            canonical = digits
+        elif digits != canonical:
+            self._from_alphabet = str.maketrans(digits, canonical)
+            self._to_alphabet = str.maketrans(canonical, digits)
+            if self._byte_pattern is not None:
+                self._byte_from_alphabet = bytes.maketrans(
+                    digits.encode("latin-1"), canonical.encode("ascii")
+                )
+
+        if self.base in _BUILTIN_FORMATS:
+            self._format_spec = _BUILTIN_FORMATS[self.base]
+            if canonical == "".join(_LOWER_ALPHABET[0 : self.base]):
+                self._format_spec = self._format_spec.lower()
+
+    def _build_bit_tables(self, digits):
+        """
+        Build tables for conversion of power of two bases by groups of bits
+
+        Base 4 is converted through hexadecimal digits, base 32 and 64 through
+        standard base32 and base64 encodings of number bytes.
+
+        :param digits: allowed digits
+        :type digits: str
+        """
+        if self.base == 4:
+            # every byte is four digits
+            self._bit_to_alphabet = tuple(
+                "".join(digits[value >> shift & 3] for shift in (6, 4, 2, 0))
+                for value in range(256)
+            )
+            return
+
+        if self.base == 32:
+            self._bit_to_alphabet = str.maketrans(_BASE32_ALPHABET, digits)
+            return
+
+        self._bit_to_alphabet = str.maketrans(_BASE64_ALPHABET, digits)
+        self._bit_from_alphabet = str.maketrans(digits, _BASE64_ALPHABET)
+        if self._byte_pattern is not None:
+            self._bit_byte_from_alphabet = bytes.maketrans(
+                digits.encode("latin-1"), _BASE64_ALPHABET.encode("ascii")
+            )
+
+    @property
+    def single_char(self):
+        """
+        :return: True if every digit of alphabet is a single character
+        :rtype: bool
+        """
+        return self._single_char
+
+    @property
+    def single_byte(self):
+        """
+        :return: True if every digit and sign literal are single bytes, so bytes-like
+            numbers and binary files are supported
+        :rtype: bool
+        """
+        return self._byte_pattern is not None
+
+    def is_valid(self, number, start=0, end=None):
+        """
+        Check if given number is valid in numeral system of codec
+
+        :param number: given number to check
+        :type number: int | str | bytes | bytearray | memoryview
+
+        :param start: index of the first character of string or bytes-like number
+        :type start: int
+
+        :param end: index after the last character of string or bytes-like number
+        :type end: int | None
+
+        :return: True if given number is valid
+        :rtype: bool
+        """
+        if instrumentation.enabled:
+            return instrumentation.call(
+                "positional.is_valid", self._is_valid, number, start, end
+            )
+
+        return self._is_valid(number, start, end)
+
+    def encode(self, number, parallel=None):
+        """
+        Convert integer number to numeral system of codec
+
+        Decimal string is accepted for bases up to 10, it is parsed like int() does.
+
+        :param number: given number to convert
+        :type number: int | str for less base
+
+        :param parallel: convert huge number in worker processes, True to use all
+            cores, amount of processes or executor
+        :type parallel: bool | int | concurrent.futures.Executor | None
+
+        :return: converted number
+        :rtype: str
+        """
+        if instrumentation.enabled:
+            return instrumentation.call(
+                "positional.encode", self._encode, number, parallel
+            )
+
+        return self._encode(number, parallel)
+
+    def decode(self, number, start=0, end=None, parallel=None):
+        """
+        Convert number from numeral system of codec to integer
+
+        Bytes-like numbers are validated and converted in place, so a slice of
+        big buffer is parsed without copying of the whole buffer.
+
+        :param number: given number to convert
+        :type number: str | bytes | bytearray | memoryview | int for less base
+
+        :param start: index of the first character of string or bytes-like number
+        :type start: int
+
+        :param end: index after the last character of string or bytes-like number
+        :type end: int | None
+
+        :param parallel: convert huge number in worker processes, True to use all
+            cores, amount of processes or executor
+        :type parallel: bool | int | concurrent.futures.Executor | None
+
+        :return: converted number
+        :rtype: int
+        """
+        if instrumentation.enabled:
+            return instrumentation.call(
+                "positional.decode", self._decode, number, start, end, parallel
+            )
+
+        return self._decode(number, start, end, parallel)
+
+    def encode_into(self, number, buffer, offset=0, width=None, pad=None):
+        """
+        Convert integer number and write its digits into writable buffer
+
+        :param number: given number to convert
+        :type number: int | str for less base
+
+        :param buffer: writable bytes-like object
+        :type buffer: bytearray | memoryview | mmap.mmap
+
+        :param offset: index of the first byte to write
+        :type offset: int
+
+        :param width: amount of bytes to fill, number is aligned to the right
+        :type width: int | None
+
+        :param pad: single byte to fill the rest of width, zero digit by default,
+            which is written after sign
+        :type pad: str | bytes | None
+
+        :return: amount of written bytes
+        :rtype: int
+        """
+        view = self._writable_view(buffer)
+        digits = self.encode(number).encode("latin-1")
+        if width is not None:
+            digits = self._pad(digits, width, self._pad_byte(pad))
+
+        end = offset + len(digits)
+        if offset < 0 or end > len(view):
+            raise WrongArgumentValueError(
+                "Buffer of {} bytes is too small to write {} bytes at {}".format(
+                    len(view), len(digits), offset
+                )
+            )
+
+        view[offset:end] = digits
+        return len(digits)
+
+    def encode_many_into(self, numbers, buffer, width, offset=0, pad=None):
+        """
+        Convert integer numbers and write them into fixed width slots of buffer
+
+        Arrays and lists of numbers which fit into 64 bits are converted at once by
+        numpy if it is installed, without intermediate strings.
+
+        :param numbers: given numbers to convert
+        :type numbers: collections.Iterable | numpy.ndarray
+
+        :param buffer: writable bytes-like object
+        :type buffer: bytearray | memoryview | mmap.mmap
+
+        :param width: amount of bytes of every slot, numbers are aligned to the right
+        :type width: int
+
+        :param offset: index of the first byte of the first slot
+        :type offset: int
+
+        :param pad: single byte to fill the rest of slot, zero digit by default,
+            which is written after sign
+        :type pad: str | bytes | None
+
+        :return: amount of written bytes
+        :rtype: int
+        """
+        view = self._writable_view(buffer)
+        pad = self._pad_byte(pad)
+        if width < 1 or offset < 0:
+            raise WrongArgumentValueError(
+                "Width should be positive and offset should not be negative"
+            )
+
+        try:
+            np = _import_numpy()
+        except ImportError:
+            np = None
+
+        if np is not None and isinstance(numbers, (list, tuple, np.ndarray)):
+            values = np.asarray(numbers)
+            if values.dtype.kind in "iu" and values.dtype.itemsize <= 8:
+                return _encode_array_into(np, self, values, view, width, offset, pad)
+
+        written = offset
+        for number in numbers:
+            if written + width > len(view):
+                raise WrongArgumentValueError(
+                    "Buffer of {} bytes is too small for all numbers".format(len(view))
+                )
+            digits = self._pad(self.encode(number).encode("latin-1"), width, pad)
+            view[written : written + width] = digits
+            written += width
+
+        return written - offset
+
+    def _writable_view(self, buffer):
+        """
+        Get flat byte view of writable buffer
+
+        :param buffer: writable bytes-like object
+        :type buffer: bytearray | memoryview | mmap.mmap
+
+        :return: view of buffer
+        :rtype: memoryview
+        """
+        if self._byte_pattern is None:
+            raise WrongArgumentValueError(
+                "Writing to buffer is supported only for single byte alphabets"
+            )
+
+        if not isinstance(buffer, _BUFFER_TYPES):
+            raise WrongArgumentTypeError(
+                "Bytes-like buffer is expected, but {} was given".format(type(buffer))
+            )
+
+        view = _buffer_view(buffer)
+        if view.readonly:
+            raise WrongArgumentTypeError("Buffer should be writable")
+
+        return view
+
+    def _pad_byte(self, pad):
+        """
+        Get padding byte
+
+        :param pad: single character or byte, None for zero digit
+        :type pad: str | bytes | None
+
+        :return: padding byte
+        :rtype: bytes
+        """
+        if pad is None:
+            return self.alphabet[0].encode("latin-1")
+
+        if isinstance(pad, str):
+            try:
+                pad = pad.encode("latin-1")
+            except UnicodeEncodeError:
+                pad = b""
+
+        if not isinstance(pad, bytes) or len(pad) != 1:
+            raise WrongArgumentValueError(
+                "Padding should be single byte, not {!r}".format(pad)
+            )
+
+        return pad
+
+    def _pad(self, digits, width, pad):
+        """
+        Align encoded number to the right of width
+
+        :param digits: encoded number
+        :type digits: bytes
+
+        :param width: amount of bytes
+        :type width: int
+
+        :param pad: padding byte
+        :type pad: bytes
+
+        :return: padded number
+        :rtype: bytes
+        """
+        rest = width - len(digits)
+        if rest < 0:
+            raise NumberOutOfRangeError(
+                "Number needs {} bytes, but width is {}".format(len(digits), width)
+            )
+
+        sign = self.sign_literal.encode("latin-1")
+        if pad == self.alphabet[0].encode("latin-1") and digits.startswith(sign):
+            return sign + pad * rest + digits[len(sign) :]
+
+        return pad * rest + digits
+
+    def validate_many(self, numbers, result="offsets"):
+        """
+        Check a lot of numbers and find where they become invalid
+
+        Number is valid in the same cases as for is_valid, but precompiled pattern
+        is used instead of check of every digit.
+
+        :param numbers: numbers to check
+        :type numbers: collections.Iterable
+
+        :param result: "offsets" to get offsets of the first invalid character of
+            every number, where -1 means valid number and length of number means
+            that digits are missing, "mask" to get integer where bit i is set if
+            i-th number is valid
+        :type result: str
+
+        :return: offsets or bit mask
+        :rtype: array.array | int
+        """
+        _stream.check_validation_result(result)
+        return _stream.validate_items(self._first_invalid, numbers, result)
+
+    def _first_invalid(self, number):
+        """
+        Find offset of the first invalid character of number
+
+        :param number: given number to check
+        :type number: int | str | bytes | bytearray | memoryview
+
+        :return: offset of the first invalid character or -1 for valid number
+        :rtype: int
+        """
+        if isinstance(number, str):
+            if self._str_pattern is None:
+                # multi character digits are never valid in strings, see is_valid
+                digits = [
+                    digit for digit in self.alphabet[0 : self.base] if len(digit) == 1
+                ]
+                self._str_pattern = re.compile(
+                    "({})?([{}]*)".format(
+                        re.escape(self.sign_literal), re.escape("".join(digits))
+                    )
+                    if digits
+                    else "({})?()".format(re.escape(self.sign_literal))
+                )
+            match = self._str_pattern.match(number)
+        elif isinstance(number, _BUFFER_TYPES) and self._byte_pattern is not None:
+            number = _buffer_view(number)
+            match = self._byte_pattern.match(number)
+        else:
+            return -1 if self._is_valid(number, 0, None) else 0
+
+        end = match.end()
+        return -1 if match.group(2) and end == len(number) else end
+
+    def compare(self, first, second):
+        """
+        Compare two numbers of numeral system of codec without decoding
+
+        :param first: number in numeral system of codec
+        :type first: str
+
+        :param second: number in numeral system of codec
+        :type second: str
+
+        :return: -1 if first number is less, 1 if it is greater, 0 if they are equal
+        :rtype: int
+        """
+        first, second = self.sort_key(first), self.sort_key(second)
+        return (first > second) - (first < second)
+
+    def sort_key(self, number):
+        """
+        Get key which is ordered as value of number, but doesn't require decoding
+
+        Numbers are ordered by sign, then by amount of significant digits, then by
+        digits translated to their ranks in alphabet, which are inverted for
+        negative numbers.
+
+        :param number: number in numeral system of codec
+        :type number: str
+
+        :return: key, keys of equal numbers are equal
+        :rtype: tuple
+        """
+        if self._rank_tables is None:
+            self._build_rank_tables()
+
+        if not isinstance(number, str):
+            raise WrongArgumentTypeError(
+                "Number to compare should be string, not {}".format(type(number))
+            )
+
+        negative = number[:1] == self.sign_literal
+        if negative:
+            number = number[1:]
+        if not number:
+            raise IncorrectNumberRepresentationError("Number has no digits")
+        if not self._valid_digits.issuperset(number):
+            raise IncorrectNumberRepresentationError(
+                "Number has digits which are not allowed for base {}".format(self.base)
+            )
+
+        number = number.lstrip(self.alphabet[0])
+        if not number:
+            return 0, 0, ""
+
+        if negative:
+            return -1, -len(number), number.translate(self._rank_tables[1])
+
+        if self._rank_tables[0] is not None:
+            number = number.translate(self._rank_tables[0])
+        return 1, len(number), number
+
+    def _build_rank_tables(self):
+        """
+        Build tables of translation of digits to their ranks and inverted ranks
+
+        Table of ranks is None when digits are already in order of code points.
+        """
+        if not self._single_char:
+            raise WrongArgumentValueError(
+                "Comparison is supported only for single character alphabets"
+            )
+
+        digits = "".join(self.alphabet[0 : self.base])
+        ranks = "".join(map(chr, range(self.base)))
+        self._rank_tables = (
+            None if list(digits) == sorted(digits) else str.maketrans(digits, ranks),
+            str.maketrans(digits, ranks[::-1]),
+        )
+
+    def try_encode(self, number):
+        """
+        Convert integer number without raising exception for invalid number
+
+        :param number: given number to convert
+        :type number: int | str
+
+        :return: converted number or numeral_system.Failure
+        :rtype: str | numeral_system.Failure
+        """
+        return _stream.try_item(self._encode_error, self.encode, number)
+
+    def try_decode(self, number, start=0, end=None):
+        """
+        Convert number to integer without raising exception for invalid number
+
+        :param number: given number to convert
+        :type number: int | str | bytes | bytearray | memoryview
+
+        :param start: index of the first character of string or bytes-like number
+        :type start: int
+
+        :param end: index after the last character of string or bytes-like number
+        :type end: int | None
+
+        :return: integer number or numeral_system.Failure
+        :rtype: int | numeral_system.Failure
+        """
+        if not start and end is None:
+            return _stream.try_item(self._decode_error, self.decode, number)
+
+        code = self._decode_error(number, start, end)
+        if code:
+            return _stream.Failure(
+                code, number, partial(self.decode, start=start, end=end)
+            )
+
+        return self.decode(number, start, end)
+
+    def try_encode_many(self, numbers):
+        """
+        Convert a lot of integer numbers, invalid ones are reported by error codes
+
+        :param numbers: numbers to convert
+        :type numbers: collections.Iterable
+
+        :return: converted numbers with None for invalid ones, and codes of errors
+            where 0 means success, see numeral_system.exceptions.ERROR_CLASSES
+        :rtype: (list, array.array)
+        """
+        return _stream.try_items(self._encode_error, self.encode, numbers)
+
+    def try_decode_many(self, numbers):
+        """
+        Convert a lot of numbers to integers, invalid ones are reported by error codes
+
+        :param numbers: numbers to convert
+        :type numbers: collections.Iterable
+
+        :return: integer numbers with None for invalid ones, and codes of errors
+            where 0 means success, see numeral_system.exceptions.ERROR_CLASSES
+        :rtype: (list, array.array)
+        """
+        return _stream.try_items(self._decode_error, self.decode, numbers)
+
+    def _encode_error(self, number):
+        """
+        Get code of error which encode raises for number
+
+        :return: code of error or 0 if number is valid
+        :rtype: int
+        """
+        if self.base <= 10 and isinstance(number, str):
+            if _DECIMAL_NUMBER.fullmatch(number):
+                return 0
+            try:
+                int(number)
+            except ValueError:
+                return IncorrectNumberRepresentationError.code
+            return 0
+
+        if not isinstance(number, Integral):
+            return WrongArgumentTypeError.code
+
+        return 0
+
+    def _decode_error(self, number, start=0, end=None):
+        """
+        Get code of error which decode raises for number
+
+        :return: code of error or 0 if number is valid
+        :rtype: int
+        """
+        if isinstance(number, str):
+            if start or end is not None:
+                number = number[start:end]
+            if number[:1] == self.sign_literal:
+                number = number[1:]
+        elif isinstance(number, _BUFFER_TYPES):
+            if self._byte_pattern is None:
+                return WrongArgumentValueError.code
+
+            view = memoryview(number)
+            if view.ndim != 1 or view.itemsize != 1:
+                return WrongArgumentTypeError.code
+
+            start, end, _ = slice(start, end).indices(len(view))
+            match = self._byte_pattern.fullmatch(view, start, end)
+            if match is None or not match.group(2):
+                return IncorrectNumberRepresentationError.code
+            return 0
+        elif self.base > 10 or not isinstance(number, int):
+            return WrongArgumentTypeError.code
+        elif start or end is not None:
+            return WrongArgumentTypeError.code
+        else:
+            number = _split_digits(number, self.sign_literal)[1]
+
+        if not number or not self._valid_digits.issuperset(number):
+            return IncorrectNumberRepresentationError.code
+
+        return 0
+
+    def iter_encode_digits(self, number, chunk_size=_stream.DEFAULT_CHUNK_SIZE):
+        """
+        Lazily convert huge integer number to chunks of digits, see
+        iter_encode_digits function
+
+        :param number: integer number
+        :type number: int
+
+        :param chunk_size: amount of digits in every chunk except the first one,
+            which can be shorter and starts with sign
+        :type chunk_size: int
+
+        :return: generator of chunks of digits
+        :rtype: collections.Iterator[str]
+        """
+        if not isinstance(number, Integral):
+            raise WrongArgumentTypeError(
+                "Number to encode should be integer, not {}".format(type(number))
+            )
+
+        if chunk_size < 1:
+            raise WrongArgumentValueError(
+                "Chunk size should be positive, not {}".format(chunk_size)
+            )
+
+        return self._iter_digit_chunks(int(number), chunk_size)
+
+    def decode_digits(self, digits):
+        """
+        Convert digits without sign to non-negative number
+
+        Unlike decode, leading sign literal is not recognized, so any part of
+        digits of bigger number is converted as is.
+
+        :param digits: digits from the most significant to the least one
+        :type digits: str
+
+        :return: converted number
+        :rtype: int
+        """
+        return self._decode_digits(digits)
+
+    def _is_valid(self, number, start, end):
+        """
+        Check if given number is valid, see is_valid
+        """
+        if isinstance(number, _BUFFER_TYPES):
+            view = _buffer_view(number)
+            start, end, _ = slice(start, end).indices(len(view))
+            if self._byte_pattern is None:
+                return False
+
+            match = self._byte_pattern.fullmatch(view, start, end)
+            return match is not None and bool(match.group(2))
+
+        number = _slice_number(number, start, end)
+        if not number:
+            return False
+
+        _, digits = _split_digits(number, self.sign_literal)
+        return bool(digits) and self._valid_digits.issuperset(digits)
+
+    def _encode(self, number, parallel):
+        """
+        Convert integer number, see encode
+        """
+        if self.base <= 10 and isinstance(number, str):
+            number = _int_from_decimal(number, parallel)
+
+        if not isinstance(number, Integral):
+            raise WrongArgumentTypeError(
+                "Number to encode should be integer, not {}".format(type(number))
+            )
+
+        number = int(number)
+        sign = ""
+        if number < 0:
+            sign, number = self.sign_literal, -number
+
+        if self._runs_parallel(parallel, number.bit_length()):
+            if instrumentation.enabled:
+                instrumentation.engine("positional.encode", "parallel")
+            return sign + _encode_parallel(self, number, parallel)
+
+        return sign + self._encode_digits(number)
+
+    def _decode(self, number, start, end, parallel):
+        """
+        Convert number to integer, see decode
+        """
+        if isinstance(number, _BUFFER_TYPES):
+            return self._decode_buffer(number, start, end, parallel)
+
+        if self.base > 10 and not isinstance(number, str):
+            raise WrongArgumentTypeError(
+                "Number to encode with base greater 10 should be string or bytes"
+            )
+
+        if self.base <= 10 and not isinstance(number, (int, str)):
+            raise WrongArgumentTypeError(
+                "Number to encode with base less or equal 10 should be string, "
+                "bytes or integer"
+            )
+
+        sign, digits = _split_digits(
+            _slice_number(number, start, end), self.sign_literal
+        )
+        if not digits:
+            raise IncorrectNumberRepresentationError("Number has no digits")
+
+        if self._runs_parallel(parallel, len(digits) * self.base.bit_length()):
+            if instrumentation.enabled:
+                instrumentation.engine("positional.decode", "parallel")
+            return sign * _decode_parallel(self, digits, parallel)
+
+        return sign * self._decode_digits(digits)
+
+    def _runs_parallel(self, parallel, bit_length):
+        """
+        Check if number should be converted in worker processes
+
+        :param parallel: parallel mode argument
+        :type parallel: bool | int | concurrent.futures.Executor | None
+
+        :param bit_length: approximate length of number in bits
+        :type bit_length: int
+
+        :return: True if parallel conversion is worth it
+        :rtype: bool
+        """
+        return bool(
+            parallel and self._single_char and bit_length >= _PARALLEL_THRESHOLD
+        )
+
+    def _decode_buffer(self, number, start, end, parallel=None):
+        """
+        Convert bytes-like number to integer
+
+        :param number: bytes-like number
+        :type number: bytes | bytearray | memoryview | mmap.mmap
+
+        :param start: index of the first byte of number
+        :type start: int
+
+        :param end: index after the last byte of number
+        :type end: int | None
+
+        :param parallel: parallel mode argument
+        :type parallel: bool | int | concurrent.futures.Executor | None
+
+        :return: converted number
+        :rtype: int
+        """
+        if self._byte_pattern is None:
+            raise WrongArgumentValueError(
+                "Bytes-like numbers are supported only for single byte alphabets"
+            )
+
+        view = _buffer_view(number)
+        start, end, _ = slice(start, end).indices(len(view))
+        match = self._byte_pattern.fullmatch(view, start, end)
+        if match is None:
+            raise IncorrectNumberRepresentationError(
+                "Number has digits which are not allowed for base {}".format(self.base)
+            )
+
+        sign = -1 if match.group(1) else 1
+        digits = match.group(2)
+        if not digits:
+            raise IncorrectNumberRepresentationError("Number has no digits")
+
+        if self._runs_parallel(parallel, len(digits) * self.base.bit_length()):
+            if instrumentation.enabled:
+                instrumentation.engine("positional.decode", "parallel")
+            return sign * _decode_parallel(self, digits.decode("latin-1"), parallel)
+
+        backend = backends.active
+        if backend is not None and len(digits) > _DECODE_SPLIT_THRESHOLD:
+            translation = self._backend_translation(backend)
+            if translation is not None:
+                return sign * self._decode_backend(
+                    backend, translation, digits.decode("latin-1")
+                )
+
+        if self._bit_byte_from_alphabet is not None:
+            digits = digits.translate(self._bit_byte_from_alphabet)
+            if instrumentation.enabled:
+                instrumentation.engine("positional.decode", "bits")
+            return sign * _decode_base64(digits.decode("ascii"))
+
+        if not self._builtin:
+            if instrumentation.enabled:
+                instrumentation.engine("positional.decode", "generic")
+            return sign * _decode_values(digits.translate(self._byte_values), self.base)
+
+        if self._byte_from_alphabet is not None:
+            digits = digits.translate(self._byte_from_alphabet)
+
+        if _fits_builtin(self.base, len(digits)):
+            if instrumentation.enabled:
+                instrumentation.engine("positional.decode", "builtin")
+            return sign * int(digits, self.base)
+
+        if instrumentation.enabled:
+            instrumentation.engine("positional.decode", "generic")
+        return sign * _decode_values(digits.decode("ascii"), self.base)
+
+    def _encode_digits(self, number):
+        """
+        Convert non-negative number to digits
+
+        :param number: non-negative number
+        :type number: int
+
+        :return: converted number
+        :rtype: str
+        """
+        backend = backends.active
+        if backend is not None and number.bit_length() > _ENCODE_SPLIT_THRESHOLD:
+            translation = self._backend_translation(backend)
+            if translation is not None:
+                if instrumentation.enabled:
+                    instrumentation.engine("positional.encode", backend.name)
+                digits = backend.encode(number, self.base)
+                if translation[0] is not None:
+                    digits = digits.translate(translation[0])
+                return digits
+
+        if self._format_spec is not None:
+            # log10(2) ~ 1233 / 4096 gives upper estimation of decimal digits count
+            if _fits_builtin(self.base, (number.bit_length() * 1233 >> 12) + 1):
+                if instrumentation.enabled:
+                    instrumentation.engine("positional.encode", "builtin")
+                digits = format(number, self._format_spec)
+                if self._to_alphabet is not None:
+                    digits = digits.translate(self._to_alphabet)
+                return digits
+
+        if self._bit_to_alphabet is not None:
+            if instrumentation.enabled:
+                instrumentation.engine("positional.encode", "bits")
+            return self._encode_bits(number)
+
+        if number.bit_length() <= _ENCODE_SPLIT_THRESHOLD:
+            if instrumentation.enabled:
+                instrumentation.engine("positional.encode", "chunks")
+            return self._encode_chunks(number)
+
+        if instrumentation.enabled:
+            instrumentation.engine("positional.encode", "generic")
+        return _encode_digits(number, self.base, self.alphabet)
+
+    def _iter_digit_chunks(self, number, chunk_size):
+        """
+        Convert integer number to chunks of digits, see iter_encode_digits
+        """
+        sign = ""
+        if number < 0:
+            sign, number = self.sign_literal, -number
+
+        # chunk of the lowest level has chunk_size digits, every level above doubles it
+        powers = [self.base ** chunk_size]
+        while 2 * powers[-1].bit_length() - 2 < number.bit_length():
+            powers.append(powers[-1] * powers[-1])
+
+        leaf_powers = None
+        if not self._single_char:
+            leaf_powers = _encode_powers(self.base, powers[0].bit_length())
+
+        # halves which are not converted yet, the most significant one is on top
+        stack = [(number, len(powers) - 1, 0)]
+        while stack:
+            number, level, width = stack.pop()
+            if level < 0:
+                yield sign + self._encode_leaf(number, width, leaf_powers)
+                sign = ""
+                continue
+
+            if not width and number < powers[level]:
+                stack.append((number, level - 1, 0))
+                continue
+
+            low_width = chunk_size << level
+            high, low = divmod(number, powers[level])
+            stack.append((low, level - 1, low_width))
+            stack.append((high, level - 1, max(width - low_width, 0)))
+
+    def _encode_leaf(self, number, width, powers):
+        """
+        Convert non-negative number shorter than chunk to digits
+
+        :param number: non-negative number
+        :type number: int
+
+        :param width: left pad result with zero digit up to this length
+        :type width: int
+
+        :param powers: powers of divide and conquer for multi character alphabets
+        :type powers: list | None
+
+        :return: converted number
+        :rtype: str
+        """
+        if powers is None:
+            digits = self._encode_digits(number)
+            if len(digits) < width:
+                digits = self.alphabet[0] * (width - len(digits)) + digits
+            return digits
+
+        result = []
+        _encode_split(
+            number, self.base, self.alphabet, powers, len(powers) - 1, 0, result
+        )
+        return self.alphabet[0] * (width - len(result)) + "".join(result)
+
+    def _backend_translation(self, backend):
+        """
+        Get tables of translation between alphabet and canonical digits of backend
+
+        Backend converts single character alphabets of bases which are not power
+        of two, those are converted in linear time without it.
+
+        :param backend: accelerated backend
+        :type backend: numeral_system.backends.Backend
+
+        :return: tables to and from canonical digits, None items if alphabet is
+            canonical, or None if backend does not support codec
+        :rtype: tuple | None
+        """
+        translation = self._backend_translations.get(backend, False)
+        if translation is not False:
+            return translation
+
+        translation = None
+        power_of_two = not self.base & (self.base - 1)
+        if self._single_char and self.base <= backend.max_base and not power_of_two:
+            digits = "".join(self.alphabet[0 : self.base])
+            canonical = backend.digits(self.base)
+            translation = (None, None)
+            if digits != canonical:
+                translation = (
+                    str.maketrans(canonical, digits),
+                    str.maketrans(digits, canonical),
+                )
+        self._backend_translations[backend] = translation
+        return translation
+
+    def _decode_backend(self, backend, translation, digits):
+        """
+        Convert valid digits to non-negative number by accelerated backend
+
+        :param backend: accelerated backend
+        :type backend: numeral_system.backends.Backend
+
+        :param translation: tables from _backend_translation
+        :type translation: tuple
+
+        :param digits: digits from the most significant to the least one
+        :type digits: str
+
+        :return: converted number
+        :rtype: int
+        """
+        if instrumentation.enabled:
+            instrumentation.engine("positional.decode", backend.name)
+        if translation[1] is not None:
+            digits = digits.translate(translation[1])
+        return backend.decode(digits, self.base)
+
+    def _build_chunk_tables(self, limit=None):
+        """
+        Build table of chunks of several digits within limit of entries
+
+        Chunk has at least one digit, so table is empty for big bases.
+
+        :param limit: maximal amount of entries, _CHUNK_TABLE_LIMIT by default
+        :type limit: int | None
+        """
+        if limit is None:
+            limit = _CHUNK_TABLE_LIMIT
+
+        size = 1
+        while size < _CHUNK_MAX_DIGITS and self.base ** (size + 1) <= limit:
+            size += 1
+
+        self._chunk_power = self.base ** size
+        if size > 1:
+            self._chunk_to_digits = [
+                "".join(chunk)
+                for chunk in product(self.alphabet[0 : self.base], repeat=size)
+            ]
+        self._chunk_digits = size
+
+    def _encode_chunks(self, number):
+        """
+        Convert small non-negative number to digits by chunks of several digits
+
+        :param number: non-negative number
+        :type number: int
+
+        :return: converted number
+        :rtype: str
+        """
+        if self._chunk_digits is None:
+            self._build_chunk_tables()
+
+        table = self._chunk_to_digits
+        if table is None:
+            return "".join(_encode_small(number, self.base, self.alphabet))
+
+        power = self._chunk_power
+        chunks = []
+        while number >= power:
+            number, rest = divmod(number, power)
+            chunks.append(table[rest])
+
+        if self._single_char:
+            zero = self.alphabet[0]
+            chunks.append(table[number].lstrip(zero) or zero)
+        else:
+            chunks.append("".join(_encode_small(number, self.base, self.alphabet)))
+        chunks.reverse()
+        return "".join(chunks)
+
+    def _encode_bits(self, number):
+        """
+        Convert non-negative number to digits of base 4, 32 or 64 by groups of bits
+
+        :param number: non-negative number
+        :type number: int
+
+        :return: converted number
+        :rtype: str
+        """
+        zero = self.alphabet[0]
+        if self.base == 4:
+            data = number.to_bytes((number.bit_length() + 7) // 8, "big")
+            digits = "".join(map(self._bit_to_alphabet.__getitem__, data))
+            return digits.lstrip(zero) or zero
+
+        # whole groups of bytes are encoded, so there is no padding
+        group = 5 if self.base == 32 else 3
+        size = -(-number.bit_length() // (8 * group)) * group
+        data = number.to_bytes(size, "big")
+        if self.base == 32:
+            digits = base64.b32encode(data).decode("ascii")
+        else:
+            digits = binascii.b2a_base64(data, newline=False).decode("ascii")
+
+        return digits.translate(self._bit_to_alphabet).lstrip(zero) or zero
+
+    def _decode_digits(self, digits):
+        """
+        Convert digits to non-negative number
+
+        :param digits: digits from the most significant to the least one
+        :type digits: str
+
+        :return: converted number
+        :rtype: int
+        """
+        if not self._valid_digits.issuperset(digits):
+            raise IncorrectNumberRepresentationError(
+                "Number has digits which are not allowed for base {}".format(self.base)
+            )
+
+        if not digits:
+            return 0
+
+        backend = backends.active
+        if backend is not None and len(digits) > _DECODE_SPLIT_THRESHOLD:
+            translation = self._backend_translation(backend)
+            if translation is not None:
+                return self._decode_backend(backend, translation, digits)
+
+        if self._bit_from_alphabet is not None:
+            if instrumentation.enabled:
+                instrumentation.engine("positional.decode", "bits")
+            return _decode_base64(digits.translate(self._bit_from_alphabet))
+
+        if not self._builtin:
+            mapping = self._mapping
+            if instrumentation.enabled:
+                instrumentation.engine("positional.decode", "generic")
+            return _decode_values([mapping[digit] for digit in digits], self.base)
+
+        if self._from_alphabet is not None:
+            digits = digits.translate(self._from_alphabet)
+
+        if _fits_builtin(self.base, len(digits)):
+            if instrumentation.enabled:
+                instrumentation.engine("positional.decode", "builtin")
+            return int(digits, self.base)
+
+        if instrumentation.enabled:
+            instrumentation.engine("positional.decode", "generic")
+        return _decode_values(digits, self.base)
+
+
+_DEFAULT_CODECS = {}
+
+
+@lru_cache(maxsize=128)
+def _cached_codec(base, alphabet, sign_literal):
+    """
+    Get codec for custom alphabet or sign literal
+
+    :return: codec
+    :rtype: Codec
+    """
+    return Codec(base, alphabet, sign_literal)
+
+
+def _get_codec(base, alphabet=_DEFAULT_ALPHABET, sign_literal=_DEFAULT_SIGN):
+    """
+    Get cached codec for given arguments
+
+    Codecs with default alphabet are looked up by base only, which is cheaper than
+    hashing of the whole alphabet.
+
+    :param base: base of numeral system
+    :type base: int
+
+    :param alphabet: alphabet of numeric system
+    :type alphabet: tuple
+
+    :param sign_literal:
+    :type sign_literal: str
+
+    :return: codec
+    :rtype: Codec
+    """
+    if alphabet is _DEFAULT_ALPHABET and sign_literal == _DEFAULT_SIGN:
+        codec = _DEFAULT_CODECS.get(base)
+        if instrumentation.enabled:
+            instrumentation.codec_cache(codec is not None)
+        if codec is None:
+            codec = _DEFAULT_CODECS[base] = Codec(base)
+        return codec
+
+    # lists and strings are accepted as alphabets, but only tuples are hashable
+    return _cached_codec(base, tuple(alphabet), sign_literal)
+
+
+def get_codec(base, alphabet=DEFAULT_ALPHABET, sign_literal=DEFAULT_SIGN):
+    """
+    Get shared codec of given numeral system
+
+    Codecs are cached, so it is cheaper than creation of Codec for every batch of
+    conversions.
+
+    :param base: base of numeral system
+    :type base: int
+
+    :param alphabet: alphabet of numeric system
+    :type alphabet: tuple
+
+    :param sign_literal:
+    :type sign_literal: str
+
+    :return: codec
+    :rtype: Codec
+    """
+    return _get_codec(base, alphabet, sign_literal)
+
+
+def is_valid(
+    number,
+    base,
+    alphabet=_DEFAULT_ALPHABET,
+    sign_literal=_DEFAULT_SIGN,
+    start=0,
+    end=None,
+):
+    """
+    Check if given number is valid in given base and alphabet
+
+    :param number: given number to check
+    :type number: int | str | bytes | bytearray | memoryview
+
+    :param base: base of given number
+    :type base: int | str for less base
+
+    :param alphabet: alphabet of numeric system
+    :type alphabet: tuple
+
+    :param sign_literal:
+    :type sign_literal: str
+
+    :param start: index of the first character of string or bytes-like number
+    :type start: int
+
+    :param end: index after the last character of string or bytes-like number
+    :type end: int | None
+
+    :return: True if given number is valid in positional numeral system with base
+    :rtype: bool
+    """
+    return _get_codec(base, alphabet, sign_literal).is_valid(number, start, end)
+
+
+def validate_many(
+    numbers,
+    base,
+    alphabet=_DEFAULT_ALPHABET,
+    sign_literal=_DEFAULT_SIGN,
+    result="offsets",
+):
+    """
+    Check a lot of numbers in given base and alphabet at once
+
+    :param numbers: numbers to check
+    :type numbers: collections.Iterable
+
+    :param base: base of given numbers
+    :type base: int
+
+    :param alphabet: alphabet of numeric system
+    :type alphabet: tuple
+
+    :param sign_literal:
+    :type sign_literal: str
+
+    :param result: "offsets" to get offsets of the first invalid character of every
+        number, where -1 means valid number, "mask" to get integer where bit i is set
+        if i-th number is valid
+    :type result: str
+
+    :return: offsets or bit mask
+    :rtype: array.array | int
+    """
+    return _get_codec(base, alphabet, sign_literal).validate_many(numbers, result)
+
+
+def encode(
+    number, base, alphabet=_DEFAULT_ALPHABET, sign_literal=_DEFAULT_SIGN, parallel=None
+):
+    """
+    Convert integer number to number with given base and alphabet
+
+    Decimal string is accepted for bases up to 10, it is parsed like int() does.
+
+    :param number: given number to convert
+    :type number: int | str
+
+    :param base: base of given number
+    :param base: int | str for less base
+
+    :param alphabet: alphabet of numeric system
+    :type alphabet: tuple
+
+    :param sign_literal:
+    :type sign_literal: str
+
+    :param parallel: convert huge number in worker processes, True to use all cores,
+        amount of processes or executor. Numbers shorter than 2 ** 20 bits are
+        always converted in current process
+    :type parallel: bool | int | concurrent.futures.Executor | None
+
+    :return: converted number
+    :rtype: str
+    """
+    return _get_codec(base, alphabet, sign_literal).encode(number, parallel)
+
+
+def decode(
+    number,
+    base,
+    alphabet=_DEFAULT_ALPHABET,
+    sign_literal=_DEFAULT_SIGN,
+    start=0,
+    end=None,
+    parallel=None,
+):
+    """
+    Convert number from given base and alphabet to integer
+
+    :param number: given number to convert
+    :type number: int | str | bytes | bytearray | memoryview
+
+    :param base: base of given number
+    :type base: int | str for less base
+
+    :param alphabet: alphabet of numeric system
+    :type alphabet: tuple
+
+    :param sign_literal:
+    :type sign_literal: str
+
+    :param start: index of the first character of string or bytes-like number
+    :type start: int
+
+    :param end: index after the last character of string or bytes-like number
+    :type end: int | None
+
+    :param parallel: convert huge number in worker processes, True to use all cores,
+        amount of processes or executor. Numbers shorter than 2 ** 20 bits are
+        always converted in current process
+    :type parallel: bool | int | concurrent.futures.Executor | None
+
+    :return: converted number
+    :rtype: str
+    """
+    return _get_codec(base, alphabet, sign_literal).decode(number, start, end, parallel)
+
+
+def try_encode(number, base, alphabet=_DEFAULT_ALPHABET, sign_literal=_DEFAULT_SIGN):
+    """
+    Convert integer number to given base without raising exception for invalid
+    number
+
+    :param number: given number
+    :type number: int | str
+
+    :param base: base of numeral system
+    :type base: int
+
+    :param alphabet: alphabet of numeric system
+    :type alphabet: tuple
+
+    :param sign_literal:
+    :type sign_literal: str
+
+    :return: converted number or numeral_system.Failure
+    :rtype: str | numeral_system.Failure
+    """
+    return _get_codec(base, alphabet, sign_literal).try_encode(number)
+
+
+def try_decode(
+    number,
+    base,
+    alphabet=_DEFAULT_ALPHABET,
+    sign_literal=_DEFAULT_SIGN,
+    start=0,
+    end=None,
+):
+    """
+    Convert number in given base to integer without raising exception for invalid
+    number
+
+    :param number: given number
+    :type number: int | str | bytes | bytearray | memoryview
+
+    :param base: base of given number
+    :type base: int
+
+    :param alphabet: alphabet of numeric system
+    :type alphabet: tuple
+
+    :param sign_literal:
+    :type sign_literal: str
+
+    :param start: index of the first character of string or bytes-like number
+    :type start: int
+
+    :param end: index after the last character of string or bytes-like number
+    :type end: int | None
+
+    :return: integer number or numeral_system.Failure
+    :rtype: int | numeral_system.Failure
+    """
+    return _get_codec(base, alphabet, sign_literal).try_decode(number, start, end)
+
+
+def try_encode_many(
+    numbers, base, alphabet=_DEFAULT_ALPHABET, sign_literal=_DEFAULT_SIGN
+):
+    """
+    Convert a lot of integer numbers to given base, invalid ones are reported by
+    error codes
+
+    Use try_encode for invalid number to get its exception.
+
+    :param numbers: numbers to convert
+    :type numbers: collections.Iterable
+
+    :param base: base of numeral system
+    :type base: int
+
+    :param alphabet: alphabet of numeric system
+    :type alphabet: tuple
+
+    :param sign_literal:
+    :type sign_literal: str
+
+    :return: converted numbers with None for invalid ones, and codes of errors
+        where 0 means success, see numeral_system.exceptions.ERROR_CLASSES
+    :rtype: (list, array.array)
+    """
+    return _get_codec(base, alphabet, sign_literal).try_encode_many(numbers)
+
+
+def try_decode_many(
+    numbers, base, alphabet=_DEFAULT_ALPHABET, sign_literal=_DEFAULT_SIGN
+):
+    """
+    Convert a lot of numbers in given base to integers, invalid ones are reported
+    by error codes
+
+    Use try_decode for invalid number to get its exception.
+
+    :param numbers: numbers to convert
+    :type numbers: collections.Iterable
+
+    :param base: base of given numbers
+    :type base: int
+
+    :param alphabet: alphabet of numeric system
+    :type alphabet: tuple
+
+    :param sign_literal:
+    :type sign_literal: str
+
+    :return: integer numbers with None for invalid ones, and codes of errors
+        where 0 means success, see numeral_system.exceptions.ERROR_CLASSES
+    :rtype: (list, array.array)
+    """
+    return _get_codec(base, alphabet, sign_literal).try_decode_many(numbers)
+
+
+def encode_into(
+    number,
+    buffer,
+    base,
+    alphabet=_DEFAULT_ALPHABET,
+    sign_literal=_DEFAULT_SIGN,
+    offset=0,
+    width=None,
+    pad=None,
+):
+    """
+    Convert integer number to given base and write its digits into buffer
+
+    :param number: given number to convert
+    :type number: int | str
+
+    :param buffer: writable bytes-like object
+    :type buffer: bytearray | memoryview | mmap.mmap
+
+    :param base: base of numeral system
+    :type base: int
+
+    :param alphabet: alphabet of numeric system, single byte digits
+    :type alphabet: tuple
+
+    :param sign_literal:
+    :type sign_literal: str
+
+    :param offset: index of the first byte to write
+    :type offset: int
+
+    :param width: amount of bytes to fill, number is aligned to the right
+    :type width: int | None
+
+    :param pad: single byte to fill the rest of width, zero digit by default,
+        which is written after sign
+    :type pad: str | bytes | None
+
+    :return: amount of written bytes
+    :rtype: int
+    """
+    codec = _get_codec(base, alphabet, sign_literal)
+    return codec.encode_into(number, buffer, offset, width, pad)
+
+
+def encode_many_into(
+    numbers,
+    buffer,
+    width,
+    base,
+    alphabet=_DEFAULT_ALPHABET,
+    sign_literal=_DEFAULT_SIGN,
+    offset=0,
+    pad=None,
+):
+    """
+    Convert integer numbers to given base and write them into fixed width slots
+
+    :param numbers: given numbers to convert
+    :type numbers: collections.Iterable | numpy.ndarray
+
+    :param buffer: writable bytes-like object
+    :type buffer: bytearray | memoryview | mmap.mmap
+
+    :param width: amount of bytes of every slot, numbers are aligned to the right
+    :type width: int
+
+    :param base: base of numeral system
+    :type base: int
+
+    :param alphabet: alphabet of numeric system, single byte digits
+    :type alphabet: tuple
+
+    :param sign_literal:
+    :type sign_literal: str
+
+    :param offset: index of the first byte of the first slot
+    :type offset: int
+
+    :param pad: single byte to fill the rest of slot, zero digit by default,
+        which is written after sign
+    :type pad: str | bytes | None
+
+    :return: amount of written bytes
+    :rtype: int
+    """
+    codec = _get_codec(base, alphabet, sign_literal)
+    return codec.encode_many_into(numbers, buffer, width, offset, pad)
+
+
+def iter_encode(
+    numbers,
+    base,
+    alphabet=_DEFAULT_ALPHABET,
+    sign_literal=_DEFAULT_SIGN,
+    errors="raise",
+    chunk_size=_stream.DEFAULT_CHUNK_SIZE,
+):
+    """
+    Lazily convert integer numbers to given base and alphabet
+
+    :param numbers: iterable of numbers or text file with one decimal number per line
+    :type numbers: collections.Iterable | io.TextIOBase
+
+    :param base: base of numeral system
+    :type base: int
+
+    :param alphabet: alphabet of numeric system
+    :type alphabet: tuple
+
+    :param sign_literal:
+    :type sign_literal: str
+
+    :param errors: "raise" to propagate exception, "skip" to drop invalid number,
+        "marker" to yield numeral_system.ErrorMarker instead of result
+    :type errors: str
+
+    :param chunk_size: amount of characters which are read from file at once
+    :type chunk_size: int
+
+    :return: generator of converted numbers
+    :rtype: collections.Iterator[str | numeral_system.ErrorMarker]
+    """
+    _stream.check_error_policy(errors)
+    codec = _get_codec(base, alphabet, sign_literal)
+    if not _stream.is_text_file(numbers):
+        return _stream.iter_convert(codec.encode, numbers, errors)
+
+    decimal = _get_codec(10)
+
+    def encode_line(line):
+        return codec.encode(decimal.decode(line))
+
+    lines = _stream.iter_lines(numbers, chunk_size)
+    return _stream.iter_convert(encode_line, lines, errors)
+
+
+def iter_decode(
+    numbers,
+    base,
+    alphabet=_DEFAULT_ALPHABET,
+    sign_literal=_DEFAULT_SIGN,
+    errors="raise",
+    chunk_size=_stream.DEFAULT_CHUNK_SIZE,
+):
+    """
+    Lazily convert numbers from given base and alphabet to integers
+
+    :param numbers: iterable of numbers or text file with one number per line
+    :type numbers: collections.Iterable | io.TextIOBase
+
+    :param base: base of numeral system
+    :type base: int
+
+    :param alphabet: alphabet of numeric system
+    :type alphabet: tuple
+
+    :param sign_literal:
+    :type sign_literal: str
+
+    :param errors: "raise" to propagate exception, "skip" to drop invalid number,
+        "marker" to yield numeral_system.ErrorMarker instead of result
+    :type errors: str
+
+    :param chunk_size: amount of characters which are read from file at once
+    :type chunk_size: int
+
+    :return: generator of converted numbers
+    :rtype: collections.Iterator[int | numeral_system.ErrorMarker]
+    """
+    _stream.check_error_policy(errors)
+    codec = _get_codec(base, alphabet, sign_literal)
+    if _stream.is_text_file(numbers):
+        numbers = _stream.iter_lines(numbers, chunk_size)
+
+    return _stream.iter_convert(codec.decode, numbers, errors)
+
+
+def iter_encode_digits(
+    number,
+    base,
+    alphabet=_DEFAULT_ALPHABET,
+    sign_literal=_DEFAULT_SIGN,
+    chunk_size=_stream.DEFAULT_CHUNK_SIZE,
+):
+    """
+    Lazily convert huge integer number to chunks of digits
+
+    Chunks are yielded from the most significant one, joined together they are
+    equal to encode(number, base, alphabet, sign_literal). Number is split by
+    divide and conquer on powers base ** (chunk_size * 2 ** k), so only one chunk
+    of digits exists at once instead of the whole converted string.
+
+    :param number: integer number
+    :type number: int
+
+    :param base: base of numeral system
+    :type base: int
+
+    :param alphabet: alphabet of numeric system
+    :type alphabet: tuple
+
+    :param sign_literal:
+    :type sign_literal: str
+
+    :param chunk_size: amount of digits in every chunk except the first one, which
+        can be shorter and starts with sign
+    :type chunk_size: int
+
+    :return: generator of chunks of digits
+    :rtype: collections.Iterator[str]
+    """
+    return _get_codec(base, alphabet, sign_literal).iter_encode_digits(
+        number, chunk_size
+    )
+
+
+def encode_to_file(
+    number,
+    stream,
+    base,
+    alphabet=_DEFAULT_ALPHABET,
+    sign_literal=_DEFAULT_SIGN,
+    chunk_size=_stream.DEFAULT_CHUNK_SIZE,
+):
+    """
+    Convert huge integer number and write its digits to file by chunks
+
+    :param number: integer number
+    :type number: int
+
+    :param stream: text or binary file object, binary one requires single byte
+        alphabet and sign literal
+    :type stream: io.TextIOBase | io.RawIOBase | io.BufferedIOBase
+
+    :param base: base of numeral system
+    :type base: int
+
+    :param alphabet: alphabet of numeric system
+    :type alphabet: tuple
+
+    :param sign_literal:
+    :type sign_literal: str
+
+    :param chunk_size: amount of digits which are written at once
+    :type chunk_size: int
+
+    :return: amount of written characters or bytes
+    :rtype: int
+    """
+    codec = _get_codec(base, alphabet, sign_literal)
+    chunks = codec.iter_encode_digits(number, chunk_size)
+    binary = isinstance(stream, (io.RawIOBase, io.BufferedIOBase))
+    if binary and not codec.single_byte:
+        raise WrongArgumentValueError(
+            "Binary files are supported only for single byte alphabets"
+        )
+
+    written = 0
+    for chunk in chunks:
+        if binary:
+            chunk = chunk.encode("latin-1")
+        stream.write(chunk)
+        written += len(chunk)
+
+    return written
+
+
+class IncrementalDecoder:
+    """
+    Decoder of number which arrives by chunks of digits
+
+    Every chunk is validated when it is fed, so the first invalid digit is
+    reported without waiting for the rest of number. Digits are decoded by blocks
+    which are merged like a binary counter: block is merged into the previous one
+    when it is not shorter, so every digit takes part in logarithmic amount of
+    balanced multiplications and the total cost stays subquadratic.
+
+    .. code:: python
+
+        >>> decoder = IncrementalDecoder(16)
+        >>> decoder.feed("-F")
+        >>> decoder.feed("F")
+        >>> decoder.finish()
+        -255
+    """
+
+    def __init__(self, base, alphabet=_DEFAULT_ALPHABET, sign_literal=_DEFAULT_SIGN):
+        """
+        :param base: base of numeral system
+        :type base: int
+
+        :param alphabet: alphabet of numeric system
+        :type alphabet: tuple
+
+        :param sign_literal:
+        :type sign_literal: str
+        """
+        self._codec = _get_codec(base, alphabet, sign_literal)
+        self._valid_digits = frozenset(self._codec.alphabet[0:base])
+        self._sign = None
+        self._length = 0
+        self._pending = []
+        self._pending_length = 0
+        # [value, amount of digits] from the most significant block
+        self._blocks = []
+        self._powers = {}
+
+    def reset(self):
+        """
+        Forget fed digits to decode another number
+        """
+        self._sign = None
+        self._length = 0
+        self._pending = []
+        self._pending_length = 0
+        self._blocks = []
+        self._powers = {}
+
+    def feed(self, chunk):
+        """
+        Validate and accumulate the next chunk of digits
+
+        The first chunk can start with sign literal. Decoder is not changed when
+        chunk is invalid.
+
+        :param chunk: digits, bytes-like digits are supported for single byte
+            alphabets
+        :type chunk: str | bytes | bytearray | memoryview
+        """
+        codec = self._codec
+        if isinstance(chunk, _BUFFER_TYPES):
+            if not codec.single_byte:
+                raise WrongArgumentValueError(
+                    "Bytes-like numbers are supported only for single byte alphabets"
+                )
+            chunk = _buffer_view(chunk).tobytes().decode("latin-1")
+        elif not isinstance(chunk, str):
+            raise WrongArgumentTypeError(
+                "Chunk of digits should be string or bytes, not {}".format(type(chunk))
+            )
+
+        if not chunk:
+            return
+
+        sign = self._sign
+        if sign is None:
+            sign, chunk = _split_digits(chunk, codec.sign_literal)
+
+        if not self._valid_digits.issuperset(chunk):
+            index = next(
+                index
+                for index, digit in enumerate(chunk)
+                if digit not in self._valid_digits
+            )
+            raise IncorrectNumberRepresentationError(
+                "Digit {!r} at {} is not allowed for base {}".format(
+                    chunk[index], self._length + index, codec.base
+                )
+            )
+
+        self._sign = sign
+        self._length += len(chunk)
+        self._pending.append(chunk)
+        self._pending_length += len(chunk)
+        if self._pending_length >= _INCREMENTAL_BLOCK_DIGITS:
+            self._flush()
+
+    def finish(self):
+        """
+        Decode accumulated digits and reset decoder
+
+        Number without digits is rejected as decode rejects empty string.
+
+        :return: decoded number
+        :rtype: int
+        """
+        self._flush()
+        blocks = self._blocks
+        if not blocks:
+            self.reset()
+            raise IncorrectNumberRepresentationError("Number has no digits")
+
+        while len(blocks) > 1:
+            self._merge()
+
+        number = (self._sign or 1) * blocks[0][0]
+        self.reset()
+        return number
+
+    def _flush(self):
+        """
+        Decode pending digits to block and merge blocks which are not shorter than
+        previous ones
+        """
+        if not self._pending_length:
+            return
+
+        digits = "".join(self._pending)
+        self._pending = []
+        self._pending_length = 0
+
+        blocks = self._blocks
+        blocks.append([self._codec.decode_digits(digits), len(digits)])
+        while len(blocks) > 1 and blocks[-2][1] <= blocks[-1][1]:
+            self._merge()
+
+    def _merge(self):
+        """
+        Merge the last block into the previous one
+        """
+        value, length = self._blocks.pop()
+        power = self._powers.get(length)
+        if power is None:
+            power = self._powers[length] = self._codec.base ** length
+
+        previous = self._blocks[-1]
+        previous[0] = previous[0] * power + value
+        previous[1] += length
+
+
+def _encode_chunk(numbers, base, alphabet, sign_literal):
+    """
+    Convert chunk of numbers in worker process
+
+    :return: converted numbers
+    :rtype: list
+    """
+    encode_number = _get_codec(base, alphabet, sign_literal).encode
+    return [encode_number(number) for number in numbers]
+
+
+def _decode_chunk(numbers, base, alphabet, sign_literal):
+    """
+    Convert chunk of numbers in worker process
+
+    :return: converted numbers
+    :rtype: list
+    """
+    decode_number = _get_codec(base, alphabet, sign_literal).decode
+    return [decode_number(number) for number in numbers]
+
+
+def encode_many(
+    numbers,
+    base,
+    alphabet=_DEFAULT_ALPHABET,
+    sign_literal=_DEFAULT_SIGN,
+    workers=None,
+    executor=None,
+    chunk_size=_stream.DEFAULT_BATCH_SIZE,
+):
+    """
+    Convert a lot of integer numbers to given base and alphabet in worker processes
+
+    Numbers are split into chunks which are converted in parallel, results are
+    yielded lazily in the order of input. Codec is created once per worker.
+
+    :param numbers: numbers to convert
+    :type numbers: collections.Iterable
+
+    :param base: base of numeral system
+    :type base: int
+
+    :param alphabet: alphabet of numeric system
+    :type alphabet: tuple
+
+    :param sign_literal:
+    :type sign_literal: str
+
+    :param workers: amount of processes in own process pool, conversion is done in
+        current process if neither workers nor executor is given
+    :type workers: int | None
+
+    :param executor: executor to use instead of own process pool
+    :type executor: concurrent.futures.Executor | None
+
+    :param chunk_size: amount of numbers which are sent to worker at once
+    :type chunk_size: int
+
+    :return: generator of converted numbers
+    :rtype: collections.Iterator[str]
+    """
+    _stream.check_batch_arguments(workers, executor, chunk_size)
+    _get_codec(base, alphabet, sign_literal)
+    function = partial(
+        _encode_chunk, base=base, alphabet=alphabet, sign_literal=sign_literal
+    )
+    return _stream.map_chunks(
+        function,
+        numbers,
+        chunk_size,
+        workers,
+        executor,
+        initializer=_get_codec,
+        initargs=(base, alphabet, sign_literal),
+    )
+
+
+def decode_many(
+    numbers,
+    base,
+    alphabet=_DEFAULT_ALPHABET,
+    sign_literal=_DEFAULT_SIGN,
+    workers=None,
+    executor=None,
+    chunk_size=_stream.DEFAULT_BATCH_SIZE,
+):
+    """
+    Convert a lot of numbers from given base and alphabet in worker processes
+
+    Numbers are split into chunks which are converted in parallel, results are
+    yielded lazily in the order of input. Codec is created once per worker.
+
+    :param numbers: numbers to convert
+    :type numbers: collections.Iterable
+
+    :param base: base of numeral system
+    :type base: int
+
+    :param alphabet: alphabet of numeric system
+    :type alphabet: tuple
+
+    :param sign_literal:
+    :type sign_literal: str
+
+    :param workers: amount of processes in own process pool, conversion is done in
+        current process if neither workers nor executor is given
+    :type workers: int | None
+
+    :param executor: executor to use instead of own process pool
+    :type executor: concurrent.futures.Executor | None
+
+    :param chunk_size: amount of numbers which are sent to worker at once
+    :type chunk_size: int
+
+    :return: generator of converted numbers
+    :rtype: collections.Iterator[int]
+    """
+    _stream.check_batch_arguments(workers, executor, chunk_size)
+    _get_codec(base, alphabet, sign_literal)
+    function = partial(
+        _decode_chunk, base=base, alphabet=alphabet, sign_literal=sign_literal
+    )
+    return _stream.map_chunks(
+        function,
+        numbers,
+        chunk_size,
+        workers,
+        executor,
+        initializer=_get_codec,
+        initargs=(base, alphabet, sign_literal),
+    )
+
+
+########
+# Parallel
+def _parallel_executor(parallel):
+    """
+    Get executor for parallel mode argument
+
+    :param parallel: True to use all cores, amount of processes or executor
+    :type parallel: bool | int | concurrent.futures.Executor
+
+    Process pools are started on the first parallel conversion and reused by the
+    next ones until exit, pass executor to control lifetime of workers.
+
+    :return: executor, amount of workers
+    :rtype: concurrent.futures.Executor, int
+    """
+    if isinstance(parallel, Executor):
+        return parallel, os.cpu_count() or 1
+
+    workers = os.cpu_count() or 1 if parallel is True else parallel
+    if workers < 1:
+        raise WrongArgumentValueError(
+            "Amount of workers should be positive, not {}".format(workers)
+        )
+
+    executor = _PARALLEL_POOLS.get(workers)
+    if executor is None:
+        executor = _PARALLEL_POOLS[workers] = ProcessPoolExecutor(workers)
+    return executor, workers
+
+
+def _discard_executor(executor):
+    """
+    Forget broken process pool, so the next parallel conversion starts new one
+
+    :param executor: executor which failed
+    :type executor: concurrent.futures.Executor
+    """
+    for workers, pool in list(_PARALLEL_POOLS.items()):
+        if pool is executor:
+            del _PARALLEL_POOLS[workers]
+            pool.shutdown(wait=False)
+
+
+def _to_payload(number):
+    """
+    Pack non-negative number to bytes to send it to another process
+
+    :param number: non-negative number
+    :type number: int
+
+    :return: big endian bytes
+    :rtype: bytes
+    """
+    return number.to_bytes((number.bit_length() + 7) // 8, "big")
+
+
+def _encode_piece(payload, width, base, alphabet, sign_literal):
+    """
+    Convert part of huge number in worker process
+
+    :param payload: part of number packed by _to_payload
+    :type payload: bytes
+
+    :param width: left pad result with zero digit up to this length
+    :type width: int
+
+    :return: digits of part
+    :rtype: str
+    """
+    codec = _get_codec(base, alphabet, sign_literal)
+    digits = codec._encode_digits(  # pylint: disable=protected-access
+        int.from_bytes(payload, "big")
+    )
+    return alphabet[0] * (width - len(digits)) + digits
+
+
+def _decode_piece(digits, base, alphabet, sign_literal):
+    """
+    Convert part of huge number in worker process
+
+    :param digits: digits of part
+    :type digits: str
+
+    :return: part of number packed by _to_payload
+    :rtype: bytes
+    """
+    codec = _get_codec(base, alphabet, sign_literal)
+    return _to_payload(codec._decode_digits(digits))  # pylint: disable=protected-access
+
+
+def _split_piece(payload, width, power, low_width):
+    """
+    Split part of huge number in worker process the same way as _encode_split
+
+    :param payload: part of number packed by _to_payload
+    :type payload: bytes
+
+    :param width: amount of digits of part, 0 for the most significant part
+    :type width: int
+
+    :param power: base ** low_width packed by _to_payload
+    :type power: bytes
+
+    :param low_width: amount of digits of the least significant half
+    :type low_width: int
+
+    :return: packed halves with their widths, the most significant first
+    :rtype: list[(bytes, int)]
+    """
+    high, low = divmod(int.from_bytes(payload, "big"), int.from_bytes(power, "big"))
+    if high or width:
+        return [
+            (_to_payload(high), max(width - low_width, 0)),
+            (_to_payload(low), low_width),
+        ]
+
+    return [(_to_payload(low), 0)]
+
+
+def _encode_parallel(codec, number, parallel):
+    """
+    Convert huge non-negative number to digits in worker processes
+
+    The top levels of divide and conquer split are done by workers level by level,
+    halves of the same level are split concurrently. Then independent parts are
+    converted by workers. Parts are sent as bytes.
+
+    Scaling is limited: the first split is a single division of the whole number,
+    which takes about as long as the rest of conversion and can't be shared by
+    workers, so encoding is at best two or three times faster than serial one.
+
+    :param codec: codec of numeral system
+    :type codec: Codec
+
+    :param number: non-negative number
+    :type number: int
+
+    :param parallel: True to use all cores, amount of processes or executor
+    :type parallel: bool | int | concurrent.futures.Executor
+
+    :return: converted number
+    :rtype: str
+    """
+    executor, workers = _parallel_executor(parallel)
+    try:
+        powers = _encode_powers(codec.base, number.bit_length())
+        pieces = [(_to_payload(number), 0)]
+        top = len(powers) - 1
+        for level in range(top, max(top - workers.bit_length(), -1), -1):
+            power = _to_payload(powers[level])
+            futures = [
+                executor.submit(
+                    _split_piece, piece, width, power, _ENCODE_LEAF_DIGITS << level,
+                )
+                for piece, width in pieces
+            ]
+            pieces = [half for future in futures for half in future.result()]
+
+        futures = [
+            executor.submit(
+                _encode_piece,
+                piece,
+                width,
+                codec.base,
+                codec.alphabet,
+                codec.sign_literal,
+            )
+            for piece, width in pieces
+        ]
+        return "".join(future.result() for future in futures)
+    except BrokenProcessPool:
+        _discard_executor(executor)
+        raise
+
+
+def _submit_pieces(executor, codec, digits, start, end, depth):
+    """
+    Split digits into parts the same way as _decode_split and submit them
+
+    :return: future of part or (high node, low node, level of power)
+    :rtype: concurrent.futures.Future | tuple
+    """
+    length = end - start
+    if depth == 0 or length <= _DECODE_LEAF_DIGITS:
+        return executor.submit(
+            _decode_piece,
+            digits[start:end],
+            codec.base,
+            codec.alphabet,
+            codec.sign_literal,
+        )
+
+    level = ((length - 1) // _DECODE_LEAF_DIGITS).bit_length() - 1
+    middle = end - (_DECODE_LEAF_DIGITS << level)
+    return (
+        _submit_pieces(executor, codec, digits, start, middle, depth - 1),
+        _submit_pieces(executor, codec, digits, middle, end, depth - 1),
+        level,
+    )
+
+
+def _combine_pieces(node, powers):
+    """
+    Combine decoded parts submitted by _submit_pieces
+
+    :return: converted number
+    :rtype: int
+    """
+    if not isinstance(node, tuple):
+        return int.from_bytes(node.result(), "big")
+
+    high, low, level = node
+    return _combine_pieces(high, powers) * powers[level] + _combine_pieces(low, powers)
+
+
+def _decode_parallel(codec, digits, parallel):
+    """
+    Convert huge number digits to non-negative number in worker processes
+
+    Digits are split into parts which are validated and converted by workers,
+    then they are combined in current process. Combination of the biggest parts
+    can't be shared by workers, so decoding scales only while conversion of parts
+    outweighs it.
+
+    :param codec: codec of numeral system
+    :type codec: Codec
+
+    :param digits: digits from the most significant to the least one
+    :type digits: str
+
+    :param parallel: True to use all cores, amount of processes or executor
+    :type parallel: bool | int | concurrent.futures.Executor
+
+    :return: converted number
+    :rtype: int
+    """
+    executor, workers = _parallel_executor(parallel)
+    try:
+        tree = _submit_pieces(
+            executor, codec, digits, 0, len(digits), workers.bit_length()
+        )
+        return _combine_pieces(tree, _decode_powers(codec.base, len(digits)))
+    except BrokenProcessPool:
+        _discard_executor(executor)
+        raise
+
+
+########
+# Base to base
+def _power_exponent(base, power):
+    """
+    Get exponent of power of base
+
+    :param base: base of power
+    :type base: int
+
+    :param power: possible power of base
+    :type power: int
+
+    :return: k if power is base ** k, 0 otherwise
+    :rtype: int
+    """
+    exponent, value = 1, base
+    while value < power:
+        exponent, value = exponent + 1, value * base
+
+    return exponent if value == power else 0
+
+
+@lru_cache(maxsize=128)
+def _regroup_table(from_base, to_base, from_alphabet, to_alphabet):
+    """
+    Get table to convert digits between bases where one is power of another
+
+    :return: amount of digits in group and table from group of source digits to
+        target digit if target base is power of source base, amount of digits in
+        group and table from source digit to group of target digits if source base
+        is power of target base, None for other bases
+    :rtype: (int, dict) | None
+    """
+    size = _power_exponent(from_base, to_base)
+    if size:
+        groups = product(from_alphabet[:from_base], repeat=size)
+        return (
+            size,
+            {"".join(group): to_alphabet[value] for value, group in enumerate(groups)},
+        )
+
+    size = _power_exponent(to_base, from_base)
+    if size:
+        groups = product(to_alphabet[:to_base], repeat=size)
+        return (
+            -size,
+            {
+                from_alphabet[value]: "".join(group)
+                for value, group in enumerate(groups)
+            },
+        )
+
+    return None
+
+
+def _regroup(digits, source, target, size, table):
+    """
+    Convert non-negative digits between bases where one is power of another
+
+    :param digits: digits of source codec without leading zeros
+    :type digits: str
+
+    :param source: codec of given number
+    :type source: Codec
+
+    :param target: codec of result
+    :type target: Codec
+
+    :param size: amount of digits in group, negative if source digit is converted to
+        group of target digits
+    :type size: int
+
+    :param table: table from _regroup_table
+    :type table: dict
+
+    :return: converted digits
+    :rtype: str
+    """
+    try:
+        if size > 0:
+            # the first group is padded, so it is not zero and there is nothing to strip
+            digits = source.alphabet[0] * (-len(digits) % size) + digits
+            groups = (
+                digits[index : index + size] for index in range(0, len(digits), size)
+            )
+            return "".join(map(table.__getitem__, groups))
+
+        zero = target.alphabet[0]
+        head = table[digits[0]]
+        while head.startswith(zero):
+            head = head[len(zero) :]
+        return head + "".join(map(table.__getitem__, islice(digits, 1, None)))
+    except KeyError as e:
+        raise IncorrectNumberRepresentationError(
+            "Number has digits which are not allowed for base {}".format(source.base)
+        ) from e
+
+
+def convert(
+    number,
+    from_base,
+    to_base,
+    from_alphabet=_DEFAULT_ALPHABET,
+    to_alphabet=_DEFAULT_ALPHABET,
+    sign_literal=_DEFAULT_SIGN,
+):
+    """
+    Convert number from one base and alphabet to another
+
+    If one base is power of another one and alphabet of given number has only
+    single character digits, groups of digits are converted directly in linear
+    time. Otherwise number is decoded to integer and encoded by the fastest
+    engine of target base.
+
+    :param number: given number to convert
+    :type number: int | str | bytes | bytearray | memoryview
+
+    :param from_base: base of given number
+    :type from_base: int
+
+    :param to_base: base of result
+    :type to_base: int
+
+    :param from_alphabet: alphabet of given number
+    :type from_alphabet: tuple
+
+    :param to_alphabet: alphabet of result
+    :type to_alphabet: tuple
+
+    :param sign_literal:
+    :type sign_literal: str
+
+    :return: converted number
+    :rtype: str
+    """
+    if instrumentation.enabled:
+        return instrumentation.call(
+            "positional.convert",
+            _convert,
+            number,
+            from_base,
+            to_base,
+            from_alphabet,
+            to_alphabet,
+            sign_literal,
+        )
+
+    return _convert(
+        number, from_base, to_base, from_alphabet, to_alphabet, sign_literal
+    )
+
+
+def _convert(number, from_base, to_base, from_alphabet, to_alphabet, sign_literal):
+    """
+    Convert number from one base and alphabet to another, see convert
+    """
+    source = _get_codec(from_base, from_alphabet, sign_literal)
+    target = _get_codec(to_base, to_alphabet, sign_literal)
+
+    # builtin and bit group engines are already linear for power of two bases
+    power_of_two = not (from_base & (from_base - 1) or to_base & (to_base - 1))
+    if isinstance(number, str) and source.single_char and not power_of_two:
+        regroup = _regroup_table(from_base, to_base, source.alphabet, target.alphabet)
+        if regroup is not None:
+            if instrumentation.enabled:
+                instrumentation.engine("positional.convert", "regroup")
+            sign, digits = _split_digits(number, sign_literal)
+            if not digits:
+                raise IncorrectNumberRepresentationError("Number has no digits")
+
+            digits = digits.lstrip(source.alphabet[0])
+            if not digits:
+                return target.alphabet[0]
+
+            digits = _regroup(digits, source, target, *regroup)
+            return target.sign_literal + digits if sign < 0 else digits
+
+    return target.encode(source.decode(number))
+
+
+##########
+# Ordering
+def compare(
+    first, second, base, alphabet=_DEFAULT_ALPHABET, sign_literal=_DEFAULT_SIGN
+):
+    """
+    Compare two numbers in given base and alphabet without decoding them
+
+    :param first: number in given base
+    :type first: str
+
+    :param second: number in given base
+    :type second: str
+
+    :param base: base of given numbers
+    :type base: int
+
+    :param alphabet: alphabet of numeric system, one character per digit
+    :type alphabet: tuple
+
+    :param sign_literal:
+    :type sign_literal: str
+
+    :return: -1 if first number is less, 1 if it is greater, 0 if they are equal
+    :rtype: int
+    """
+    return _get_codec(base, alphabet, sign_literal).compare(first, second)
+
+
+def sort_key(base, alphabet=_DEFAULT_ALPHABET, sign_literal=_DEFAULT_SIGN):
+    """
+    Get function which makes sort keys of numbers in given base and alphabet
+
+    Keys are ordered as values of numbers, but are built from digits translated
+    to their ranks in alphabet without decoding to integers:
+
+    .. code:: python
+
+        >>> sorted(["Z", "-1", "10"], key=sort_key(36))
+        ['-1', 'Z', '10']
+
+    :param base: base of numbers
+    :type base: int
+
+    :param alphabet: alphabet of numeric system, one character per digit
+    :type alphabet: tuple
+
+    :param sign_literal:
+    :type sign_literal: str
+
+    :return: function which gets key of number
+    :rtype: callable
+    """
+    codec = _get_codec(base, alphabet, sign_literal)
+    if not codec.single_char:
+        raise WrongArgumentValueError(
+            "Comparison is supported only for single character alphabets"
+        )
+    return codec.sort_key
+
+
+def sorted_encoded(
+    numbers,
+    base,
+    alphabet=_DEFAULT_ALPHABET,
+    sign_literal=_DEFAULT_SIGN,
+    reverse=False,
+):
+    """
+    Sort numbers in given base and alphabet by their values without decoding
+
+    :param numbers: numbers in given base
+    :type numbers: collections.Iterable
+
+    :param base: base of numbers
+    :type base: int
+
+    :param alphabet: alphabet of numeric system, one character per digit
+    :type alphabet: tuple
+
+    :param sign_literal:
+    :type sign_literal: str
+
+    :param reverse: sort from the greatest number
+    :type reverse: bool
+
+    :return: sorted numbers, equal numbers keep their order
+    :rtype: list[str]
+    """
+    return sorted(numbers, key=sort_key(base, alphabet, sign_literal), reverse=reverse)
+
+
+########
+# Binary
+def to_binary(number):
+    """
+    To binary number representation from integer
+
+    :param number:
+    :type number: int | str
+
+    :return:
+    :rtype: str
+    """
+    return encode(number, 2)
+
+
+def from_binary(number):
+    """
+    To hexadecimal number representation from integer
+
+    :param number:
+    :type number: int | str
+
+    :return:
+    :rtype: str
+    """
+    return decode(number, 2)
+
+
+########
+# Octal
+def to_octal(number):
+    """
+    To hexadecimal number representation from integer
+
+    :param number:
+    :type number: int | str
+
+    :return:
+    :rtype: str
+    """
+    return encode(number, 8)
+
+
+def from_octal(number):
+    """
+    From hexadecimal number representation to integer
+
+    :param number:
+    :type number: int | str
+
+    :return:
+    :rtype: str
+    """
+    return decode(number, 8)
+
+
+########
+# Hexadecimal
+def to_hex(number):
+    """
+    To hexadecimal number representation from integer
+
+    :param number:
+    :type number: str
+
+    :return:
+    :rtype: str
+    """
+    return encode(number, 16)
+
+
+def from_hex(number):
+    """
+    From hexadecimal number representation to integer
+
+    :param number:
+    :type number: str
+
+    :return:
+    :rtype: str
+    """
+    return decode(number, 16)
+
+
+########
+# Arrays
+def _import_numpy():
+    """
+    Import optional numpy dependency
+
+    :return: numpy module
+    :rtype: module
+    """
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        raise ImportError(
+            "numpy is required for array conversion, "
+            "install it with `pip install numeral-system-py[numpy]`"
+        )
+
+    return numpy
+
+
+def _array_codes(codec):
+    """
+    Get code points of digits and sign of codec for vectorized conversion
+
+    :param codec: codec of numeral system
+    :type codec: Codec
+
+    :return: code points of digits in order of alphabet, code point of sign
+    :rtype: list, int
+    """
+    literals = codec.alphabet[0 : codec.base] + (codec.sign_literal,)
+    if any(len(literal) != 1 for literal in literals):
+        raise WrongArgumentValueError(
+            "Array conversion supports only single character digits and sign"
+        )
+
+    codes = [ord(literal) for literal in literals]
+    return codes[:-1], codes[-1]
+
+
+def _array_magnitudes(np, numbers, base):
+    """
+    Get signs, absolute values and amounts of digits of flat integer array
+
+    :param np: numpy module
+    :type np: module
+
+    :param numbers: flat array of integers
+    :type numbers: numpy.ndarray
+
+    :param base: base of numeral system
+    :type base: int
+
+    :return: mask of negative numbers, absolute values, amounts of digits
+    :rtype: numpy.ndarray, numpy.ndarray, numpy.ndarray
+    """
+    negative = numbers < 0
+    magnitude = numbers.astype(np.uint64)
+    # two's complement negation is correct even for minimal int64
+    magnitude[negative] = ~magnitude[negative] + np.uint64(1)
+
+    big_base = np.uint64(base)
+    lengths = np.ones(numbers.shape, dtype=np.intp)
+    rest = magnitude // big_base
+    while rest.any():
+        lengths += rest > 0
+        rest //= big_base
+
+    return negative, magnitude, lengths
+
+
+def _encode_array_into(np, codec, numbers, view, width, offset, pad):
+    """
+    Write integer array into fixed width slots of buffer at once
+
+    :param np: numpy module
+    :type np: module
+
+    :param codec: codec of numeral system
+    :type codec: Codec
+
+    :param numbers: array of integers up to 64 bits
+    :type numbers: numpy.ndarray
+
+    :param view: writable view of buffer
+    :type view: memoryview
+
+    :param width: amount of bytes of every slot
+    :type width: int
+
+    :param offset: index of the first byte of the first slot
+    :type offset: int
+
+    :param pad: padding byte
+    :type pad: bytes
+
+    :return: amount of written bytes
+    :rtype: int
+    """
+    digit_codes, sign_code = _array_codes(codec)
+    flat = numbers.ravel()
+    size = flat.size * width
+    if offset + size > len(view):
+        raise WrongArgumentValueError(
+            "Buffer of {} bytes is too small for all numbers".format(len(view))
+        )
+
+    negative, magnitude, lengths = _array_magnitudes(np, flat, codec.base)
+    if flat.size and int((lengths + negative).max()) > width:
+        raise NumberOutOfRangeError(
+            "Numbers need {} bytes, but width is {}".format(
+                int((lengths + negative).max()), width
+            )
+        )
+
+    matrix = np.frombuffer(view, dtype=np.uint8, count=size, offset=offset)
+    matrix = matrix.reshape(flat.size, width)
+    matrix[:] = ord(pad)
+
+    codes = np.array(digit_codes, dtype=np.uint8)
+    rows = np.arange(flat.size)
+    big_base = np.uint64(codec.base)
+    rest = magnitude
+    for position in range(int(lengths.max()) if flat.size else 0):
+        rest, digits = np.divmod(rest, big_base)
+        active = lengths > position
+        matrix[rows[active], width - 1 - position] = codes[digits[active]]
+
+    # sign is written before zero padding and after any other padding
+    sign_column = 0 if ord(pad) == digit_codes[0] else width - 1 - lengths
+    matrix[
+        rows[negative], np.broadcast_to(sign_column, rows.shape)[negative]
+    ] = sign_code
+    return size
+
+
+def encode_array(
+    numbers, base, alphabet=_DEFAULT_ALPHABET, sign_literal=_DEFAULT_SIGN, output="U"
+):
+    """
+    Convert array of fixed width integers to given base and alphabet
+
+    All numbers are converted at once: digits are extracted by repeated division of
+    the whole array and written to a character matrix.
+
+    :param numbers: array of integers up to 64 bits
+    :type numbers: numpy.ndarray
+
+    :param base: base of numeral system
+    :type base: int
+
+    :param alphabet: alphabet of numeric system
+    :type alphabet: tuple
+
+    :param sign_literal:
+    :type sign_literal: str
+
+    :param output: "U" for unicode array, "S" for bytes array, "matrix" for uint8
+        matrix with one more dimension where each number is left aligned and padded
+        with zero bytes
+    :type output: str
+
+    :return: converted numbers of the same shape
+    :rtype: numpy.ndarray
+    """
+    np = _import_numpy()
+    codec = _get_codec(base, alphabet, sign_literal)
+    digit_codes, sign_code = _array_codes(codec)
+
+    if output not in ("U", "S", "matrix"):
+        raise WrongArgumentValueError(
+            "Output should be one of 'U', 'S', 'matrix', not {}".format(output)
+        )
+
+    numbers = np.asarray(numbers)
+    if numbers.dtype.kind not in "iu" or numbers.dtype.itemsize > 8:
+        raise WrongArgumentTypeError(
+            "Array of integers is expected, but {} was given".format(numbers.dtype)
+        )
+
+    char_type = np.uint32
+    if output != "U":
+        if max(digit_codes + [sign_code]) > 0xFF:
+            raise WrongArgumentValueError(
+                "Alphabet and sign should be single byte characters for bytes output"
+            )
+        char_type = np.uint8
+
+    flat = numbers.ravel()
+    negative, magnitude, lengths = _array_magnitudes(np, flat, base)
+    big_base = np.uint64(base)
+
+    ends = lengths + negative
+    width = int(ends.max()) if flat.size else 1
+
+    codes = np.array(digit_codes, dtype=char_type)
+    matrix = np.zeros((flat.size, width), dtype=char_type)
+    matrix[negative, 0] = sign_code
+    rows = np.arange(flat.size)
+    rest = magnitude
+    for position in range(int(lengths.max()) if flat.size else 0):
+        rest, digits = np.divmod(rest, big_base)
+        active = lengths > position
+        matrix[rows[active], ends[active] - 1 - position] = codes[digits[active]]
+
+    if output == "matrix":
+        return matrix.reshape(numbers.shape + (width,))
+
+    return matrix.view("{}{}".format(output, width)).reshape(numbers.shape)
+
+
+def decode_array(
+    numbers,
+    base,
+    alphabet=_DEFAULT_ALPHABET,
+    sign_literal=_DEFAULT_SIGN,
+    dtype="int64",
+):
+    """
+    Convert array of strings in given base and alphabet to fixed width integers
+
+    Invalid numbers, empty strings and numbers which don't fit into dtype are not
+    raised, but marked in the returned mask and decoded as zero.
+
+    :param numbers: array of strings or bytes
+    :type numbers: numpy.ndarray
+
+    :param base: base of numeral system
+    :type base: int
+
+    :param alphabet: alphabet of numeric system
+    :type alphabet: tuple
+
+    :param sign_literal:
+    :type sign_literal: str
+
+    :param dtype: integer type of result up to 64 bits
+    :type dtype: numpy.dtype | str
+
+    :return: converted numbers and mask of invalid numbers, both of the same shape
+    :rtype: numpy.ndarray, numpy.ndarray
+    """
+    np = _import_numpy()
+    codec = _get_codec(base, alphabet, sign_literal)
+    digit_codes, sign_code = _array_codes(codec)
+
+    dtype = np.dtype(dtype)
+    if dtype.kind not in "iu" or dtype.itemsize > 8:
+        raise WrongArgumentTypeError(
+            "Integer type is expected for result, but {} was given".format(dtype)
+        )
+
+    numbers = np.asarray(numbers)
+    if numbers.dtype.kind not in "US":
+        raise WrongArgumentTypeError(
+            "Array of strings is expected, but {} was given".format(numbers.dtype)
+        )
+
+    char_type = np.uint32 if numbers.dtype.kind == "U" else np.uint8
+    char_size = np.dtype(char_type).itemsize
+    width = numbers.dtype.itemsize // char_size
+    flat = np.ascontiguousarray(numbers).reshape(-1)
+    matrix = flat.view(char_type).reshape(flat.size, width)
+
+    # strings are padded with zero characters at the end
+    filled = matrix != 0
+    lengths = width - np.argmax(filled[:, ::-1], axis=1)
+    lengths[~filled.any(axis=1)] = 0
+
+    negative = (lengths > 0) & (matrix[:, 0] == sign_code)
+    starts = negative.astype(np.intp)
+    invalid = lengths <= starts
+
+    # digit values are found by binary search in sorted code points
+    order = np.argsort(digit_codes)
+    sorted_codes = np.array(digit_codes, dtype=np.uint32)[order]
+    positions = np.searchsorted(sorted_codes, matrix).clip(0, len(digit_codes) - 1)
+    known = sorted_codes[positions] == matrix
+    values = order[positions].astype(np.uint64)
+
+    info = np.iinfo(dtype)
+    limits = np.where(negative, np.uint64(-int(info.min)), np.uint64(info.max))
+    big_base = np.uint64(base)
+    result = np.zeros(flat.size, dtype=np.uint64)
+    for position in range(width):
+        active = (starts <= position) & (lengths > position) & ~invalid
+        digits = np.where(active, values[:, position], np.uint64(0))
+        invalid |= active & ~known[:, position]
+        # difference wraps around when digit is above limit, so it's checked first
+        overflow = (digits > limits) | (result > (limits - digits) // big_base)
+        invalid |= active & overflow
+        active &= ~invalid
+        result = np.where(active, result * big_base + digits, result)
+
+    result[invalid] = 0
+    result[negative] = ~result[negative] + np.uint64(1)
+    if dtype.kind == "i":
+        result = result.view(np.int64)
+
+    return (
+        result.astype(dtype).reshape(numbers.shape),
+        invalid.reshape(numbers.shape),
+    )
+
+
+########
+# Files
+_WHITESPACE = b" \t\r\n\x0b\x0c"
+
+
+def _file_chunks(data, delimiter, width, chunk_size):
+    """
+    Split memory mapped file into chunks of whole records
+
+    :param data: content of file
+    :type data: mmap.mmap
+
+    :param delimiter: separator of records
+    :type delimiter: bytes
+
+    :param width: size of record in bytes, delimiter is used if it is None
+    :type width: int | None
+
+    :param chunk_size: approximate amount of bytes in chunk
+    :type chunk_size: int
+
+    :return: generator of chunks
+    :rtype: collections.Iterator[bytes]
+    """
+    if width is not None:
+        chunk_size = max(chunk_size // width, 1) * width
+
+    start, size = 0, len(data)
+    while start < size:
+        end = min(start + chunk_size, size)
+        if width is None and end < size:
+            cut = data.rfind(delimiter, start, end)
+            if cut < 0:
+                # record is longer than chunk
+                cut = data.find(delimiter, end)
+            end = size if cut < 0 else cut + len(delimiter)
+
+        yield data[start:end]
+        start = end
+
+
+def _chunk_records(chunk, delimiter, width):
+    """
+    Split chunk into stripped non-empty records
+
+    :param chunk: whole records
+    :type chunk: bytes
+
+    :param delimiter: separator of records
+    :type delimiter: bytes
+
+    :param width: size of record in bytes, delimiter is used if it is None
+    :type width: int | None
+
+    :return: records
+    :rtype: list[bytes]
+    """
+    if width is None:
+        records = chunk.split(delimiter)
+    else:
+        records = [
+            chunk[index : index + width] for index in range(0, len(chunk), width)
+        ]
+        # width includes delimiter, which ends every record of delimited file
+        records = [
+            record[: -len(delimiter)] if record.endswith(delimiter) else record
+            for record in records
+        ]
+
+    return list(filter(None, map(bytes.strip, records)))
+
+
+def _builtin_file_tables(codec, delimiter):
+    """
+    Get tables for decoding of records by builtin int()
+
+    :param codec: codec of numeral system
+    :type codec: Codec
+
+    :param delimiter: separator of records
+    :type delimiter: bytes
+
+    :return: bytes which are allowed in file and translation of digits and sign
+        to int() syntax, None if builtin int() can't be used
+    :rtype: (bytes, bytes | None) | None
+    """
+    if not codec.single_byte or codec.base > len(_LOWER_ALPHABET):
+        return None
+
+    digits = "".join(codec.alphabet[0 : codec.base]).encode("latin-1")
+    sign = codec.sign_literal.encode("latin-1")
+    if len(sign) != 1 or set(digits + sign) & set(_WHITESPACE + delimiter):
+        return None
+
+    canonical = "".join(_LOWER_ALPHABET[0 : codec.base]).encode("ascii")
+    table = None
+    if digits + sign != canonical + b"-":
+        table = bytes.maketrans(digits + sign, canonical + b"-")
+
+    return digits + sign + _WHITESPACE + delimiter, table
+
+
+def _decode_records(codec, records, first_index):
+    """
+    Decode records one by one with validation
+
+    :param codec: codec of numeral system
+    :type codec: Codec
+
+    :param records: stripped records
+    :type records: list[bytes]
+
+    :param first_index: index of the first record in file
+    :type first_index: int
+
+    :return: decoded numbers
+    :rtype: list[int]
+    """
+    values = []
+    for index, record in enumerate(records):
+        try:
+            values.append(codec.decode(record))
+        except IncorrectNumberRepresentationError as e:
+            raise IncorrectNumberRepresentationError(
+                "Record {} {!r}: {}".format(first_index + index, record, e)
+            ) from e
+
+    return values
+
+
+def decode_file(
+    path,
+    base,
+    alphabet=_DEFAULT_ALPHABET,
+    sign_literal=_DEFAULT_SIGN,
+    delimiter=b"\n",
+    width=None,
+    output="array",
+    chunk_size=1 << 20,
+):
+    """
+    Convert file of numbers in given base and alphabet to array of 64 bit integers
+
+    File is memory mapped and converted by chunks. Records are separated by
+    delimiter or have fixed width, whitespace around numbers is ignored as well as
+    empty records. Records of single byte alphabets up to base 36 are validated and
+    converted by builtin int() for the whole chunk at once.
+
+    :param path: path of file
+    :type path: str
+
+    :param base: base of numeral system
+    :type base: int
+
+    :param alphabet: alphabet of numeric system, single byte digits
+    :type alphabet: tuple
+
+    :param sign_literal:
+    :type sign_literal: str
+
+    :param delimiter: separator of records
+    :type delimiter: bytes
+
+    :param width: size of record in bytes including delimiter if it is present,
+        records are split by delimiter if width is not given
+    :type width: int | None
+
+    :param output: "array" for array.array of "q" type, "numpy" for int64 array
+    :type output: str
+
+    :param chunk_size: approximate amount of bytes which are converted at once
+    :type chunk_size: int
+
+    :return: converted numbers, numbers which don't fit into 64 bits are zero in
+        array and are listed with their indexes separately
+    :rtype: (array.array | numpy.ndarray, list[(int, int)])
+    """
+    codec = _get_codec(base, alphabet, sign_literal)
+    if output not in ("array", "numpy"):
+        raise WrongArgumentValueError(
+            "Output should be 'array' or 'numpy', not {}".format(output)
+        )
+    if not delimiter or (width is not None and width < 1) or chunk_size < 1:
+        raise WrongArgumentValueError(
+            "Delimiter should not be empty, width and chunk size should be positive"
+        )
+
+    np = _import_numpy() if output == "numpy" else None
+    tables = _builtin_file_tables(codec, delimiter)
+    values = array("q")
+    spilled = []
+    with open(path, "rb") as stream:
+        if os.fstat(stream.fileno()).st_size == 0:
+            data = b""
+        else:
+            data = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            for chunk in _file_chunks(data, delimiter, width, chunk_size):
+                numbers = None
+                if tables is not None and not chunk.translate(None, tables[0]):
+                    canonical = (
+                        chunk if tables[1] is None else chunk.translate(tables[1])
+                    )
+                    records = _chunk_records(canonical, delimiter, width)
+                    try:
+                        numbers = list(map(int, records, repeat(base)))
+                    except ValueError:
+                        # misplaced sign or huge number, records are decoded one by one
+                        pass
+
+                if numbers is None:
+                    records = _chunk_records(chunk, delimiter, width)
+                    numbers = _decode_records(codec, records, len(values))
+
+                try:
+                    numbers = array("q", numbers)
+                except OverflowError:
+                    for number in numbers:
+                        if -(1 << 63) <= number < (1 << 63):
+                            values.append(number)
+                        else:
+                            spilled.append((len(values), number))
+                            values.append(0)
+                else:
+                    values.extend(numbers)
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+
+    if np is not None:
+        values = (
+            np.frombuffer(values, dtype=np.int64) if values else np.zeros(0, np.int64)
+        )
+
+    return values, spilled
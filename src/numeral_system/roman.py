@@ -1,8 +1,9 @@
 """
 This package contains functions for converting integer into roman and backward
 """
-import re
+import os
 
+from . import _stream, instrumentation, positional
 from .exceptions import (
     IncorrectNumberRepresentationError,
     NumberOutOfRangeError,
@@ -26,6 +27,63 @@ _ALPHABET = (
     (1, "I"),
 )
 
+_MAX_NUMBER = 3999
+
+# (int -> str tuple, str -> int dict), built on first use
+_TABLES = None
+
+# all prefixes of roman numbers, built on the first batch validation
+_PREFIXES = None
+
+
+def _compose(number):
+    """
+    Compose roman representation of number symbol by symbol
+
+    :param number: integer number from 1 to 3999
+    :type number: int
+
+    :return: roman number as string
+    :rtype: str
+    """
+    result = []
+    for num, view in _ALPHABET:
+        count, number = divmod(number, num)
+        result.append(view * count)
+
+    return "".join(result)
+
+
+def _tables():
+    """
+    Get lookup tables for the whole roman domain
+
+    :return: tuple where index is number and value is roman representation (index 0
+        is not used), dict from roman representation to number
+    :rtype: tuple, dict
+    """
+    global _TABLES  # pylint: disable=global-statement
+
+    if _TABLES is None:
+        encode_table = ("",) + tuple(
+            _compose(number) for number in range(1, _MAX_NUMBER + 1)
+        )
+        decode_table = {view: number for number, view in enumerate(encode_table)}
+        del decode_table[""]
+        _TABLES = encode_table, decode_table
+
+    return _TABLES
+
+
+def build_tables():
+    """
+    Build lookup tables now instead of on the first conversion
+
+    Tables are built at import time if NUMERAL_SYSTEM_ROMAN_EAGER environment
+    variable is set to 1, which is useful for latency critical services.
+    """
+    _tables()
+
 
 def is_valid(number):
     """
@@ -37,9 +95,77 @@ def is_valid(number):
     :return: True or False
     :rtype: bool
     """
-    return re.match(
-        r"^(M{0,3})(D?C{0,3}|C[DM])(L?X{0,3}|X[LC])(V?I{0,3}|I[VX])$", number
-    )
+    if instrumentation.enabled:
+        return instrumentation.call("roman.is_valid", _is_valid, number)
+
+    return _is_valid(number)
+
+
+def _is_valid(number):
+    """
+    Check if number is roman, see is_valid
+    """
+    return number in _tables()[1]
+
+
+def _prefixes():
+    """
+    Get set of all prefixes of roman numbers
+
+    :return: prefixes including whole numbers
+    :rtype: frozenset
+    """
+    global _PREFIXES  # pylint: disable=global-statement
+
+    if _PREFIXES is None:
+        _PREFIXES = frozenset(
+            view[:length] for view in _tables()[1] for length in range(1, len(view) + 1)
+        )
+
+    return _PREFIXES
+
+
+def _first_invalid(number):
+    """
+    Find offset of the first character which can't continue roman number
+
+    :param number: string to check
+    :type number: str
+
+    :return: offset of the first invalid character or -1 for valid number
+    :rtype: int
+    """
+    if not isinstance(number, str):
+        return 0
+
+    if number in _tables()[1]:
+        return -1
+
+    prefixes = _prefixes()
+    for length in range(1, len(number) + 1):
+        if number[:length] not in prefixes:
+            return length - 1
+
+    return len(number)
+
+
+def validate_many(numbers, result="offsets"):
+    """
+    Check a lot of roman numbers and find where they become invalid
+
+    :param numbers: strings to check
+    :type numbers: collections.Iterable
+
+    :param result: "offsets" to get offsets of the first character which can't
+        continue roman number, where -1 means valid number, "mask" to get integer
+        where bit i is set if i-th number is valid
+    :type result: str
+
+    :return: offsets or bit mask
+    :rtype: array.array | int
+    """
+    _stream.check_validation_result(result)
+    return _stream.validate_items(_first_invalid, numbers, result)
 
 
 def encode(number):
@@ -52,6 +178,16 @@ def encode(number):
     :return: roman number as string
     :rtype: str
     """
+    if instrumentation.enabled:
+        return instrumentation.call("roman.encode", _encode, number)
+
+    return _encode(number)
+
+
+def _encode(number):
+    """
+    Convert integer to roman number, see encode
+    """
     if not isinstance(number, int):
         raise WrongArgumentTypeError(
             "Integer number is expected, but {} was given".format(type(number))
@@ -63,19 +199,12 @@ def encode(number):
     if number == 0:
         raise NumberOutOfRangeError("Zero values is not allowed in roman")
 
-    if number > 3999:
+    if number > _MAX_NUMBER:
         raise NumberOutOfRangeError(
             r"Number is too big - roman numbers can\'t be greater or equal 4000"
         )
 
-    # TODO Binary search
-    result = ""
-    for num, view in _ALPHABET:
-        while number >= num:
-            number -= num
-            result += view
-
-    return result
+    return _tables()[0][number]
 
 
 def decode(number):
@@ -88,6 +217,16 @@ def decode(number):
     :return: integer number
     :rtype: int
     """
+    if instrumentation.enabled:
+        return instrumentation.call("roman.decode", _decode, number)
+
+    return _decode(number)
+
+
+def _decode(number):
+    """
+    Convert roman number to integer, see decode
+    """
     if not isinstance(number, str):
         raise WrongArgumentTypeError(
             "Wrong type of roman number: expected string but {} was given".format(
@@ -95,20 +234,242 @@ def decode(number):
             )
         )
 
-    if not is_valid(number):
+    result = _tables()[1].get(number)
+    if result is None:
         raise IncorrectNumberRepresentationError(
             "It's not a roman string {}".format(number)
         )
 
-    result = 0
-    remain = number
-    for num, view in _ALPHABET:
-        while True:
-            if remain.startswith(view):
-                roman_view_len = len(view)
-                _, remain = remain[:roman_view_len], remain[roman_view_len:]
-                result += num
-            else:
-                break
-
     return result
+
+
+def _encode_error(number):
+    """
+    Get code of error which encode raises for number
+
+    :return: code of error or 0 if number is valid
+    :rtype: int
+    """
+    if not isinstance(number, int):
+        return WrongArgumentTypeError.code
+
+    if number < 1 or number > _MAX_NUMBER:
+        return NumberOutOfRangeError.code
+
+    return 0
+
+
+def _decode_error(number):
+    """
+    Get code of error which decode raises for number
+
+    :return: code of error or 0 if number is valid
+    :rtype: int
+    """
+    if not isinstance(number, str):
+        return WrongArgumentTypeError.code
+
+    if number not in _tables()[1]:
+        return IncorrectNumberRepresentationError.code
+
+    return 0
+
+
+def try_encode(number):
+    """
+    Convert integer to roman number without raising exception for invalid number
+
+    :param number: integer number
+    :type number: int
+
+    :return: roman number or numeral_system.Failure
+    :rtype: str | numeral_system.Failure
+    """
+    return _stream.try_item(_encode_error, encode, number)
+
+
+def try_decode(number):
+    """
+    Convert roman number to integer without raising exception for invalid number
+
+    :param number: roman number as string
+    :type number: str
+
+    :return: integer number or numeral_system.Failure
+    :rtype: int | numeral_system.Failure
+    """
+    return _stream.try_item(_decode_error, decode, number)
+
+
+def try_encode_many(numbers):
+    """
+    Convert a lot of integers to roman numbers, invalid ones are reported by error
+    codes
+
+    Use try_encode for invalid number to get its exception.
+
+    :param numbers: numbers to convert
+    :type numbers: collections.Iterable
+
+    :return: roman numbers with None for invalid ones, and codes of errors where 0
+        means success, see numeral_system.exceptions.ERROR_CLASSES
+    :rtype: (list, array.array)
+    """
+    return _stream.try_items(_encode_error, encode, numbers)
+
+
+def try_decode_many(numbers):
+    """
+    Convert a lot of roman numbers to integers, invalid ones are reported by error
+    codes
+
+    Use try_decode for invalid number to get its exception.
+
+    :param numbers: roman numbers to convert
+    :type numbers: collections.Iterable
+
+    :return: integer numbers with None for invalid ones, and codes of errors where
+        0 means success, see numeral_system.exceptions.ERROR_CLASSES
+    :rtype: (list, array.array)
+    """
+    return _stream.try_items(_decode_error, decode, numbers)
+
+
+def iter_encode(numbers, errors="raise", chunk_size=_stream.DEFAULT_CHUNK_SIZE):
+    """
+    Lazily convert integer numbers to roman numbers
+
+    :param numbers: iterable of numbers or text file with one decimal number per line
+    :type numbers: collections.Iterable | io.TextIOBase
+
+    :param errors: "raise" to propagate exception, "skip" to drop invalid number,
+        "marker" to yield numeral_system.ErrorMarker instead of result
+    :type errors: str
+
+    :param chunk_size: amount of characters which are read from file at once
+    :type chunk_size: int
+
+    :return: generator of roman numbers
+    :rtype: collections.Iterator[str | numeral_system.ErrorMarker]
+    """
+    _stream.check_error_policy(errors)
+    _tables()
+    if not _stream.is_text_file(numbers):
+        return _stream.iter_convert(encode, numbers, errors)
+
+    def encode_line(line):
+        return encode(positional.decode(line, 10))
+
+    lines = _stream.iter_lines(numbers, chunk_size)
+    return _stream.iter_convert(encode_line, lines, errors)
+
+
+def iter_decode(numbers, errors="raise", chunk_size=_stream.DEFAULT_CHUNK_SIZE):
+    """
+    Lazily convert roman numbers to integer numbers
+
+    :param numbers: iterable of roman numbers or text file with one number per line
+    :type numbers: collections.Iterable | io.TextIOBase
+
+    :param errors: "raise" to propagate exception, "skip" to drop invalid number,
+        "marker" to yield numeral_system.ErrorMarker instead of result
+    :type errors: str
+
+    :param chunk_size: amount of characters which are read from file at once
+    :type chunk_size: int
+
+    :return: generator of integer numbers
+    :rtype: collections.Iterator[int | numeral_system.ErrorMarker]
+    """
+    _stream.check_error_policy(errors)
+    _tables()
+    if _stream.is_text_file(numbers):
+        numbers = _stream.iter_lines(numbers, chunk_size)
+
+    return _stream.iter_convert(decode, numbers, errors)
+
+
+def _encode_chunk(numbers):
+    """
+    Convert chunk of numbers in worker process
+
+    :return: roman numbers
+    :rtype: list
+    """
+    return [encode(number) for number in numbers]
+
+
+def _decode_chunk(numbers):
+    """
+    Convert chunk of roman numbers in worker process
+
+    :return: integer numbers
+    :rtype: list
+    """
+    return [decode(number) for number in numbers]
+
+
+def encode_many(
+    numbers, workers=None, executor=None, chunk_size=_stream.DEFAULT_BATCH_SIZE
+):
+    """
+    Convert a lot of integer numbers to roman numbers in worker processes
+
+    Numbers are split into chunks which are converted in parallel, results are
+    yielded lazily in the order of input. Tables are built once per worker.
+
+    :param numbers: numbers to convert
+    :type numbers: collections.Iterable
+
+    :param workers: amount of processes in own process pool, conversion is done in
+        current process if neither workers nor executor is given
+    :type workers: int | None
+
+    :param executor: executor to use instead of own process pool
+    :type executor: concurrent.futures.Executor | None
+
+    :param chunk_size: amount of numbers which are sent to worker at once
+    :type chunk_size: int
+
+    :return: generator of roman numbers
+    :rtype: collections.Iterator[str]
+    """
+    _stream.check_batch_arguments(workers, executor, chunk_size)
+    return _stream.map_chunks(
+        _encode_chunk, numbers, chunk_size, workers, executor, build_tables
+    )
+
+
+def decode_many(
+    numbers, workers=None, executor=None, chunk_size=_stream.DEFAULT_BATCH_SIZE
+):
+    """
+    Convert a lot of roman numbers to integer numbers in worker processes
+
+    Numbers are split into chunks which are converted in parallel, results are
+    yielded lazily in the order of input. Tables are built once per worker.
+
+    :param numbers: roman numbers to convert
+    :type numbers: collections.Iterable
+
+    :param workers: amount of processes in own process pool, conversion is done in
+        current process if neither workers nor executor is given
+    :type workers: int | None
+
+    :param executor: executor to use instead of own process pool
+    :type executor: concurrent.futures.Executor | None
+
+    :param chunk_size: amount of numbers which are sent to worker at once
+    :type chunk_size: int
+
+    :return: generator of integer numbers
+    :rtype: collections.Iterator[int]
+    """
+    _stream.check_batch_arguments(workers, executor, chunk_size)
+    return _stream.map_chunks(
+        _decode_chunk, numbers, chunk_size, workers, executor, build_tables
+    )
+
+
+if os.environ.get("NUMERAL_SYSTEM_ROMAN_EAGER") == "1":
+    build_tables()
@@ -0,0 +1,680 @@
+"""
+Local conversion service
+
+Run ``python -m numeral_system.serve --help`` to see available options.
+
+Protocol is line based, every request is answered by a line in the order of
+requests, so requests can be pipelined::
+
+    encode BASE NUMBER [ALPHABET]    ->  ok DIGITS
+    decode BASE DIGITS [ALPHABET]    ->  ok NUMBER
+    roman_encode NUMBER              ->  ok ROMAN
+    roman_decode ROMAN               ->  ok NUMBER
+                                         error EXCEPTION MESSAGE
+
+Integer numbers are decimal, alphabet is a string of single character digits.
+Concurrent requests are grouped into batches, which are converted at once in
+the event loop or in worker processes.
+"""
+import argparse
+import asyncio
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from . import _stream, exceptions, positional, roman
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Allowed amounts of arguments of commands
+_COMMANDS = {
+    "encode": (2, 3),
+    "decode": (2, 3),
+    "roman_encode": (1,),
+    "roman_decode": (1,),
+}
+
+
+def _format_error(error):
+    """
+    Format exception as response line
+
+    :param error: exception raised by conversion
+    :type error: BaseException
+
+    :return: response line
+    :rtype: str
+    """
+    message = " ".join(str(error).split())
+    return "error {} {}".format(type(error).__name__, message)
+
+
+def _converter(command, base, alphabet):
+    """
+    Get conversion function which works with protocol tokens
+
+    :param command: name of command
+    :type command: str
+
+    :param base: base of positional numeral system
+    :type base: int | None
+
+    :param alphabet: alphabet of positional numeral system
+    :type alphabet: tuple | None
+
+    :return: function from token to result token
+    :rtype: callable
+    """
+    decimal = positional.get_codec(10)
+    if command == "roman_encode":
+        return lambda token: roman.encode(decimal.decode(token))
+
+    if command == "roman_decode":
+        return lambda token: str(roman.decode(token))
+
+    codec = positional.get_codec(base, alphabet or positional.DEFAULT_ALPHABET)
+    if command == "encode":
+        return lambda token: codec.encode(decimal.decode(token))
+
+    return lambda token: decimal.encode(codec.decode(token))
+
+
+def _convert_batch(command, base, alphabet, tokens):
+    """
+    Convert batch of tokens of the same command
+
+    :param command: name of command
+    :type command: str
+
+    :param base: base of positional numeral system
+    :type base: int | None
+
+    :param alphabet: alphabet of positional numeral system
+    :type alphabet: tuple | None
+
+    :param tokens: arguments of requests
+    :type tokens: list[str]
+
+    :return: response lines
+    :rtype: list[str]
+    """
+    try:
+        converter = _converter(command, base, alphabet)
+    except exceptions.NumericSystemException as e:
+        return [_format_error(e)] * len(tokens)
+
+    return [
+        _format_error(result.error)
+        if isinstance(result, _stream.ErrorMarker)
+        else "ok " + result
+        for result in _stream.iter_convert(converter, tokens, errors="marker")
+    ]
+
+
+def _parse_request(line):
+    """
+    Parse request line
+
+    :param line: request line
+    :type line: bytes
+
+    :return: command, base, alphabet and argument of request
+    :rtype: (str, int | None, tuple | None, str)
+    """
+    try:
+        tokens = line.decode("utf-8").split()
+    except UnicodeDecodeError as e:
+        raise exceptions.WrongArgumentValueError("Request should be UTF-8 text") from e
+
+    command = tokens[0] if tokens else ""
+    arguments = _COMMANDS.get(command)
+    if arguments is None:
+        raise exceptions.WrongArgumentValueError(
+            "Unknown command {!r}, expected one of {}".format(
+                command, ", ".join(sorted(_COMMANDS))
+            )
+        )
+
+    if len(tokens) - 1 not in arguments:
+        raise exceptions.WrongArgumentValueError(
+            "Wrong amount of arguments of command {}".format(command)
+        )
+
+    if command.startswith("roman_"):
+        return command, None, None, tokens[1]
+
+    # isdigit() alone accepts digits like "²", which int() rejects
+    if not (tokens[1].isascii() and tokens[1].isdigit()):
+        raise exceptions.WrongArgumentValueError(
+            "Base should be integer, not {!r}".format(tokens[1])
+        )
+
+    alphabet = tuple(tokens[3]) if len(tokens) > 3 else None
+    return command, int(tokens[1]), alphabet, tokens[2]
+
+
+class ConversionServer:
+    """
+    Server which converts concurrent requests in batches
+
+    :ivar batch_size: maximal amount of requests in batch
+    :ivar batch_delay: seconds to wait for more requests before conversion of
+        incomplete batch
+    :ivar max_pending: amount of requests which are waiting for conversion in
+        server and in one connection, reading of requests is paused when it is
+        reached
+    :ivar max_line: maximal length of request line in bytes
+    """
+
+    def __init__(
+        self,
+        batch_size=256,
+        batch_delay=0.001,
+        max_pending=4096,
+        max_line=1 << 20,
+        workers=None,
+    ):
+        """
+        :param workers: amount of processes which convert batches, batches are
+            converted in the event loop by default
+        :type workers: int | None
+        """
+        if batch_size < 1 or max_pending < 1 or batch_delay < 0:
+            raise exceptions.WrongArgumentValueError(
+                "Batch size and max pending should be positive, "
+                "batch delay should not be negative"
+            )
+
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.max_pending = max_pending
+        self.max_line = max_line
+
+        self._workers = workers
+        self._executor = None
+        self._queue = None
+        self._batcher = None
+        self._servers = []
+        # reader, writer and future which is done when connection is served
+        self._connections = set()
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT, path=None):
+        """
+        Start listening of TCP port or Unix socket
+
+        :param host: host of TCP server
+        :type host: str
+
+        :param port: TCP port, 0 to choose free one
+        :type port: int
+
+        :param path: path of Unix socket to listen instead of TCP port
+        :type path: str | None
+
+        :return: listening sockets
+        :rtype: list[socket.socket]
+        """
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.max_pending)
+            self._batcher = asyncio.ensure_future(self._convert_batches())
+            if self._workers:
+                self._executor = ProcessPoolExecutor(self._workers)
+
+        if path is not None:
+            server = await asyncio.start_unix_server(
+                self._handle, path, limit=self.max_line
+            )
+        else:
+            server = await asyncio.start_server(
+                self._handle, host, port, limit=self.max_line
+            )
+        self._servers.append(server)
+        return server.sockets
+
+    async def close(self, timeout=5.0):
+        """
+        Stop listening, close connections and stop converting
+
+        Requests which are already received are answered before connection is
+        closed, connections which are not served in timeout are aborted.
+
+        :param timeout: seconds to wait for connections
+        :type timeout: float
+        """
+        for server in self._servers:
+            server.close()
+
+        connections = list(self._connections)
+        for reader, _, _ in connections:
+            reader.feed_eof()
+        if connections:
+            await asyncio.wait(
+                [served for _, _, served in connections], timeout=timeout
+            )
+        for _, writer, served in connections:
+            if not served.done():
+                writer.transport.abort()
+
+        for server in self._servers:
+            await server.wait_closed()
+        self._servers = []
+
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+            self._batcher = self._queue = None
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def _handle(self, reader, writer):
+        """
+        Serve connection
+
+        :param reader: stream of requests
+        :type reader: asyncio.StreamReader
+
+        :param writer: stream of responses
+        :type writer: asyncio.StreamWriter
+        """
+        loop = asyncio.get_running_loop()
+        connection = reader, writer, loop.create_future()
+        self._connections.add(connection)
+        responses = asyncio.Queue(self.max_pending)
+        sender = asyncio.ensure_future(self._send(responses, writer))
+        try:
+            await self._receive(reader, responses)
+            await responses.put(None)
+            await sender
+        finally:
+            # when receiving fails, responses which are not sent yet are dropped
+            # instead of waiting for requests which are never converted
+            sender.cancel()
+            while not responses.empty():
+                future = responses.get_nowait()
+                if future is not None:
+                    future.cancel()
+            writer.close()
+            self._connections.discard(connection)
+            connection[2].set_result(None)
+
+    async def _receive(self, reader, responses):
+        """
+        Read requests and queue them for conversion
+
+        :param reader: stream of requests
+        :type reader: asyncio.StreamReader
+
+        :param responses: futures of response lines in the order of requests
+        :type responses: asyncio.Queue
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            future = loop.create_future()
+            try:
+                line = await reader.readline()
+            except ValueError:
+                error = exceptions.WrongArgumentValueError(
+                    "Request is longer than {} bytes".format(self.max_line)
+                )
+                future.set_result(_format_error(error))
+                await responses.put(future)
+                return
+
+            if not line:
+                return
+
+            # waits while client does not read responses
+            await responses.put(future)
+            try:
+                request = _parse_request(line)
+            except exceptions.NumericSystemException as e:
+                future.set_result(_format_error(e))
+                continue
+
+            # waits while server is busy
+            await self._queue.put((request, future))
+
+    @staticmethod
+    async def _send(responses, writer):
+        """
+        Write responses in the order of requests
+
+        :param responses: futures of response lines, None at the end
+        :type responses: asyncio.Queue
+
+        :param writer: stream of responses
+        :type writer: asyncio.StreamWriter
+        """
+        try:
+            while True:
+                future = await responses.get()
+                if future is None:
+                    return
+
+                writer.write((await future).encode("utf-8") + b"\n")
+                if responses.empty():
+                    await writer.drain()
+        except ConnectionError:
+            # the rest of requests is dropped, client is gone
+            while True:
+                future = await responses.get()
+                if future is None:
+                    return
+                future.cancel()
+
+    async def _convert_batches(self):
+        """
+        Collect requests into batches and convert them
+        """
+        while True:
+            batch = [await self._queue.get()]
+            if self._queue.qsize() < self.batch_size - 1 and self.batch_delay:
+                await asyncio.sleep(self.batch_delay)
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            groups = {}
+            for (command, base, alphabet, token), future in batch:
+                groups.setdefault((command, base, alphabet), []).append((token, future))
+
+            await asyncio.gather(
+                *[self._convert_group(key, items) for key, items in groups.items()]
+            )
+
+    async def _convert_group(self, key, items):
+        """
+        Convert requests of the same command and numeral system
+
+        :param key: command, base and alphabet
+        :type key: tuple
+
+        :param items: arguments and futures of requests
+        :type items: list[tuple]
+        """
+        tokens = [token for token, _ in items]
+        executor = self._executor
+        try:
+            if executor is None:
+                lines = _convert_batch(*(key + (tokens,)))
+            else:
+                lines = await asyncio.get_running_loop().run_in_executor(
+                    executor, _convert_batch, *(key + (tokens,))
+                )
+        except Exception as e:  # pylint: disable=broad-except
+            # CancelledError is Exception before Python 3.8
+            if isinstance(e, asyncio.CancelledError):
+                raise
+
+            # requests of failed group are answered, so batcher keeps converting
+            lines = [_format_error(e)] * len(items)
+            if isinstance(e, BrokenProcessPool) and self._executor is executor:
+                # dead worker breaks pool for good, the next batches get new one
+                executor.shutdown(wait=False)
+                self._executor = ProcessPoolExecutor(self._workers)
+
+        for (_, future), line in zip(items, lines):
+            if not future.done():
+                future.set_result(line)
+
+
+class Client:
+    """
+    Client of conversion server, requests of concurrent tasks are pipelined
+    """
+
+    def __init__(self, reader, writer):
+        """
+        Use connect to create client
+
+        :param reader: stream of responses
+        :type reader: asyncio.StreamReader
+
+        :param writer: stream of requests
+        :type writer: asyncio.StreamWriter
+        """
+        self._reader = reader
+        self._writer = writer
+        self._pending = deque()
+        self._receiver = asyncio.ensure_future(self._receive())
+
+    @classmethod
+    async def connect(cls, host=DEFAULT_HOST, port=DEFAULT_PORT, path=None):
+        """
+        Connect to server
+
+        :param host: host of TCP server
+        :type host: str
+
+        :param port: TCP port
+        :type port: int
+
+        :param path: path of Unix socket to connect instead of TCP port
+        :type path: str | None
+
+        :return: connected client
+        :rtype: Client
+        """
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path, limit=1 << 30)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=1 << 30)
+        return cls(reader, writer)
+
+    async def close(self):
+        """
+        Close connection
+        """
+        self._writer.close()
+        self._receiver.cancel()
+        try:
+            await self._receiver
+        except asyncio.CancelledError:
+            pass
+
+    async def encode(self, number, base, alphabet=None):
+        """
+        Convert integer number to positional numeral system
+
+        :param number: given number to convert
+        :type number: int
+
+        :param base: base of numeral system
+        :type base: int
+
+        :param alphabet: single character digits
+        :type alphabet: tuple | str | None
+
+        :return: converted number
+        :rtype: str
+        """
+        return await self._request(
+            "encode", base, positional.encode(number, 10), alphabet
+        )
+
+    async def decode(self, number, base, alphabet=None):
+        """
+        Convert number from positional numeral system to integer
+
+        :param number: given number to convert
+        :type number: str
+
+        :param base: base of numeral system
+        :type base: int
+
+        :param alphabet: single character digits
+        :type alphabet: tuple | str | None
+
+        :return: converted number
+        :rtype: int
+        """
+        result = await self._request("decode", base, number, alphabet)
+        return positional.decode(result, 10)
+
+    async def roman_encode(self, number):
+        """
+        Convert integer from 1 to 3999 to roman number
+
+        :param number: integer number
+        :type number: int
+
+        :return: roman number
+        :rtype: str
+        """
+        return await self._request("roman_encode", number)
+
+    async def roman_decode(self, number):
+        """
+        Convert roman number to integer
+
+        :param number: roman number
+        :type number: str
+
+        :return: integer number
+        :rtype: int
+        """
+        return int(await self._request("roman_decode", number))
+
+    async def _request(self, command, *arguments):
+        """
+        Send request and wait for response
+
+        :param command: name of command
+        :type command: str
+
+        :param arguments: arguments of command, None is skipped
+        :type arguments: tuple
+
+        :return: result token
+        :rtype: str
+        """
+        tokens = [command]
+        for argument in arguments:
+            if argument is None:
+                continue
+            if not isinstance(argument, str):
+                argument = (
+                    "".join(argument) if isinstance(argument, tuple) else str(argument)
+                )
+            if not argument or len(argument.split()) != 1:
+                raise exceptions.WrongArgumentValueError(
+                    "Argument {!r} can't be sent to server".format(argument)
+                )
+            tokens.append(argument)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append(future)
+        self._writer.write(" ".join(tokens).encode("utf-8") + b"\n")
+        await self._writer.drain()
+
+        line = await future
+        status, _, result = line.partition(" ")
+        if status == "ok":
+            return result
+
+        name, _, message = result.partition(" ")
+        error = getattr(exceptions, name, None)
+        if not isinstance(error, type) or not issubclass(
+            error, exceptions.NumericSystemException
+        ):
+            error = exceptions.NumericSystemException
+        raise error(message)
+
+    async def _receive(self):
+        """
+        Match responses with requests
+        """
+        try:
+            while True:
+                line = await self._reader.readline()
+                if not line:
+                    break
+                self._pending.popleft().set_result(line.decode("utf-8").rstrip("\n"))
+        finally:
+            while self._pending:
+                self._pending.popleft().cancel()
+
+
+async def _serve(server, host, port, path):
+    """
+    Run server until it is cancelled
+
+    :param server: server to run
+    :type server: ConversionServer
+
+    :param host: host of TCP server
+    :type host: str
+
+    :param port: TCP port
+    :type port: int
+
+    :param path: path of Unix socket to listen instead of TCP port
+    :type path: str | None
+    """
+    sockets = await server.start(host, port, path)
+    for sock in sockets:
+        sys.stderr.write("Listening on {}\n".format(sock.getsockname()))
+
+    try:
+        await asyncio.get_running_loop().create_future()
+    finally:
+        await server.close()
+
+
+def main(argv=None):
+    """
+    Run server from command line
+
+    :param argv: command line arguments
+    :type argv: list[str] | None
+
+    :return: exit code
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m numeral_system.serve",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help="host of TCP server")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="TCP port")
+    parser.add_argument("--unix", help="path of Unix socket to listen instead of TCP")
+    parser.add_argument(
+        "--batch-size", type=int, default=256, help="maximal requests in batch"
+    )
+    parser.add_argument(
+        "--batch-delay",
+        type=float,
+        default=0.001,
+        help="seconds to wait for incomplete batch",
+    )
+    parser.add_argument(
+        "--max-pending",
+        type=int,
+        default=4096,
+        help="requests waiting for conversion before reading is paused",
+    )
+    parser.add_argument("--workers", type=int, help="processes which convert batches")
+    args = parser.parse_args(argv)
+
+    server = ConversionServer(
+        batch_size=args.batch_size,
+        batch_delay=args.batch_delay,
+        max_pending=args.max_pending,
+        workers=args.workers,
+    )
+    try:
+        asyncio.run(_serve(server, args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
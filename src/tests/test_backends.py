@@ -0,0 +1,146 @@
+"""
+Tests for arithmetic backends
+"""
+import os
+import subprocess
+import sys
+from random import getrandbits
+from unittest import TestCase
+
+from numeral_system import backends, exceptions, instrumentation, positional
+from parameterized import parameterized
+
+
+class LoopBackend(backends.Backend):
+    """
+    Backend of bases up to 36 which counts conversions
+    """
+
+    name = "loop"
+    max_base = 36
+
+    def __init__(self):
+        self.calls = 0
+
+    def digits(self, base):
+        return "0123456789abcdefghijklmnopqrstuvwxyz"[0:base]
+
+    def encode(self, number, base):
+        self.calls += 1
+        digits = []
+        while number:
+            number, digit = divmod(number, base)
+            digits.append(self.digits(base)[digit])
+        return "".join(reversed(digits)) or "0"
+
+    def decode(self, digits, base):
+        self.calls += 1
+        return int(digits, base)
+
+
+def _missing():
+    raise ImportError("not installed")
+
+
+class BackendsTestCase(TestCase):
+    """
+    Backend registry checks
+    """
+
+    def setUp(self):
+        self.backend = LoopBackend()
+        backends.register(self.backend.name, lambda: self.backend)
+        backends.register("missing", _missing)
+
+    def tearDown(self):
+        for name in (self.backend.name, "missing"):
+            backends._LOADERS.pop(name)
+            backends._LOADED.pop(name, None)
+        backends.select()
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_registry(self):
+        """
+        Check selection of registered and unavailable backends
+        """
+        self.assertEqual("python", backends.available()[0])
+        self.assertIn("loop", backends.available())
+        self.assertNotIn("missing", backends.available())
+
+        backends.select("loop")
+        self.assertEqual("loop", backends.current())
+        backends.select("python")
+        self.assertEqual("python", backends.current())
+        self.assertIsNone(backends.active)
+
+        with self.assertRaises(exceptions.WrongArgumentValueError):
+            backends.select("missing")
+        with self.assertRaises(exceptions.WrongArgumentValueError):
+            backends.select("unknown")
+        with self.assertRaises(exceptions.WrongArgumentValueError):
+            backends.register("auto", _missing)
+
+    @parameterized.expand(
+        [
+            ("decimal", 10, positional._DEFAULT_ALPHABET),
+            ("upper", 36, positional._DEFAULT_ALPHABET),
+            ("custom", 7, tuple("abcdefg")),
+        ]
+    )
+    def test_conversion(self, _, base, alphabet):
+        """
+        Check that selected backend converts big numbers like pure Python engine
+        """
+        number = -getrandbits(5000)
+        expected = positional.encode(number, base, alphabet)
+        backends.select("loop")
+        with instrumentation.recording() as stats:
+            self.assertEqual(expected, positional.encode(number, base, alphabet))
+            self.assertEqual(number, positional.decode(expected, base, alphabet))
+            self.assertEqual(
+                number, positional.decode(expected.encode(), base, alphabet)
+            )
+            self.assertEqual(255, positional.decode("FF", 16))
+
+        self.assertEqual(3, self.backend.calls)
+        self.assertEqual({"loop": 1}, stats["engines"]["positional.encode"])
+        self.assertEqual(2, stats["engines"]["positional.decode"]["loop"])
+
+    @parameterized.expand(
+        [
+            ("power_of_two", 16, positional._DEFAULT_ALPHABET),
+            ("big_base", 38, tuple("0123456789abcdefghijklmnopqrstuvwxyz@#")),
+            ("words", 3, ("zero", "one", "two")),
+        ]
+    )
+    def test_unsupported_codecs(self, _, base, alphabet):
+        """
+        Check that codecs which backend doesn't support keep pure Python engine
+        """
+        number = getrandbits(5000)
+        backends.select("loop")
+        converted = positional.encode(number, base, alphabet)
+        if len(alphabet[0]) == 1:
+            self.assertEqual(number, positional.decode(converted, base, alphabet))
+        self.assertEqual(0, self.backend.calls)
+
+    def test_environment_variable(self):
+        """
+        Check that unknown backend in environment falls back to pure Python engine
+        """
+        environment = dict(os.environ, NUMERAL_SYSTEM_BACKEND="unknown")
+        output = subprocess.check_output(
+            [
+                sys.executable,
+                "-W",
+                "always",
+                "-c",
+                "from numeral_system import backends; print(backends.current())",
+            ],
+            env=environment,
+            stderr=subprocess.STDOUT,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        )
+        self.assertIn(b"RuntimeWarning", output)
+        self.assertTrue(output.endswith(b"python\n"))
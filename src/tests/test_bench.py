@@ -0,0 +1,51 @@
+"""
+Tests for benchmarks
+"""
+import copy
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+from numeral_system import bench
+
+
+class BenchTestCase(TestCase):
+    """
+    Benchmark suite checks
+    """
+
+    def test_run_and_compare(self):
+        """
+        Check that report is JSON serializable and slower results are regressions
+        """
+        report = bench.run(["roman"], quick=True)
+        self.assertEqual(json.loads(json.dumps(report)), report)
+        self.assertEqual(
+            ["build_tables", "encode", "decode", "is_valid"],
+            [result["operation"] for result in report["results"]],
+        )
+        self.assertEqual([], bench.compare(report, report))
+
+        slower = copy.deepcopy(report)
+        slower["results"][1]["seconds"] *= 2
+        regressions = bench.compare(report, slower)
+        self.assertEqual(1, len(regressions))
+        self.assertEqual("encode", regressions[0]["operation"])
+        self.assertEqual([], bench.compare(report, slower, tolerance=1.5))
+
+    def test_main(self):
+        """
+        Check that command line writes report and rejects unknown benchmarks
+        """
+        descriptor, path = tempfile.mkstemp(suffix=".json")
+        os.close(descriptor)
+        try:
+            self.assertEqual(0, bench.main(["roman", "--quick", "--output", path]))
+            with open(path) as report:
+                self.assertTrue(json.load(report)["results"])
+        finally:
+            os.remove(path)
+
+        with self.assertRaises(SystemExit):
+            bench.main(["unknown"])
@@ -0,0 +1,87 @@
+"""
+Tests for command line converter
+"""
+import os
+import tempfile
+from io import StringIO
+from unittest import TestCase, mock
+
+from numeral_system import cli
+from parameterized import parameterized
+
+
+class CliTestCase(TestCase):
+    """
+    Command line converter checks
+    """
+
+    def _main(self, argv, stdin=""):
+        stdout, stderr = StringIO(), StringIO()
+        with mock.patch("sys.stdin", StringIO(stdin)), mock.patch(
+            "sys.stdout", stdout
+        ), mock.patch("sys.stderr", stderr):
+            code = cli.main(argv)
+        return code, stdout.getvalue(), stderr.getvalue()
+
+    @parameterized.expand(
+        [
+            (["--to", "16"], "255\n-16\n\n 7 \n", "FF\n-10\n7\n"),
+            (["--from", "3", "--to", "9"], "1012\n-22\n", "35\n-8\n"),
+            (["--to", "roman"], "1994\n4\n", "MCMXCIV\nIV\n"),
+            (["--from", "ROMAN", "--to", "2"], "XII\n", "1100\n"),
+            (["--to", "3", "--to-alphabet", "abc", "--sign", "~"], "~5", "~bc\n"),
+            (["--errors", "skip", "--from", "2"], "101\n2\n11\n", "5\n3\n"),
+            (["--errors", "marker", "--from", "2"], "101\n2\n11\n", "5\n\n3\n"),
+        ]
+    )
+    def test_convert(self, argv, stdin, expected):
+        """
+        Check conversion of standard input to standard output
+        """
+        self.assertEqual((0, expected, ""), self._main(argv, stdin))
+
+    def test_files_and_workers(self):
+        """
+        Check conversion of files in worker processes
+        """
+        directory = tempfile.mkdtemp()
+        source = os.path.join(directory, "numbers.txt")
+        target = os.path.join(directory, "converted.txt")
+        try:
+            with open(source, "w") as stream:
+                stream.write("\n".join(str(number) for number in range(1000)))
+
+            argv = ["--to", "36", source, "-o", target, "--chunk-size", "100"]
+            self.assertEqual(0, self._main(argv + ["--workers", "2"])[0])
+            with open(target) as stream:
+                converted = stream.read()
+
+            self.assertEqual(converted, self._main(argv[:3] + ["--block-size", "7"])[1])
+            self.assertEqual("RR", converted.split()[-1])
+        finally:
+            for name in os.listdir(directory):
+                os.remove(os.path.join(directory, name))
+            os.rmdir(directory)
+
+    @parameterized.expand(
+        [
+            (["--from", "2"], "12\n"),
+            (["--to", "99"], ""),
+            (["--to", "roman"], "0\n"),
+            (["--workers", "0"], ""),
+        ]
+    )
+    def test_errors(self, argv, stdin):
+        """
+        Check that conversion errors are reported with exit code 1
+        """
+        code, _, stderr = self._main(argv, stdin)
+        self.assertEqual(1, code)
+        self.assertTrue(stderr.startswith("numeral-system: error:"))
+
+    def test_wrong_base(self):
+        """
+        Check that wrong base is rejected by argument parser
+        """
+        with self.assertRaises(SystemExit):
+            self._main(["--from", "eleven"])
@@ -0,0 +1,126 @@
+"""
+Tests for instrumentation of conversions
+"""
+from unittest import TestCase
+
+from numeral_system import exceptions, instrumentation, positional, roman
+
+
+class InstrumentationTestCase(TestCase):
+    """
+    Instrumentation checks
+    """
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_disabled(self):
+        """
+        Check that nothing is recorded while instrumentation is disabled
+        """
+        instrumentation.reset()
+        positional.encode(255, 16)
+        roman.decode("XII")
+        stats = instrumentation.snapshot()
+        self.assertFalse(stats["enabled"])
+        self.assertEqual({}, stats["functions"])
+        self.assertEqual({}, stats["engines"])
+
+    def test_functions(self):
+        """
+        Check calls, errors, digits and latencies of conversion functions
+        """
+        with instrumentation.recording() as stats:
+            self.assertTrue(instrumentation.enabled)
+            self.assertEqual("FF", positional.encode(255, 16))
+            self.assertEqual(255, positional.decode("FF", 16))
+            self.assertEqual(255, positional.decode(b"-FF", 16, start=1))
+            self.assertTrue(positional.is_valid("12", 3))
+            self.assertEqual("XII", roman.encode(12))
+            with self.assertRaises(exceptions.IncorrectNumberRepresentationError):
+                roman.decode("IIII")
+
+        self.assertFalse(instrumentation.enabled)
+        functions = stats["functions"]
+        self.assertEqual(
+            {"calls": 1, "errors": 0, "digits": 2},
+            {
+                key: functions["positional.encode"][key]
+                for key in ("calls", "errors", "digits")
+            },
+        )
+        self.assertEqual(2, functions["positional.decode"]["calls"])
+        self.assertEqual(5, functions["positional.decode"]["digits"])
+        self.assertEqual(1, functions["positional.is_valid"]["calls"])
+        self.assertEqual(1, functions["roman.encode"]["calls"])
+        self.assertEqual(1, functions["roman.decode"]["errors"])
+        self.assertEqual(
+            2, sum(count for _, count in functions["positional.decode"]["histogram"])
+        )
+
+    def test_engines(self):
+        """
+        Check engines which are chosen for conversions
+        """
+        alphabet = tuple("0123456789abcdefghijklmnopqrstuvwxyz@#")
+        with instrumentation.recording() as stats:
+            positional.encode(100, 16)
+            positional.encode(100, 64, tuple(positional._BASE64_ALPHABET))
+            positional.encode(100, 38, alphabet)
+            positional.encode(38 ** 1000, 38, alphabet)
+            positional.decode("ff", 16, positional._LOWER_ALPHABET)
+            positional.decode("@#", 38, alphabet)
+            positional.decode("@" * 1000, 38, alphabet)
+
+        self.assertEqual(
+            {"builtin": 1, "bits": 1, "chunks": 1, "generic": 1},
+            stats["engines"]["positional.encode"],
+        )
+        self.assertEqual(
+            {"builtin": 1, "generic": 2}, stats["engines"]["positional.decode"]
+        )
+
+    def test_codec_cache(self):
+        """
+        Check hits, misses and evictions of cache of codecs
+        """
+        positional._cached_codec.cache_clear()
+        alphabets = [tuple("0123456789") + (str(index),) for index in range(10, 140)]
+        positional.encode(1, 10)
+        with instrumentation.recording() as stats:
+            positional.encode(1, 10)
+            for alphabet in alphabets:
+                positional.encode(1, 11, alphabet)
+            positional.encode(1, 11, alphabets[-1])
+
+        cache = stats["codec_cache"]
+        self.assertEqual(2, cache["hits"])
+        self.assertEqual(130, cache["misses"])
+        self.assertEqual(2, cache["evictions"])
+        self.assertEqual(128, cache["size"])
+
+    def test_recording_keeps_enabled(self):
+        """
+        Check that recording doesn't disable enabled instrumentation
+        """
+        instrumentation.enable()
+        with instrumentation.recording(clear=False):
+            pass
+        self.assertTrue(instrumentation.enabled)
+
+    def test_not_sized_numbers(self):
+        """
+        Check that numbers without length are recorded with no digits
+        """
+        with instrumentation.recording() as stats:
+            self.assertFalse(positional.is_valid(None, 10))
+            self.assertFalse(roman.is_valid(None))
+            self.assertFalse(roman.is_valid(12.5))
+            self.assertEqual(12, positional.decode(12, 10))
+
+        functions = stats["functions"]
+        self.assertEqual(0, functions["positional.is_valid"]["digits"])
+        self.assertEqual(2, functions["roman.is_valid"]["calls"])
+        self.assertEqual(0, functions["roman.is_valid"]["digits"])
+        self.assertEqual(0, functions["positional.decode"]["digits"])
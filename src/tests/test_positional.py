@@ -1,12 +1,35 @@
 """
 Tests for positional numeral system
 """
-from random import randint
-from unittest import TestCase
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO, StringIO
+from random import getrandbits, randint
+from unittest import TestCase, mock, skipIf
 
+import numeral_system
 from numeral_system import exceptions, positional
 from parameterized import parameterized
-from six import moves
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_BASE64_URL = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+
+
+def _reference_decode(number, base, chunk=1000):
+    """
+    Decode with builtin int by chunks to stay below sys.int_max_str_digits
+    """
+    result = 0
+    for index in range(0, len(number), chunk):
+        part = number[index : index + chunk]
+        result = result * base ** len(part) + int(part, base)
+    return result
 
 
 class PositionalTestCase(TestCase):
@@ -35,8 +58,8 @@ class PositionalTestCase(TestCase):
     @parameterized.expand(
         [
             (randint(-9999, 9999), base)
-            for _ in moves.range(5)
-            for base in moves.range(2, positional.max_base())
+            for _ in range(5)
+            for base in range(2, positional.max_base())
         ]
     )
     def test_check_all_default_bases_positional(self, number, base):
@@ -158,6 +181,46 @@ class PositionalTestCase(TestCase):
         """
         self.assertFalse(positional.is_valid(number, base))
 
+    @parameterized.expand(
+        [(" 42", 42), ("+42", 42), ("4_2", 42), ("-0042", -42), ("7" * 5000, None),]
+    )
+    def test_encode_decimal_string(self, number, expected):
+        """
+        Check that decimal string is parsed like int() does
+        """
+        if expected is None:
+            expected = positional.decode(number, 10)
+        self.assertEqual(positional.encode(expected, 8), positional.encode(number, 8))
+        self.assertEqual(
+            positional.encode(expected, 8), positional.try_encode(number, 8)
+        )
+
+    @parameterized.expand(
+        [("4x",), ("",), ("-",), ("4__2",), (" 7" + "7" * 5000,),]
+    )
+    def test_encode_invalid_decimal_string(self, number):
+        """
+        Check that string which int() rejects is reported as incorrect number
+        """
+        with self.assertRaises(exceptions.IncorrectNumberRepresentationError):
+            positional.encode(number, 10)
+        failure = positional.try_encode(number, 10)
+        self.assertIs(
+            exceptions.IncorrectNumberRepresentationError, failure.error_class
+        )
+
+    @parameterized.expand(
+        [("list", list("0123")), ("string", "0123"),]
+    )
+    def test_sequence_alphabet(self, _, alphabet):
+        """
+        Check that alphabet can be any sequence of digits
+        """
+        self.assertEqual("101", positional.encode(5, 2, alphabet))
+        self.assertEqual(5, positional.decode("101", 2, alphabet))
+        self.assertTrue(positional.is_valid("-101", 2, alphabet))
+        self.assertEqual("11", positional.convert("101", 2, 4, alphabet, alphabet))
+
     def test_wrong_alphabet(self):
         """
         Check negative case with invalid alphabet
@@ -171,3 +234,941 @@ class PositionalTestCase(TestCase):
         """
         with self.assertRaises(exceptions.WrongArgumentTypeError):
             positional.encode(4.5, 10)
+
+    @parameterized.expand(
+        [(base, bits) for base in (2, 3, 10, 16, 36) for bits in (1001, 5000, 40000)]
+    )
+    def test_encode_huge_numbers(self, base, bits):
+        """
+        Check divide and conquer encoding of huge numbers
+        """
+        number = getrandbits(bits) | (1 << bits)
+        converted = positional.encode(number, base)
+        self.assertEqual(_reference_decode(converted, base), number)
+        self.assertEqual(positional.encode(-number, base), "-" + converted)
+
+    def test_encode_huge_power_of_base(self):
+        """
+        Check that zero digits are kept when number is split
+        """
+        alphabet = ("Z", "!", "T", "#", "F", "%", "S", "&", "E", "(", "0")
+        converted = positional.encode(
+            -(10 ** 5000), 10, alphabet=alphabet, sign_literal="@"
+        )
+        self.assertEqual(converted, "@!" + "Z" * 5000)
+
+    @parameterized.expand(
+        [(base, bits) for base in (2, 7, 10, 36) for bits in (1500, 40000)]
+    )
+    def test_decode_huge_numbers(self, base, bits):
+        """
+        Check divide and conquer decoding of huge numbers
+        """
+        number = getrandbits(bits) | (1 << bits)
+        converted = positional.encode(number, base)
+        self.assertEqual(positional.decode(converted, base), number)
+        self.assertEqual(positional.decode("-" + converted, base), -number)
+
+    def test_decode_huge_integer_literal(self):
+        """
+        Check that integer input is not limited by sys.int_max_str_digits
+        """
+        number = 10 ** 6000 + 1
+        self.assertEqual(positional.decode(number, 2), int("1" + "0" * 5999 + "1", 2))
+        self.assertEqual(positional.decode(-number, 10), -number)
+
+    @parameterized.expand(
+        [("unknown_digit", "12$", 10), ("digit_out_of_base", "19", 8),]
+    )
+    def test_decode_incorrect_representation(self, _, number, base):
+        """
+        Check decoding of digits which are not allowed
+        """
+        with self.assertRaises(exceptions.IncorrectNumberRepresentationError):
+            positional.decode(number, base)
+
+    @parameterized.expand(
+        [
+            (255, 16, "ff"),
+            (-35, 36, "-z"),
+            (10, 2, "1010"),
+            (10 ** 20, 36, "l3r41ifs0q5ts"),
+        ]
+    )
+    def test_lower_case_alphabet(self, number, base, expected):
+        """
+        Check lower case alphabet which is handled by builtin conversion
+        """
+        alphabet = tuple("0123456789abcdefghijklmnopqrstuvwxyz")
+        self.assertEqual(positional.encode(number, base, alphabet=alphabet), expected)
+        self.assertEqual(positional.decode(expected, base, alphabet=alphabet), number)
+        self.assertTrue(positional.is_valid(expected, base, alphabet=alphabet))
+        self.assertFalse(positional.is_valid(expected.upper() + "z", base))
+
+    @parameterized.expand(
+        [("1G", 16), ("ff", 16), (" 12", 10), ("1_0", 10),]
+    )
+    def test_builtin_decode_is_strict(self, number, base):
+        """
+        Check that digits accepted by builtin int() but not by alphabet are rejected
+        """
+        with self.assertRaises(exceptions.IncorrectNumberRepresentationError):
+            positional.decode(number, base)
+
+    @parameterized.expand(
+        [
+            ("default", 16, tuple("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ")),
+            ("reversed", 16, tuple("ZYXWVUTSRQPONMLKJIHGFEDCBA9876543210")),
+            ("custom", 10, ("Z", "!", "T", "#", "F", "%", "S", "&", "E", "(", "0")),
+            ("wide", 40, tuple("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ!@#$")),
+        ]
+    )
+    def test_codec(self, _, base, alphabet):
+        """
+        Check that codec gives the same results as module level functions
+        """
+        codec = positional.Codec(base, alphabet=alphabet, sign_literal="~")
+        for number in (0, 1, -1, base, 2 ** 100 - 1, -(3 ** 2000)):
+            converted = codec.encode(number)
+            self.assertEqual(
+                converted,
+                positional.encode(number, base, alphabet=alphabet, sign_literal="~"),
+            )
+            self.assertEqual(codec.decode(converted), number)
+            self.assertTrue(codec.is_valid(converted))
+
+        self.assertFalse(codec.is_valid("-1"))
+        with self.assertRaises(exceptions.IncorrectNumberRepresentationError):
+            codec.decode(alphabet[0] + "?")
+
+    def test_codec_with_wrong_alphabet(self):
+        """
+        Check that alphabet is validated on codec creation
+        """
+        with self.assertRaises(exceptions.WrongArgumentValueError):
+            positional.Codec(4, alphabet=tuple("12344"))
+
+    def test_iter_encode(self):
+        """
+        Check lazy encoding of iterable and text file
+        """
+        result = positional.iter_encode(iter([255, -16, 0]), 16)
+        self.assertEqual(list(result), ["FF", "-10", "0"])
+
+        stream = StringIO("255\n\n  -16 \r\n0")
+        result = positional.iter_encode(stream, 16, chunk_size=3)
+        self.assertEqual(list(result), ["FF", "-10", "0"])
+
+    @parameterized.expand(
+        [
+            ("decimal", 10, positional._DEFAULT_ALPHABET, 7),
+            ("bits", 64, tuple(positional._BASE64_ALPHABET), 100),
+            ("generic", 62, tuple(_BASE64_URL[:62]), 64),
+            ("words", 3, ("zero", "one", "two"), 5),
+        ]
+    )
+    def test_iter_encode_digits(self, _, base, alphabet, chunk_size):
+        """
+        Check that chunks of digits are joined to encoded number
+        """
+        for number in [0, -1, base ** 300, -(base ** 300 - 1), getrandbits(5000)]:
+            chunks = list(
+                positional.iter_encode_digits(
+                    number, base, alphabet, chunk_size=chunk_size
+                )
+            )
+            self.assertEqual(positional.encode(number, base, alphabet), "".join(chunks))
+            if len(alphabet[0]) == 1:
+                sign = 1 if number < 0 else 0
+                self.assertLessEqual(len(chunks[0]), chunk_size + sign)
+                for chunk in chunks[1:]:
+                    self.assertEqual(chunk_size, len(chunk))
+
+    def test_iter_encode_digits_wrong_arguments(self):
+        """
+        Check that arguments are validated before the first chunk is requested
+        """
+        with self.assertRaises(exceptions.WrongArgumentValueError):
+            positional.iter_encode_digits(10, 10, chunk_size=0)
+        with self.assertRaises(exceptions.WrongArgumentTypeError):
+            positional.iter_encode_digits("10", 10)
+
+    def test_codec_digits(self):
+        """
+        Check codec conversion of digits without sign and its byte support flag
+        """
+        codec = positional.Codec(64, tuple(_BASE64_URL))
+        self.assertEqual(62 * 64 + 1, codec.decode_digits("-B"))
+        self.assertEqual(["-B", "A"], list(codec.iter_encode_digits(-64, 1)))
+        self.assertTrue(codec.single_byte)
+        self.assertFalse(positional.Codec(3, ("zero", "one", "two")).single_byte)
+
+    @parameterized.expand(
+        [
+            ("decimal", 10, positional._DEFAULT_ALPHABET, 1),
+            ("builtin", 36, positional._DEFAULT_ALPHABET, 1000),
+            ("bits", 64, tuple(positional._BASE64_ALPHABET), 777),
+            ("generic", 62, tuple(_BASE64_URL[:62]), 5000),
+        ]
+    )
+    def test_incremental_decoder(self, _, base, alphabet, chunk_size):
+        """
+        Check decoding of number which is fed by chunks
+        """
+        number = -getrandbits(30000)
+        digits = positional.encode(number, base, alphabet)
+        decoder = positional.IncrementalDecoder(base, alphabet)
+        for index in range(0, len(digits), chunk_size):
+            decoder.feed(digits[index : index + chunk_size])
+        self.assertEqual(number, decoder.finish())
+
+        decoder.feed(b"")
+        decoder.feed(digits[1:].encode())
+        self.assertEqual(-number, decoder.finish())
+        with self.assertRaises(exceptions.IncorrectNumberRepresentationError):
+            decoder.finish()
+
+    def test_incremental_decoder_errors(self):
+        """
+        Check that the first invalid digit is reported when its chunk is fed
+        """
+        decoder = positional.IncrementalDecoder(16)
+        decoder.feed("-FF")
+        with self.assertRaisesRegex(
+            exceptions.IncorrectNumberRepresentationError, "'-' at 3"
+        ):
+            decoder.feed("0-1")
+        with self.assertRaisesRegex(
+            exceptions.IncorrectNumberRepresentationError, "'G' at 2"
+        ):
+            decoder.feed("G")
+        decoder.feed("0")
+        self.assertEqual(-0xFF0, decoder.finish())
+
+        with self.assertRaises(exceptions.WrongArgumentTypeError):
+            decoder.feed(15)
+        decoder = positional.IncrementalDecoder(2, ("\u0436", "\u0437"))
+        with self.assertRaises(exceptions.WrongArgumentValueError):
+            decoder.feed(b"0")
+
+    def test_encode_to_file(self):
+        """
+        Check writing of encoded number to text and binary files
+        """
+        number = -getrandbits(3000)
+        text = StringIO()
+        written = positional.encode_to_file(number, text, 36, chunk_size=50)
+        self.assertEqual(positional.encode(number, 36), text.getvalue())
+        self.assertEqual(len(text.getvalue()), written)
+
+        binary = BytesIO()
+        self.assertEqual(written, positional.encode_to_file(number, binary, 36))
+        self.assertEqual(text.getvalue().encode(), binary.getvalue())
+
+        with self.assertRaises(exceptions.WrongArgumentValueError):
+            positional.encode_to_file(1, BytesIO(), 2, ("\u0436", "\u0437"))
+
+    @parameterized.expand(
+        [
+            ("hex", 16, positional._DEFAULT_ALPHABET, "-"),
+            ("decimal", 10, positional._DEFAULT_ALPHABET, "-"),
+            ("custom", 3, ("a", "b", "c"), "~"),
+            ("words", 3, ("zero", "one", "two"), "-"),
+        ]
+    )
+    def test_try_conversion(self, _, base, alphabet, sign):
+        """
+        Check that non-raising conversion reports the same errors as raising one
+        """
+        numbers = [
+            "FF",
+            "-1Z",
+            "",
+            "-",
+            "~b",
+            "abc",
+            "10",
+            "zero",
+            b"12",
+            b"-G",
+            bytearray(b"ac"),
+            memoryview(b"xx").cast("B", (1, 2)),
+            19,
+            -7,
+            2.5,
+            None,
+        ]
+        decoded, decode_codes = positional.try_decode_many(
+            numbers, base, alphabet, sign
+        )
+        encoded, encode_codes = positional.try_encode_many(
+            numbers, base, alphabet, sign
+        )
+        for index, number in enumerate(numbers):
+            for convert, try_convert, results, codes in (
+                (positional.decode, positional.try_decode, decoded, decode_codes),
+                (positional.encode, positional.try_encode, encoded, encode_codes),
+            ):
+                result = try_convert(number, base, alphabet, sign)
+                if not isinstance(result, numeral_system.Failure):
+                    self.assertEqual(convert(number, base, alphabet, sign), result)
+                    self.assertEqual((result, 0), (results[index], codes[index]))
+                    continue
+
+                with self.assertRaises(result.error_class) as context:
+                    convert(number, base, alphabet, sign)
+                self.assertEqual(str(context.exception), result.message())
+                self.assertEqual(type(context.exception).code, codes[index])
+                self.assertIsNone(results[index])
+
+    def test_try_decode_offsets(self):
+        """
+        Check non-raising conversion of part of number
+        """
+        self.assertEqual(255, positional.try_decode("xFFx", 16, start=1, end=3))
+        self.assertEqual(-255, positional.try_decode(b"x-FF", 16, start=1))
+        failure = positional.try_decode(255, 10, start=1)
+        self.assertIs(exceptions.WrongArgumentTypeError, failure.error_class)
+        self.assertIn("Offsets", failure.message())
+        failure = positional.try_decode("xFFx", 16, end=3)
+        self.assertEqual(4, failure.code)
+        self.assertIs(
+            exceptions.IncorrectNumberRepresentationError,
+            exceptions.ERROR_CLASSES[failure.code],
+        )
+
+    @parameterized.expand(
+        [("empty", ""), ("sign", "-"), ("empty_bytes", b""), ("sign_bytes", b"-"),]
+    )
+    def test_decode_no_digits(self, _, number):
+        """
+        Check that every entry point rejects number without digits
+        """
+        self.assertFalse(positional.is_valid(number, 10))
+        with self.assertRaises(exceptions.IncorrectNumberRepresentationError):
+            positional.decode(number, 10)
+        failure = positional.try_decode(number, 10)
+        self.assertIs(
+            exceptions.IncorrectNumberRepresentationError, failure.error_class
+        )
+
+        decoder = positional.IncrementalDecoder(10)
+        decoder.feed(number)
+        with self.assertRaises(exceptions.IncorrectNumberRepresentationError):
+            decoder.finish()
+        if isinstance(number, str):
+            with self.assertRaises(exceptions.IncorrectNumberRepresentationError):
+                positional.sort_key(10)(number)
+
+    @parameterized.expand(
+        [
+            ("base_36", 36, positional._DEFAULT_ALPHABET),
+            ("base_62", 62, tuple(_BASE64_URL[:62])),
+            ("unordered", 16, tuple("fedcba9876543210")),
+        ]
+    )
+    def test_sorted_encoded(self, _, base, alphabet):
+        """
+        Check that numbers are sorted by values without decoding
+        """
+        numbers = [randint(-(base ** 5), base ** 5) for _ in range(500)]
+        numbers.extend([0, base, -base, base - 1, 1 - base])
+        encoded = [positional.encode(number, base, alphabet) for number in numbers]
+        # leading zeros don't change value
+        encoded.extend(
+            [alphabet[0] * 3 + digits for digits in encoded[:50] if digits[0] != "-"]
+        )
+        encoded.append("-" + alphabet[0])
+
+        def decode(number):
+            return positional.decode(number, base, alphabet)
+
+        self.assertEqual(
+            sorted(encoded, key=decode),
+            positional.sorted_encoded(encoded, base, alphabet),
+        )
+        self.assertEqual(
+            sorted(encoded, key=decode, reverse=True),
+            positional.sorted_encoded(encoded, base, alphabet, reverse=True),
+        )
+        for first, second in zip(encoded, encoded[::-1]):
+            self.assertEqual(
+                (decode(first) > decode(second)) - (decode(first) < decode(second)),
+                positional.compare(first, second, base, alphabet),
+            )
+
+    def test_compare_errors(self):
+        """
+        Check that only valid string numbers of single character alphabets are
+        compared
+        """
+        self.assertEqual(0, positional.compare("-0", "000", 10))
+        self.assertEqual(-1, positional.compare("~1", "0", 10, sign_literal="~"))
+        with self.assertRaises(exceptions.IncorrectNumberRepresentationError):
+            positional.compare("1", "1G", 16)
+        with self.assertRaises(exceptions.WrongArgumentTypeError):
+            positional.compare(1, "1", 16)
+        with self.assertRaises(exceptions.WrongArgumentValueError):
+            positional.sort_key(3, ("zero", "one", "two"))
+
+    @parameterized.expand(
+        [("skip", [255, 0]), ("marker", [255, (1, "XZ"), 0]),]
+    )
+    def test_iter_decode_errors(self, errors, expected):
+        """
+        Check error policies of lazy decoding
+        """
+        result = []
+        for item in positional.iter_decode(StringIO("FF\nXZ\n0\n"), 16, errors=errors):
+            if isinstance(item, numeral_system.ErrorMarker):
+                self.assertIsInstance(
+                    item.error, exceptions.IncorrectNumberRepresentationError
+                )
+                item = item.index, item.value
+            result.append(item)
+
+        self.assertEqual(result, expected)
+
+    def test_iter_decode_raise(self):
+        """
+        Check that invalid number stops lazy decoding by default
+        """
+        result = positional.iter_decode(["FF", "XZ", "0"], 16)
+        self.assertEqual(next(result), 255)
+        with self.assertRaises(exceptions.IncorrectNumberRepresentationError):
+            next(result)
+
+    def test_iter_wrong_error_policy(self):
+        """
+        Check that unknown error policy is rejected immediately
+        """
+        with self.assertRaises(exceptions.WrongArgumentValueError):
+            positional.iter_decode([], 16, errors="ignore")
+
+    @parameterized.expand(
+        [
+            ("bytes", b"-7E3", 0, None, -2019),
+            ("bytearray", bytearray(b"7E3"), 0, None, 2019),
+            ("memoryview_slice", memoryview(b"xx-FF00yy"), 2, 7, -65280),
+            ("negative_offsets", b"id=D5;", 3, -1, 213),
+        ]
+    )
+    def test_decode_bytes(self, _, number, start, end, expected):
+        """
+        Check decoding of bytes-like numbers
+        """
+        self.assertEqual(positional.decode(number, 16, start=start, end=end), expected)
+        self.assertTrue(positional.is_valid(number, 16, start=start, end=end))
+
+    def test_decode_bytes_custom_alphabet(self):
+        """
+        Check decoding of bytes-like numbers with custom and wide alphabets
+        """
+        alphabet = ("Z", "!", "T", "#", "F", "%", "S", "&", "E", "(", "0")
+        self.assertEqual(
+            positional.decode(b"@(E&S%F#T!Z", 10, alphabet=alphabet, sign_literal="@"),
+            -9876543210,
+        )
+
+        alphabet = tuple("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ!@#$")
+        number = getrandbits(5000)
+        converted = positional.encode(number, 40, alphabet=alphabet).encode("ascii")
+        self.assertEqual(positional.decode(converted, 40, alphabet=alphabet), number)
+
+    @parameterized.expand([(b"1G",), (b" 1",), (b"ff",), (b"--1",)])
+    def test_invalid_bytes(self, number):
+        """
+        Check invalid bytes-like numbers
+        """
+        self.assertFalse(positional.is_valid(number, 16))
+        with self.assertRaises(exceptions.IncorrectNumberRepresentationError):
+            positional.decode(number, 16)
+
+    @parameterized.expand(
+        [
+            ("base4", 4, tuple("ACGT")),
+            ("base32", 32, tuple("0123456789ABCDEFGHIJKLMNOPQRSTUV")),
+            ("base32_rfc", 32, tuple("ABCDEFGHIJKLMNOPQRSTUVWXYZ234567")),
+            ("base64_url", 64, tuple(_BASE64_URL)),
+            ("base8_custom", 8, tuple("abcdefgh")),
+        ]
+    )
+    def test_power_of_two_bases(self, _, base, alphabet):
+        """
+        Check bit level conversion against digit by digit conversion
+        """
+        for bits in (0, 1, 5, 6, 7, 8, 9, 23, 24, 25, 40, 41, 999, 20000):
+            number = getrandbits(bits) | (1 << bits) >> 1
+            expected = ""
+            rest = number
+            while True:
+                rest, digit = divmod(rest, base)
+                expected = alphabet[digit] + expected
+                if not rest:
+                    break
+
+            # "-" is a digit of URL safe base64 alphabet
+            converted = positional.encode(-number, base, alphabet, "~")
+            self.assertEqual(converted, "~" + expected if number else expected)
+            self.assertEqual(positional.decode(converted, base, alphabet, "~"), -number)
+            self.assertEqual(
+                positional.decode(expected.encode("ascii"), base, alphabet, "~"),
+                number,
+            )
+
+    @parameterized.expand(
+        [("serial", {}), ("processes", {"workers": 2}), ("executor", None),]
+    )
+    def test_encode_decode_many(self, _, options):
+        """
+        Check batch conversion keeps order of input
+        """
+        numbers = [randint(-(10 ** 12), 10 ** 12) for _ in range(1000)]
+        expected = [positional.encode(number, 36) for number in numbers]
+
+        with ThreadPoolExecutor(2) as executor:
+            options = {"executor": executor} if options is None else options
+            converted = positional.encode_many(numbers, 36, chunk_size=64, **options)
+            self.assertEqual(list(converted), expected)
+            decoded = positional.decode_many(expected, 36, chunk_size=64, **options)
+            self.assertEqual(list(decoded), numbers)
+
+    def test_decode_many_error(self):
+        """
+        Check that error in worker is raised from batch conversion
+        """
+        result = positional.decode_many(["1", "Z", "2"], 10, workers=2, chunk_size=1)
+        with self.assertRaises(exceptions.IncorrectNumberRepresentationError):
+            list(result)
+
+    @parameterized.expand([({"workers": 0},), ({"chunk_size": 0},)])
+    def test_many_wrong_arguments(self, options):
+        """
+        Check that batch arguments are validated
+        """
+        with self.assertRaises(exceptions.WrongArgumentValueError):
+            positional.encode_many([1], 10, **options)
+
+    @parameterized.expand([(3,), (10,), (36,)])
+    def test_parallel_conversion(self, base):
+        """
+        Check that parallel conversion gives the same result as serial one
+        """
+        number = -(getrandbits(30000) | (1 << 30000))
+        with mock.patch.object(positional, "_PARALLEL_THRESHOLD", 1000):
+            converted = positional.encode(number, base, parallel=2)
+            self.assertEqual(converted, positional.encode(number, base))
+            self.assertEqual(positional.decode(converted, base, parallel=2), number)
+
+            with ThreadPoolExecutor(3) as executor:
+                self.assertEqual(
+                    positional.decode(converted.encode(), base, parallel=executor),
+                    number,
+                )
+                with self.assertRaises(exceptions.IncorrectNumberRepresentationError):
+                    positional.decode(converted + "$", base, parallel=executor)
+
+    def test_parallel_pool(self):
+        """
+        Check that process pool is reused by parallel conversions until it breaks
+        """
+        number = getrandbits(5000) | (1 << 5000)
+        with mock.patch.object(
+            positional, "_PARALLEL_THRESHOLD", 1000
+        ), mock.patch.dict(positional._PARALLEL_POOLS, clear=True):
+            converted = positional.encode(number, 7, parallel=2)
+            pool = positional._PARALLEL_POOLS[2]
+            self.addCleanup(pool.shutdown)
+            self.assertEqual(number, positional.decode(converted, 7, parallel=2))
+            self.assertEqual({2: pool}, positional._PARALLEL_POOLS)
+
+            with mock.patch.object(pool, "submit", side_effect=BrokenProcessPool):
+                with self.assertRaises(BrokenProcessPool):
+                    positional.encode(number, 7, parallel=2)
+            self.assertEqual({}, positional._PARALLEL_POOLS)
+
+    @parameterized.expand(
+        [
+            ("base_3", 3, positional._DEFAULT_ALPHABET),
+            ("base_7", 7, positional._DEFAULT_ALPHABET),
+            ("base_38", 38, tuple("0123456789abcdefghijklmnopqrstuvwxyz@#")),
+            ("base_62", 62, tuple(positional._BASE64_ALPHABET)),
+            ("words", 10, tuple(str(digit) + "|" for digit in range(10))),
+        ]
+    )
+    def test_chunk_tables(self, _, base, alphabet):
+        """
+        Check that encoding by chunks of digits gives the same result as by digits
+        """
+        codec = positional.Codec(base, alphabet)
+        with mock.patch.object(positional, "_CHUNK_TABLE_LIMIT", 0):
+            plain = positional.Codec(base, alphabet)
+            plain.encode(0)
+        self.assertIsNone(plain._chunk_to_digits)
+
+        numbers = [0, 1, base - 1]
+        for power in range(1, 21):
+            numbers.extend(
+                [
+                    base ** power - 1,
+                    base ** power,
+                    base ** power + 1,
+                    getrandbits(power),
+                ]
+            )
+        for number in numbers + [-number for number in numbers]:
+            converted = codec.encode(number)
+            self.assertEqual(plain.encode(number), converted)
+            if codec.single_char:
+                self.assertEqual(number, codec.decode(converted))
+        self.assertLessEqual(
+            len(codec._chunk_to_digits or ()), positional._CHUNK_TABLE_LIMIT
+        )
+
+    @parameterized.expand(
+        [
+            ("grouping", 3, 9),
+            ("grouping_many", 10, 1000),
+            ("expansion", 36, 6),
+            ("same_base", 10, 10),
+            ("power_of_two", 2, 16),
+            ("generic", 7, 36),
+        ]
+    )
+    def test_convert(self, _, from_base, to_base):
+        """
+        Check direct conversion between bases
+        """
+        alphabet = tuple(str(digit).zfill(3) for digit in range(1000))
+        to_alphabet = alphabet if to_base > 36 else positional._LOWER_ALPHABET
+        for number in (0, 1, -1, from_base, getrandbits(3000), -getrandbits(3000)):
+            digits = positional.encode(number, from_base)
+            self.assertEqual(
+                positional.encode(number, to_base, to_alphabet),
+                positional.convert(digits, from_base, to_base, to_alphabet=to_alphabet),
+            )
+
+    def test_convert_special_cases(self):
+        """
+        Check conversion to alphabet with multi character digits and edge cases
+        """
+        alphabet = ("zero", "one", "two")
+        self.assertEqual(
+            "~onezerozero",
+            positional.convert("~10", 9, 3, to_alphabet=alphabet, sign_literal="~"),
+        )
+        self.assertEqual("12", positional.convert("0012", 10, 10))
+        self.assertEqual("0", positional.convert("-000", 3, 9))
+        self.assertEqual("C", positional.convert(b"110", 3, 27))
+
+    @parameterized.expand(
+        [
+            ("123", 3, 9),
+            ("1A", 6, 36),
+            ("$", 36, 6),
+            ("9", 8, 10),
+            ("", 3, 9),
+            ("-", 3, 9),
+            ("", 10, 10),
+        ]
+    )
+    def test_convert_invalid_number(self, number, from_base, to_base):
+        """
+        Check that direct conversion validates given number
+        """
+        with self.assertRaises(exceptions.IncorrectNumberRepresentationError):
+            positional.convert(number, from_base, to_base)
+
+    @parameterized.expand(
+        [
+            ("default", 16, positional._DEFAULT_ALPHABET),
+            ("custom", 3, ("a", "b", "c")),
+            ("multi_character", 3, ("a", "bb", "c")),
+        ]
+    )
+    def test_validate_many(self, _, base, alphabet):
+        """
+        Check that batch validation agrees with is_valid
+        """
+        numbers = ["", "-", "0", "1F", "-FG", "ab", "-cab", "cbbz", "bb", b"-ca", 12]
+        offsets = positional.validate_many(numbers, base, alphabet)
+        mask = positional.validate_many(numbers, base, alphabet, result="mask")
+        for index, number in enumerate(numbers):
+            valid = positional.is_valid(number, base, alphabet)
+            self.assertEqual(valid, offsets[index] == -1, number)
+            self.assertEqual(valid, bool(mask >> index & 1), number)
+
+    @parameterized.expand(
+        [
+            ("plain", 255, 16, {}, b"FF"),
+            ("zero_pad", -255, 16, {"width": 6}, b"-000FF"),
+            ("space_pad", -255, 16, {"width": 6, "pad": " "}, b"   -FF"),
+            ("byte_pad", 5, 2, {"width": 4, "pad": b"."}, b".101"),
+            ("huge", 3 ** 1000, 3, {}, b"1" + b"0" * 1000),
+        ]
+    )
+    def test_encode_into(self, _, number, base, options, expected):
+        """
+        Check that digits are written into buffer at offset
+        """
+        buffer = bytearray(b"#" * (len(expected) + 3))
+        written = positional.encode_into(number, buffer, base, offset=2, **options)
+        self.assertEqual(len(expected), written)
+        self.assertEqual(b"##" + expected + b"#", bytes(buffer))
+
+    @parameterized.expand(
+        [
+            ("too_small", {"offset": 3}, exceptions.WrongArgumentValueError),
+            ("too_wide", {"width": 2}, exceptions.NumberOutOfRangeError),
+            (
+                "wrong_pad",
+                {"width": 4, "pad": "ab"},
+                exceptions.WrongArgumentValueError,
+            ),
+            ("read_only", {"buffer": b"    "}, exceptions.WrongArgumentTypeError),
+            ("not_buffer", {"buffer": [0] * 4}, exceptions.WrongArgumentTypeError),
+        ]
+    )
+    def test_encode_into_errors(self, _, options, error):
+        """
+        Check that buffer, width and padding are validated
+        """
+        buffer = options.pop("buffer", bytearray(4))
+        with self.assertRaises(error):
+            positional.encode_into(-100, buffer, 10, **options)
+
+    @parameterized.expand([("list", list), ("generator", iter)])
+    def test_encode_many_into(self, _, container):
+        """
+        Check that numbers are written into fixed width slots
+        """
+        numbers = [0, 7, -7, 35, -(2 ** 63), 2 ** 64 - 1]
+        buffer = bytearray(1 + 14 * len(numbers))
+        written = positional.encode_many_into(
+            container(numbers), buffer, 14, 36, offset=1, pad=" "
+        )
+        self.assertEqual(14 * len(numbers), written)
+        self.assertEqual(
+            [positional.encode(number, 36).rjust(14) for number in numbers],
+            [buffer[i : i + 14].decode() for i in range(1, len(buffer), 14)],
+        )
+
+    def test_encode_many_into_errors(self):
+        """
+        Check that slots are validated in batch mode
+        """
+        with self.assertRaises(exceptions.NumberOutOfRangeError):
+            positional.encode_many_into([1, 1000], bytearray(6), 3, 10)
+        with self.assertRaises(exceptions.WrongArgumentValueError):
+            positional.encode_many_into(iter([1, 2, 3]), bytearray(5), 2, 10)
+        with self.assertRaises(exceptions.WrongArgumentValueError):
+            positional.encode_many_into([1], bytearray(5), 0, 10)
+
+    def _write_file(self, content):
+        descriptor, path = tempfile.mkstemp()
+        with os.fdopen(descriptor, "wb") as stream:
+            stream.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    @parameterized.expand(
+        [
+            ("default", 16, positional._DEFAULT_ALPHABET, "-", {}),
+            ("small_chunks", 16, positional._DEFAULT_ALPHABET, "-", {"chunk_size": 5}),
+            ("custom", 3, ("x", "y", "z"), "~", {"delimiter": b";"}),
+            ("not_builtin", 62, tuple(_BASE64_URL[:62]), "~", {"delimiter": b"\r\n"}),
+        ]
+    )
+    def test_decode_file(self, _, base, alphabet, sign, options):
+        """
+        Check that file is decoded into array with spilled huge numbers
+        """
+        numbers = [0, 1, -1, base ** 10, 2 ** 63 - 1, -(2 ** 63), 2 ** 63, -(3 ** 200)]
+        delimiter = options.get("delimiter", b"\n")
+        content = delimiter.join(
+            positional.encode(number, base, alphabet, sign).encode()
+            for number in numbers
+        )
+        path = self._write_file(b" " + delimiter * 2 + content + delimiter)
+
+        values, spilled = positional.decode_file(path, base, alphabet, sign, **options)
+        self.assertEqual([6, 7], [index for index, _ in spilled])
+        self.assertEqual(numbers[:6] + [0, 0], list(values))
+        self.assertEqual(numbers[6:], [number for _, number in spilled])
+
+    def test_decode_file_fixed_width(self):
+        """
+        Check that file of fixed width records is decoded
+        """
+        buffer = bytearray(8 * 4)
+        positional.encode_many_into([255, -1, 0, 4095], buffer, 8, 16, pad=" ")
+        values, spilled = positional.decode_file(
+            self._write_file(bytes(buffer)), 16, width=8
+        )
+        self.assertEqual([255, -1, 0, 4095], list(values))
+        self.assertEqual([], spilled)
+
+    @parameterized.expand(
+        [
+            (
+                "builtin",
+                10,
+                positional._DEFAULT_ALPHABET,
+                b"12,-4,56,7",
+                [12, -4, 56, 7],
+            ),
+            ("custom", 3, ("a", "b", "c"), b"bc,-b,cc,b", [5, -1, 8, 1]),
+        ]
+    )
+    def test_decode_file_fixed_width_delimiter(
+        self, _, base, alphabet, content, numbers
+    ):
+        """
+        Check that delimiter is stripped from fixed width records
+        """
+        values, spilled = positional.decode_file(
+            self._write_file(content), base, alphabet, delimiter=b",", width=3
+        )
+        self.assertEqual(numbers, list(values))
+        self.assertEqual([], spilled)
+
+    @parameterized.expand(
+        [(b"1\nff\n",), (b"1\n1-1\n",), (b"1\n0x1\n",), (b"1\n1_1\n",)]
+    )
+    def test_decode_file_invalid(self, content):
+        """
+        Check that file is validated as strictly as decode
+        """
+        with self.assertRaises(exceptions.IncorrectNumberRepresentationError):
+            positional.decode_file(self._write_file(content), 16)
+
+    def test_decode_file_empty(self):
+        """
+        Check that empty file gives empty array
+        """
+        values, spilled = positional.decode_file(self._write_file(b""), 10)
+        self.assertEqual(([], []), (list(values), spilled))
+
+    def test_validate_many_offsets(self):
+        """
+        Check offsets of the first invalid characters
+        """
+        self.assertEqual(
+            [-1, 2, 0, 1, 1, -1, 2],
+            list(
+                positional.validate_many(["FF", "-1G", "", "-", b"1Z", 10, "12$"], 16)
+            ),
+        )
+        self.assertEqual(0, positional.validate_many([], 10, result="mask"))
+        with self.assertRaises(exceptions.WrongArgumentValueError):
+            positional.validate_many(["1"], 10, result="bool")
+
+
+@skipIf(numpy is None, "numpy is not installed")
+class PositionalArrayTestCase(TestCase):
+    """
+    Vectorized conversion of numpy arrays
+    """
+
+    @parameterized.expand([(2,), (10,), (16,), (36,)])
+    def test_encode_decode_array(self, base):
+        """
+        Check that arrays are converted the same way as single numbers
+        """
+        numbers = numpy.array(
+            [0, 1, -1, 255, -256, 2 ** 63 - 1, -(2 ** 63), 123456789], dtype="int64"
+        )
+        expected = [positional.encode(int(number), base) for number in numbers]
+
+        converted = positional.encode_array(numbers, base)
+        self.assertEqual(converted.tolist(), expected)
+
+        as_bytes = positional.encode_array(numbers, base, output="S")
+        self.assertEqual([item.decode() for item in as_bytes], expected)
+
+        for array in (converted, as_bytes):
+            decoded, invalid = positional.decode_array(array, base)
+            self.assertEqual(decoded.tolist(), numbers.tolist())
+            self.assertFalse(invalid.any())
+
+    def test_encode_array_matrix(self):
+        """
+        Check padded byte matrix output
+        """
+        numbers = numpy.array([[10, -3], [0, 4095]], dtype="int32")
+        matrix = positional.encode_array(numbers, 16, output="matrix")
+        self.assertEqual(matrix.shape, (2, 2, 3))
+        self.assertEqual(matrix[0, 1].tobytes(), b"-3\x00")
+        self.assertEqual(matrix[1, 1].tobytes(), b"FFF")
+
+    @parameterized.expand([("zero_pad", None), ("space_pad", " ")])
+    def test_encode_many_into_array(self, _, pad):
+        """
+        Check that array is written into fixed width slots without strings
+        """
+        numbers = numpy.array([0, 5, -5, 123456, -(2 ** 63)], dtype="int64")
+        buffer = bytearray(24 * numbers.size)
+        self.assertEqual(
+            len(buffer), positional.encode_many_into(numbers, buffer, 24, 7, pad=pad)
+        )
+
+        expected = bytearray(len(buffer))
+        positional.encode_many_into(iter(numbers.tolist()), expected, 24, 7, pad=pad)
+        self.assertEqual(expected, buffer)
+
+        with self.assertRaises(exceptions.NumberOutOfRangeError):
+            positional.encode_many_into(numbers, buffer, 5, 7)
+
+    def test_decode_file_numpy(self):
+        """
+        Check that file is decoded into int64 array
+        """
+        descriptor, path = tempfile.mkstemp()
+        with os.fdopen(descriptor, "wb") as stream:
+            stream.write(b"10\n-20\n")
+        self.addCleanup(os.remove, path)
+
+        values, spilled = positional.decode_file(path, 10, output="numpy")
+        self.assertEqual(numpy.int64, values.dtype)
+        self.assertEqual([10, -20], values.tolist())
+        self.assertEqual([], spilled)
+
+    def test_encode_array_custom_alphabet(self):
+        """
+        Check custom alphabet and sign
+        """
+        alphabet = ("Z", "!", "T", "#", "F", "%", "S", "&", "E", "(", "0")
+        converted = positional.encode_array(
+            numpy.array([9876543210, -9876543210]), 10, alphabet, sign_literal="@"
+        )
+        self.assertEqual(converted.tolist(), ["(E&S%F#T!Z", "@(E&S%F#T!Z"])
+
+    def test_decode_array_invalid(self):
+        """
+        Check that invalid numbers and overflows are marked in mask
+        """
+        numbers = numpy.array(["", "-", "12", "1G", "-80", "7F", "80", "-81", "-0"])
+        decoded, invalid = positional.decode_array(numbers, 16, dtype="int8")
+        self.assertEqual(decoded.tolist(), [0, 0, 18, 0, -128, 127, 0, 0, 0])
+        self.assertEqual(
+            invalid.tolist(), [True, True, False, True, False, False, True, True, False]
+        )
+
+        decoded, invalid = positional.decode_array(
+            numpy.array([b"-1", b"FFFFFFFFFFFFFFFF"]), 16, dtype="uint64"
+        )
+        self.assertEqual(decoded.tolist(), [0, 2 ** 64 - 1])
+        self.assertEqual(invalid.tolist(), [True, False])
+
+    @parameterized.expand(
+        [
+            ("float_numbers", "encode_array", numpy and numpy.array([1.5])),
+            ("integer_strings", "decode_array", numpy and numpy.array([1, 2])),
+        ]
+    )
+    def test_wrong_array_type(self, _, function, array):
+        """
+        Check wrong type of array
+        """
+        with self.assertRaises(exceptions.WrongArgumentTypeError):
+            getattr(positional, function)(array, 10)
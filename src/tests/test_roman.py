@@ -1,10 +1,10 @@
 """
 Tests for roman numeral system
 """
+from io import StringIO
 from unittest import TestCase
 
-import six
-from numeral_system import exceptions, roman
+from numeral_system import ErrorMarker, Failure, exceptions, roman
 from parameterized import parameterized
 
 
@@ -77,7 +77,7 @@ class RomanTestCase(TestCase):
         """
         Auto check of all converting
         """
-        for i in six.moves.range(1, 4000):
+        for i in range(1, 4000):
             roman_number = roman.encode(i)
             self.assertEqual(roman.decode(roman_number), i)
 
@@ -92,7 +92,7 @@ class RomanTestCase(TestCase):
             roman.decode(number)
 
     @parameterized.expand(
-        [("0",), ("VIIII",), ("list",), ("XMX",),]
+        [("0",), ("VIIII",), ("list",), ("XMX",), ("",), ("MMMM",), ("iv",),]
     )
     def test_wrong_representation_roman_number(self, number):
         """
@@ -105,15 +105,81 @@ class RomanTestCase(TestCase):
         """
         Check is_valid functions for valid roman numbers
         """
-        for i in six.moves.range(1, 4000):
+        for i in range(1, 4000):
             roman_number = roman.encode(i)
             self.assertTrue(roman.is_valid(roman_number))
 
     @parameterized.expand(
-        [("IIII",), ("VIIII",), ("list",), ("XMX",),]
+        [("IIII",), ("VIIII",), ("list",), ("XMX",), ("",),]
     )
     def test_check_invalid_roman_number(self, number):
         """
         Check is_valid functions for invalid roman numbers
         """
         self.assertFalse(roman.is_valid(number))
+
+    def test_try_conversion(self):
+        """
+        Check that non-raising conversion reports the same errors as raising one
+        """
+        numbers = [12, 0, -1, 4000, "XII", 1.5]
+        results, codes = roman.try_encode_many(numbers)
+        self.assertEqual(["XII", None, None, None, None, None], results)
+        self.assertEqual([0, 3, 3, 3, 1, 1], list(codes))
+        for number in numbers:
+            result = roman.try_encode(number)
+            if isinstance(result, Failure):
+                with self.assertRaises(result.error_class) as context:
+                    roman.encode(number)
+                self.assertEqual(str(context.exception), result.message())
+            else:
+                self.assertEqual(roman.encode(number), result)
+
+        results, codes = roman.try_decode_many(["XII", "IIII", "", 12])
+        self.assertEqual([12, None, None, None], results)
+        self.assertEqual([0, 4, 4, 1], list(codes))
+        failure = roman.try_decode("IIII")
+        self.assertIsInstance(
+            failure.exception(), exceptions.IncorrectNumberRepresentationError
+        )
+
+    def test_validate_many(self):
+        """
+        Check offsets of the first invalid characters and mask of valid numbers
+        """
+        numbers = ["XII", "IIII", "", "MMMM", 5, "XIIZ", "MCMXCIV", "IC"]
+        self.assertEqual([-1, 3, 0, 3, 0, 3, -1, 1], list(roman.validate_many(numbers)))
+        self.assertEqual(0b1000001, roman.validate_many(numbers, result="mask"))
+        with self.assertRaises(exceptions.WrongArgumentValueError):
+            roman.validate_many(numbers, result="list")
+
+    def test_iter_encode(self):
+        """
+        Check lazy encoding of iterable and text file
+        """
+        self.assertEqual(
+            list(roman.iter_encode([1, 4, 1988])), ["I", "IV", "MCMLXXXVIII"]
+        )
+        result = roman.iter_encode(
+            StringIO("1\n4000\n7\n"), errors="skip", chunk_size=2
+        )
+        self.assertEqual(list(result), ["I", "VII"])
+
+    def test_iter_decode(self):
+        """
+        Check lazy decoding with error markers
+        """
+        result = list(roman.iter_decode(StringIO("XXII\nIIII\nV"), errors="marker"))
+        self.assertEqual(result[0], 22)
+        self.assertIsInstance(result[1], ErrorMarker)
+        self.assertEqual((result[1].index, result[1].value), (1, "IIII"))
+        self.assertEqual(result[2], 5)
+
+    def test_encode_decode_many(self):
+        """
+        Check batch conversion in worker processes
+        """
+        numbers = list(range(1, 4000))
+        converted = list(roman.encode_many(numbers, workers=2, chunk_size=500))
+        self.assertEqual(converted, [roman.encode(number) for number in numbers])
+        self.assertEqual(list(roman.decode_many(converted, chunk_size=500)), numbers)
@@ -0,0 +1,264 @@
+"""
+Tests for local conversion service
+"""
+import asyncio
+import os
+import socket
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from unittest import TestCase, mock, skipIf
+
+from numeral_system import exceptions, positional, serve
+from parameterized import parameterized
+
+
+class ServeTestCase(TestCase):
+    """
+    Conversion server and client checks on localhost
+    """
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    def _run(self, coroutine):
+        return self.loop.run_until_complete(asyncio.wait_for(coroutine, 30))
+
+    async def _start(self, server, path=None):
+        sockets = await server.start(port=0, path=path)
+        if path is not None:
+            return await serve.Client.connect(path=path)
+        return await serve.Client.connect(port=sockets[0].getsockname()[1])
+
+    @parameterized.expand([("in_loop", None), ("in_workers", 1)])
+    def test_concurrent_requests(self, _, workers):
+        """
+        Check that concurrent requests are answered in batches
+        """
+
+        async def scenario():
+            server = serve.ConversionServer(batch_size=16, workers=workers)
+            client = await self._start(server)
+            try:
+                numbers = list(range(-50, 50)) + [3 ** 5000]
+                encoded = await asyncio.gather(
+                    *[client.encode(number, 36) for number in numbers]
+                )
+                self.assertEqual([positional.encode(n, 36) for n in numbers], encoded)
+
+                decoded = await asyncio.gather(
+                    *[client.decode(digits, 36) for digits in encoded]
+                )
+                self.assertEqual(numbers, decoded)
+
+                romans = await asyncio.gather(
+                    *[client.roman_encode(number) for number in range(1, 200)]
+                )
+                self.assertEqual("CXCIX", romans[-1])
+                self.assertEqual(
+                    list(range(1, 200)),
+                    await asyncio.gather(*[client.roman_decode(r) for r in romans]),
+                )
+                self.assertEqual("ff", await client.encode(255, 16, "0123456789abcdef"))
+            finally:
+                await client.close()
+                await server.close()
+
+        self._run(scenario())
+
+    def test_errors(self):
+        """
+        Check that conversion errors are raised by client
+        """
+
+        async def scenario():
+            server = serve.ConversionServer()
+            client = await self._start(server)
+            try:
+                with self.assertRaises(exceptions.IncorrectNumberRepresentationError):
+                    await client.decode("1Z", 16)
+                with self.assertRaises(exceptions.NumberOutOfRangeError):
+                    await client.roman_encode(4000)
+                with self.assertRaises(exceptions.WrongArgumentValueError):
+                    await client.encode(1, 100)
+                with self.assertRaises(exceptions.WrongArgumentValueError):
+                    await client.decode("1 2", 10)
+                self.assertEqual(12, await client.roman_decode("XII"))
+            finally:
+                await client.close()
+                await server.close()
+
+        self._run(scenario())
+
+    def test_raw_protocol(self):
+        """
+        Check responses to malformed and too long request lines
+        """
+
+        async def scenario():
+            server = serve.ConversionServer(max_line=64)
+            sockets = await server.start(port=0)
+            reader, writer = await asyncio.open_connection(
+                *sockets[0].getsockname()[:2]
+            )
+            try:
+                writer.write(b"encode 2 5\nunknown 1\n\nencode x 1\nroman_decode IV\n")
+                writer.write(b"decode 10 " + b"1" * 100 + b"\n")
+                responses = [await reader.readline() for _ in range(6)]
+                self.assertEqual(b"ok 101\n", responses[0])
+                self.assertTrue(
+                    responses[1].startswith(b"error WrongArgumentValueError")
+                )
+                self.assertTrue(
+                    responses[2].startswith(b"error WrongArgumentValueError")
+                )
+                self.assertTrue(
+                    responses[3].startswith(b"error WrongArgumentValueError")
+                )
+                self.assertEqual(b"ok 4\n", responses[4])
+                self.assertTrue(
+                    responses[5].startswith(b"error WrongArgumentValueError")
+                )
+                self.assertEqual(b"", await reader.readline())
+            finally:
+                writer.close()
+                await server.close()
+
+        self._run(scenario())
+
+    def test_non_ascii_base(self):
+        """
+        Check that base of digits which int() rejects is answered with error
+        """
+
+        async def scenario():
+            server = serve.ConversionServer()
+            sockets = await server.start(port=0)
+            reader, writer = await asyncio.open_connection(
+                *sockets[0].getsockname()[:2]
+            )
+            try:
+                writer.write("encode \u00b2 5\nencode 16 255\n".encode("utf-8"))
+                self.assertTrue(
+                    (await reader.readline()).startswith(
+                        b"error WrongArgumentValueError"
+                    )
+                )
+                self.assertEqual(b"ok FF\n", await reader.readline())
+            finally:
+                writer.close()
+                await server.close()
+
+        self._run(scenario())
+
+    def test_failed_receiving(self):
+        """
+        Check that connection is closed instead of hanging when request can't be
+        received
+        """
+
+        async def scenario():
+            server = serve.ConversionServer()
+            sockets = await server.start(port=0)
+            reader, writer = await asyncio.open_connection(
+                *sockets[0].getsockname()[:2]
+            )
+            try:
+                with mock.patch.object(
+                    serve, "_parse_request", side_effect=RuntimeError
+                ):
+                    writer.write(b"encode 16 255\n")
+                    self.assertEqual(b"", await reader.readline())
+            finally:
+                writer.close()
+                await server.close()
+
+        self.loop.set_exception_handler(lambda loop, context: None)
+        self._run(scenario())
+
+    def test_failed_executor(self):
+        """
+        Check that batch which executor fails to convert is answered with error and
+        broken process pool is replaced
+        """
+
+        class BrokenExecutor(ThreadPoolExecutor):
+            """
+            Executor which lost its workers
+            """
+
+            def submit(self, *args, **kwargs):
+                raise BrokenProcessPool("Worker died")
+
+        async def scenario():
+            server = serve.ConversionServer(workers=1)
+            client = await self._start(server)
+            try:
+                with self.assertRaises(exceptions.NumericSystemException):
+                    await client.encode(255, 16)
+                self.assertEqual("FF", await client.encode(255, 16))
+            finally:
+                await client.close()
+                await server.close()
+
+        executors = [BrokenExecutor(1), ThreadPoolExecutor(1)]
+        with mock.patch.object(
+            serve, "ProcessPoolExecutor", side_effect=lambda workers: executors.pop(0)
+        ):
+            self._run(scenario())
+        self.assertEqual([], executors)
+
+    def test_backpressure(self):
+        """
+        Check that requests are answered when pending limit is reached
+        """
+
+        async def scenario():
+            server = serve.ConversionServer(batch_size=4, max_pending=2)
+            client = await self._start(server)
+            try:
+                results = await asyncio.gather(
+                    *[client.encode(number, 2) for number in range(500)]
+                )
+                self.assertEqual([bin(number)[2:] for number in range(500)], results)
+            finally:
+                await client.close()
+                await server.close()
+
+        self._run(scenario())
+
+    @skipIf(not hasattr(socket, "AF_UNIX"), "Unix sockets are not supported")
+    def test_unix_socket(self):
+        """
+        Check serving on Unix socket
+        """
+
+        async def scenario():
+            path = os.path.join(directory, "serve.sock")
+            server = serve.ConversionServer()
+            client = await self._start(server, path)
+            try:
+                self.assertEqual("VII", await client.roman_encode(7))
+            finally:
+                await client.close()
+                await server.close()
+
+        directory = tempfile.mkdtemp()
+        try:
+            self._run(scenario())
+        finally:
+            for name in os.listdir(directory):
+                os.remove(os.path.join(directory, name))
+            os.rmdir(directory)
+
+    def test_wrong_arguments(self):
+        """
+        Check that server options are validated
+        """
+        with self.assertRaises(exceptions.WrongArgumentValueError):
+            serve.ConversionServer(batch_size=0)